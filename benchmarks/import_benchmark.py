@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+from statistics import median
+
+"""
+Benchmark of how long it takes to import each of the game's modules. Every import is timed in a fresh interpreter, so
+that nothing is already cached from importing another module. Also reports whether each import pulls in pygame, or
+initializes the display, neither of which importing game logic should ever do.
+
+Usage: python benchmarks/import_benchmark.py [repeats]
+"""
+
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = [
+    'config',
+    'utility_functions',
+    'game_elements.board',
+    'game_elements.player',
+    'game_elements.classes.warrior',
+    'game_elements.enemy_turn',
+    'simulation',
+    'rendering.window_renderer',
+    'rendering.board_renderer',
+    'rendering.player_panel_renderer',
+    'game',
+]
+# Run in a fresh interpreter for each import, printing the import time in ms, whether pygame has been imported, and
+# whether the display has been initialized.
+TIMING_SCRIPT = '''
+import sys
+from time import perf_counter
+start = perf_counter()
+import {module}
+elapsed = perf_counter() - start
+pygame = sys.modules.get('pygame')
+print(1000 * elapsed, pygame is not None, pygame is not None and pygame.display.get_init())
+'''
+
+
+def time_import(module):
+    """Imports module in a fresh interpreter, and returns the time taken in ms, along with what it initialized."""
+    result = subprocess.run([sys.executable, '-c', TIMING_SCRIPT.format(module=module)], cwd=REPOSITORY_ROOT,
+                            env=dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1'), capture_output=True, text=True,
+                            check=True)
+    elapsed, imports_pygame, inits_display = result.stdout.split()
+    return float(elapsed), imports_pygame == 'True', inits_display == 'True'
+
+
+def main(repeats=5):
+    print(f'{"module":<36}{"median":>10}{"min":>10}{"pygame":>9}{"display":>9}')
+    for module in MODULES:
+        timings = [time_import(module) for _ in range(repeats)]
+        elapsed = [timing[0] for timing in timings]
+        _, imports_pygame, inits_display = timings[-1]
+        print(f'{module:<36}{median(elapsed):>7.1f} ms{min(elapsed):>7.1f} ms'
+              f'{"yes" if imports_pygame else "no":>9}{"yes" if inits_display else "no":>9}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
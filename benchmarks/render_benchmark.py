@@ -0,0 +1,63 @@
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import timeline
+from console import Console
+from game import Game
+from game_elements.player import Player
+from rendering import board_renderer, frame_compositor, window_renderer
+
+"""
+Benchmark of rendering throughput, run in headless mode so that everything is drawn into an offscreen surface. Times
+full repaints of the board, the incremental repaints done after each turn, full refreshes of the player panel, and
+presenting the frame, and prints the mean time and rate of each.
+
+Usage: python benchmarks/render_benchmark.py [iterations]
+"""
+
+
+def benchmark(name, function, iterations):
+    """Calls function iterations times, and prints how long each call took on average."""
+    start = perf_counter()
+    for _ in range(iterations):
+        function()
+    elapsed = perf_counter() - start
+    print(f'{name:<28}{1000 * elapsed / iterations:>10.3f} ms{iterations / elapsed:>12.0f} /s')
+
+
+def full_board_render(game):
+    board_renderer.invalidate_rendered_board()
+    board_renderer.render_game_board(game.board)
+    frame_compositor.present()
+
+
+def play_turn(game, directions=('up', 'left', 'down', 'right')):
+    """Plays a turn of moving back and forth, and renders the board as it would be after it."""
+    game.simulation.step(('move', directions[game.simulation.turn % len(directions)]))
+    board_renderer.render_game_board(game.board)
+    frame_compositor.present()
+
+
+def refresh_player_panel(game):
+    game.player_panel.refresh_player_panel()
+    frame_compositor.present()
+
+
+def main(iterations=500):
+    # The benchmark always runs headless, so that it can be run on machines with no display.
+    window_renderer.init_display(headless=True)
+    timeline.fast_mode = True
+    game = Game(console=Console(), player=Player())
+    game.draw_window()
+    frame_compositor.present()
+    print(f'{"":<28}{"mean":>13}{"rate":>14}')
+    benchmark('full board render', lambda: full_board_render(game), iterations)
+    benchmark('turn + incremental render', lambda: play_turn(game), iterations)
+    benchmark('player panel refresh', lambda: refresh_player_panel(game), iterations)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
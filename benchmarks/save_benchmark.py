@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import save_game
+from game_elements.board import BoardStub
+from game_elements.element_config_values import MAX_RESIDENT_BOARDS
+from simulation import Simulation
+
+"""
+Benchmark of saving and loading a game. Builds a world of the given number of boards by going through the doors of each
+board in turn, then times encoding and decoding the game, and saving it to and loading it from a file, and prints the
+mean time of each along with the size of the save. This is done once with the default budget of boards kept in memory,
+and once with every board kept in memory, which is the slowest case since each board has to be serialized in full.
+
+Usage: python benchmarks/save_benchmark.py [boards] [iterations]
+"""
+
+
+def build_world(board_count, max_resident, seed=0):
+    """Returns a Simulation which has been through enough doors to have visited board_count boards."""
+    simulation = Simulation(seed=seed)
+    simulation.world.max_resident = max_resident
+    rng = random.Random(seed)
+    while simulation.world.next_id < board_count:
+        # Doors to boards that haven't been visited yet are preferred, so that the world keeps growing.
+        doors = list(simulation.board.doors)
+        new_doors = [door for door in doors if isinstance(simulation.board.doors[door]['board'], BoardStub)]
+        simulation.handle_board_transition(rng.choice(new_doors or doors))
+        simulation.turn += 1
+    return simulation
+
+
+def benchmark(name, function, iterations):
+    """Calls function iterations times, and prints how long each call took on average."""
+    start = perf_counter()
+    for _ in range(iterations):
+        function()
+    elapsed = perf_counter() - start
+    print(f'{name:<28}{1000 * elapsed / iterations:>10.3f} ms')
+
+
+def main():
+    board_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    path = os.path.join(tempfile.mkdtemp(), 'benchmark.save')
+    for max_resident in (MAX_RESIDENT_BOARDS, board_count):
+        simulation = build_world(board_count, max_resident)
+        data = save_game.encode(simulation)
+        report = simulation.world.report()
+        print(f"{board_count} boards, {report['resident']} in memory: save is {len(data) / 1024:.1f} KiB")
+        benchmark('encode', lambda: save_game.encode(simulation), iterations)
+        benchmark('decode', lambda: save_game.decode(data), iterations)
+        benchmark('save to file', lambda: save_game.save(simulation, path), iterations)
+        benchmark('load from file', lambda: save_game.load(path), iterations)
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,16 @@
+import os
+
 import colors
 """
 Config file to store most variables which have to do with main system stuff.
 """
 
+####### DISPLAY MODE #######
+# If True, the game runs without opening a window, using SDL's dummy video driver and drawing everything into an
+# offscreen surface instead. Set with the HEADLESS environment variable, or the --headless flag in main.py, e.g. to run
+# on a server or benchmark the renderers on a machine with no display.
+HEADLESS = os.environ.get('HEADLESS', '0') not in ('', '0')
+
 ####### DIMENSION VARIABLES #######
 WINDOW_LENGTH = 1500
 WINDOW_HEIGHT = 750
@@ -31,5 +39,29 @@ TILE_COLORS = {  # Mapping of letters to tile type is as follows:
 
 
 ###### FONT FILES ######
-font_SIL = '.\\fonts\\ShadowsIntoLight.ttf'
+# Fonts are found relative to this file rather than the working directory, so the game can be run from anywhere.
+FONT_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
+font_SIL = os.path.join(FONT_DIRECTORY, 'ShadowsIntoLight.ttf')
+
+
+###### MAIN LOOP ######
+TARGET_FPS = 60  # Frame rate cap while anything is animating
+IDLE_WAIT_TIMEOUT = 1000  # Longest time in ms the game loops will sleep waiting for input when nothing is animating
+
+###### ANIMATIONS ######
+FAST_ANIMATIONS = False  # If True, every animation on the timeline is skipped and completes instantly
+
+###### TEXT CACHE ######
+TEXT_CACHE_SIZE = 512  # The most rendered text surfaces kept in rendering.text_cache at once
+
+###### INPUT LOG ######
+RECORD_INPUTS = False  # If True, every action taken in the game is recorded by input_log.py, to be played by replay.py
+INPUT_LOG_OUTPUT = 'last_game.replay'  # The input log is written to this path on exit
+
+###### SAVE FILES ######
+SAVE_FILE_EXTENSION = '.save'  # Appended to a game's filename to get the path it's saved to, see save_game.py
 
+###### PROFILING ######
+PROFILING = False  # If True, the time spent in each phase of the game is recorded by profiler.py
+PROFILER_BUFFER_SIZE = 4096  # The most recent timings the profiler keeps, older ones are overwritten
+PROFILER_OUTPUT = 'profile_logs'  # Timings are written to this path + .csv, and a summary to this path + .json, on exit
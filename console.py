@@ -1,6 +1,11 @@
-from time import sleep
+from functools import partial
+
+import timeline
 from rendering import console_renderer
 
+# The time between each line appearing, when several lines are added to the console at once.
+LINE_DELAY = 0.25
+
 
 class Console:
     def __init__(self):
@@ -18,8 +23,8 @@ class Console:
 
     def update(self, lines):
         """
-        Accepts new lines, casting it to a single-item list if lines is just a string. Then adds new lines to console
-        and refreshes it
+        Accepts new lines, casting it to a single-item list if lines is just a string. Then schedules each new line to
+        be added to the console on the timeline, so that when there are several they appear one after another.
         """
         if type(lines) == str:
             new_lines = [lines]
@@ -27,11 +32,22 @@ class Console:
             new_lines = lines
 
         if new_lines:
+            line_delay = LINE_DELAY if len(new_lines) > 1 else 0
             for new_line in new_lines:
                 if new_line == '':
                     continue
-                self.lines.pop(0)
-                self.lines.append(new_line)
-                self.refresh_console()
-                if len(new_lines) > 1:
-                    sleep(0.25)
+                timeline.schedule(partial(self.add_lines, [new_line]), duration=line_delay, channel='console')
+
+    def flush(self, lines):
+        """
+        Adds every one of lines to the console and then refreshes it a single time, without the line-by-line delay of
+        update(). Used for text which has been collected up over several actions, such as a whole enemy turn.
+        """
+        new_lines = [line for line in lines if line != '']
+        if new_lines:
+            timeline.schedule(partial(self.add_lines, new_lines), channel='console')
+
+    def add_lines(self, new_lines):
+        """Adds new_lines to the bottom of the console, pushing the oldest lines off the top, and refreshes it."""
+        self.lines = (self.lines + new_lines)[-len(self.lines):]
+        self.refresh_console()
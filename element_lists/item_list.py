@@ -83,12 +83,13 @@ old_leather_gloves = Equipment(name='Old Leather Gloves',
 #### LISTS OF EQUIPPABLES ####
 tier_1_e = [rusty_sword, old_leather_cap, short_sword, old_leather_boots, old_leather_gloves, old_leather_tunic]
 
-def generate_random_item(tier, type='both'):
+def generate_random_item(tier, type='both', rng=random):
     """
     Function which returns a copy of a random item based on the tier and type.
 
     :param tier: An int, signifying the tier of item to pull from.
     :param type: A string, which can be either 'consumable', 'equipment', or 'both'.
+    :param rng: The random number generator the item is picked with, i.e. a game's loot stream.
     """
     if type not in {'consumable', 'equipment', 'both'}:
         raise Exception(f'Tried to generate a random item with invalid type, {type}.')
@@ -97,5 +98,5 @@ def generate_random_item(tier, type='both'):
         '1_equipment': tier_1_e,
         '1_both': tier_1_c + tier_1_e
     }
-    new_item = copy.deepcopy(random.choice(tier_mapping['1_both']))
+    new_item = copy.deepcopy(rng.choice(tier_mapping['1_both']))
     return new_item
\ No newline at end of file
@@ -31,8 +31,8 @@ class ActiveAbility(Ability):
                  cooldown=0, level_up_dict=None):
         """
         Active abilities are abilities the player must actively use.
-        :param targeting_function: A function called in the targeting phase, which will highlight on the board all the
-                                   square that this ability can target, if the ability is active.
+        :param targeting_function: A function from game_elements.targeting called in the targeting phase, which finds
+                                   all the squares on the board that this ability can target, if the ability is active.
         :param targeting_function_params: A dict of parameters for the targeting function, if necessary. None otherwise
         :param function: A function that will apply the ability effect.
         :param multi_target_function: If ability can target multiple tiles, then this will be a function that gathers
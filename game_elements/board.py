@@ -1,18 +1,25 @@
 import random
 import copy
+import re
 
 from game_elements import enemy
 from game_elements import trap
 from game_elements import chest
-from game_elements.element_config_values import BOARD_LENGTH, BOARD_HEIGHT
-from rendering import board_renderer
-from utility_functions import find_exit_direction, find_appropriate_entrance, rotate_board
+from game_elements.random_streams import RandomStreams
+from game_elements.template_catalog import get_catalog, OPPOSITE_DIRECTIONS
+from game_elements.element_config_values import BOARD_LENGTH, BOARD_HEIGHT, DEBUG_BOARD_CONSISTENCY
+from game_elements.occupancy import OccupancyIndex, PLAYER, ENEMY, TREASURE, DOOR, TRAP, PLAYER_FLAG, ENEMY_FLAG, \
+    CHEST_FLAG, TRAP_FLAG
+from utility_functions import find_exit_direction, find_path, find_distances, UNREACHABLE
 
+# Matches every tile in a grid which has the player or an object on it.
+OBJECT_TILES = re.compile(b'[PETR]')
 
-def choose_random_board():
-    """Function which just returns a random board template of a given tier."""
+
+def choose_random_board(rng=random):
+    """Function which just returns a random board template of a given tier, chosen with rng."""
     from element_lists.board_templates import get_board_list
-    return random.choice(copy.copy(get_board_list()))
+    return rng.choice(copy.copy(get_board_list()))
 
 
 class Board:
@@ -29,112 +36,283 @@ class Board:
                       'XXXXOOOOOOOOXXXX',
                       'XXXXOOOOPOOOXXXX',
                       'XXXXXXXXDXXXXXXX']
-    according to the tile_mapping below.
+    where each letter is the type of tile at that position, as listed in the tile_mapping below.
     """
-    def __init__(self, board_template=None, doors_dict=None, level=1, dist_from_initial_board=0):
+    def __init__(self, board_template=None, doors_dict=None, level=1, dist_from_initial_board=0, rng=None,
+                 template_id=None, rotation=0, seed=None):
         """
         The Board object will be responsible for holding all of the data which is specific to each board and
         nothing else.
 
         :param board_template: The template the board is loaded from.
         :param level: The level of the board, which is used to determine the levels of enemies and items generated.
+        :param rng: The RandomStreams of the game this board belongs to, which everything on the board that's left to
+                    chance is decided with. Defaults to a new, randomly seeded RandomStreams.
+        :param template_id: The id of the board's template in the TemplateCatalog, which the template is loaded from if
+                            board_template isn't given. None if the board was loaded from a template outside of it.
+        :param rotation: The number of clockwise quarter turns the catalog template is rotated by.
+        :param seed: The seed the enemies, chests and traps on the board are generated with, so that a board generated
+                     from a BoardStub always comes out the same. If None, they're generated with rng instead.
 
         In this init function, the following attributes are also set based on the board template:
+        :grid: A bytearray of length BOARD_LENGTH * BOARD_HEIGHT holding the tile type of every tile on the board, where
+               the tile at (x, y) is stored at index y * BOARD_LENGTH + x. This is the single source of truth for the
+               board layout, and the template and tile_mapping attributes are derived from it when they are asked for.
+        :occupancy: An OccupancyIndex of everything on each tile, which answers whether a tile is walkable, who is
+                    standing on it and what is lying under them. The grid always holds the top tile of each stack.
+        :version: An int which is incremented every time anything on the board changes, so that anything cached from
+                  the state of the board (e.g. renders) can tell when it has gone stale.
         :player_coordinates: The (x, y) position of the player on the board
         :applied_passives: A dict of all the board modifiers from player passives that have already been applied to this
                            board. We save this to avoid the same passive being applied multiple times to a single board.
         :enemies: A dict containing all of the enemies on the board, in the format (x, y): Enemy()
         :chests: A dict containing all of the chests on the board, in the format (x, y): Chest()
-        :tile_mapping: A dict that contains entries for each tile type, the value of which is a list of all the
-                       coordinates of tiles of that type.
+        :traps: A dict containing all of the traps on the board, in the format (x, y): Trap()
+        :board_id: The id the board is stored under in the game's WorldStore, or None if it hasn't been added to one.
         """
-        self.template = board_template if board_template is not None else choose_random_board()
+        self.rng = rng if rng is not None else RandomStreams()
+        self.template_id = template_id
+        self.rotation = rotation
+        self.seed = seed
+        generation_rng = RandomStreams(seed) if seed is not None else self.rng
+        if board_template is None and template_id is not None:
+            board_template = get_catalog().template(template_id, rotation)
+        board_template = board_template if board_template is not None else choose_random_board(self.rng.worldgen)
+        self.grid = bytearray(''.join(''.join(row) for row in board_template), 'ascii')
+        self.version = 0
         self.level = level
         self.dist_from_initial_board = dist_from_initial_board
-        self.player_coordinates = None
+        self._player_coordinates = None
         self.applied_passives = dict()
         self.enemies = dict()
         self.chests = dict()
         self.traps = dict()
         self.doors = doors_dict if doors_dict is not None else dict()
-        self.tile_mapping = {
-            # Each letter corresponds to:
-            'X': list(),  # Wall tiles
-            'D': list(),  # Doors
-            'T': list(),  # Treasure
-            'O': list(),  # Open tiles
-            'R': list(),  # Traps
-            'E': list()   # Enemies
-        }
-        for y in range(len(self.template)):
-            for x in range(len(self.template[y])):
-                if self.template[y][x] == 'P':
-                    self.player_coordinates = (x, y)
-                elif self.template[y][x] in self.tile_mapping.keys():
-                    self.tile_mapping[self.template[y][x]].append((x, y))
-        self.enemies = dict()
-        for coord in self.tile_mapping['E']:
-            self.enemies[coord] = enemy.generate_new_enemy(x=coord[0], y=coord[1], level=self.level)
-        for coord in self.tile_mapping['T']:
-            self.chests[coord] = chest.generate_chest(level=self.level)
-        for coord in self.tile_mapping['R']:
-            self.traps[coord] = trap.generate_random_trap(coord)
+        self.board_id = None
+        # Cached views of the grid, built on demand. The template view is patched in place as tiles change, while the
+        # tile_mapping view is rebuilt whenever the board version has moved on since it was built.
+        self._template = None
+        self._tile_mapping = None
+        self._tile_mapping_version = -1
+        self.occupancy = OccupancyIndex(self.grid)
+        # The distance of every tile from the player, shared by every enemy chasing them, along with the player position
+        # and terrain version it was computed for.
+        self._player_distances = None
+        self._player_distances_key = None
+        # Only the tiles with something on them are visited, found by a regex so that the bare floor costs nothing.
+        for match in OBJECT_TILES.finditer(self.grid):
+            i, tile = match.start(), self.grid[match.start()]
+            coord = (i % BOARD_LENGTH, i // BOARD_LENGTH)
+            if tile == PLAYER:
+                self._player_coordinates = coord
+                self.occupancy.add(i, PLAYER_FLAG)
+            elif tile == ENEMY:
+                self.enemies[coord] = enemy.generate_new_enemy(x=coord[0], y=coord[1], level=self.level,
+                                                               rng=generation_rng.worldgen,
+                                                               board_seed=generation_rng.seed)
+                self.occupancy.add(i, ENEMY_FLAG, self.enemies[coord])
+            elif tile == TREASURE:
+                self.chests[coord] = chest.generate_chest(level=self.level, rng=generation_rng.loot)
+                self.occupancy.add(i, CHEST_FLAG, self.chests[coord])
+            elif tile == TRAP:
+                self.traps[coord] = trap.generate_random_trap(coord, rng=generation_rng.worldgen)
+                self.occupancy.add(i, TRAP_FLAG, self.traps[coord])
+
+    @property
+    def template(self):
+        """
+        A list of lists view of the grid, so that template[y][x] is the letter of the tile at (x, y). Kept for the
+        callers (rendering, focus window, exit directions) that still read the board this way.
+        """
+        if self._template is None:
+            tiles = self.grid.decode('ascii')
+            self._template = [list(tiles[y * BOARD_LENGTH:(y + 1) * BOARD_LENGTH]) for y in range(BOARD_HEIGHT)]
+        return self._template
+
+    @property
+    def tile_mapping(self):
+        """
+        A dict that contains entries for each tile type, the value of which is a list of all the coordinates of tiles of
+        that type. Traps are always listed under 'R', even when a character is standing on them.
+        """
+        if self._tile_mapping_version != self.version:
+            tile_mapping = {
+                # Each letter corresponds to:
+                'X': list(),  # Wall tiles
+                'D': list(),  # Doors
+                'T': list(),  # Treasure
+                'O': list(),  # Open tiles
+                'R': list(self.traps.keys()),  # Traps
+                'E': list()   # Enemies
+            }
+            for i, tile in enumerate(self.grid):
+                tile = chr(tile)
+                if tile in tile_mapping and tile != 'R':
+                    tile_mapping[tile].append((i % BOARD_LENGTH, i // BOARD_LENGTH))
+            self._tile_mapping = tile_mapping
+            self._tile_mapping_version = self.version
+        return self._tile_mapping
+
+    @property
+    def player_coordinates(self):
+        return self._player_coordinates
+
+    @player_coordinates.setter
+    def player_coordinates(self, new_pos):
+        """Moves the player on the board, uncovering whatever was under the player at their old position."""
+        if self._player_coordinates is not None:
+            self.occupancy.remove(self.tile_index(*self._player_coordinates), PLAYER_FLAG)
+            self.refresh_tile(self._player_coordinates)
+        self._player_coordinates = new_pos
+        if new_pos is not None:
+            self.occupancy.add(self.tile_index(*new_pos), PLAYER_FLAG)
+            self.refresh_tile(new_pos)
+
+    @staticmethod
+    def tile_index(x, y):
+        """Returns the index of the tile at (x, y) in the grid and the occupancy index."""
+        return y * BOARD_LENGTH + x
+
+    def tile_at(self, x, y):
+        """Returns the letter of the tile at (x, y), or 'X' if the coordinates are off the board."""
+        if 0 <= x < BOARD_LENGTH and 0 <= y < BOARD_HEIGHT:
+            return chr(self.grid[y * BOARD_LENGTH + x])
+        return 'X'
+
+    def set_tile(self, pos, tile):
+        """
+        Writes a single tile to the grid, patches the same cell in the template view if it has already been built, and
+        bumps the board version. This is the delta-update path that every change to the board goes through, so the
+        cost of a move is a couple of writes rather than a rebuild of the whole board.
+        """
+        self.grid[pos[1] * BOARD_LENGTH + pos[0]] = tile
+        if self._template is not None:
+            self._template[pos[1]][pos[0]] = chr(tile)
+        self.version += 1
+
+    def refresh_tile(self, pos):
+        """Writes whatever is now on top of the occupancy stack at pos to the grid."""
+        self.set_tile(pos, self.occupancy.top_tile(self.tile_index(*pos)))
 
     def rebuild_template(self):
         """
-        This method rebuilds the board template based off of the tile_mapping dict. It will be called every time the
-        position of an object on the board changes, so that the board can be re-rendered based off of the new template.
+        Rebuilds the whole template from scratch, based off of the walls and doors in the grid and the positions of every
+        object in the enemies, chests and traps dicts, and checks it against the incrementally updated grid. Moves no
+        longer need to call this, so it is only run as a debug consistency check when DEBUG_BOARD_CONSISTENCY is set,
+        but it can also be called by hand when something looks off.
         """
-        new_template = [['O' for _ in range(BOARD_LENGTH)] for _ in range(BOARD_HEIGHT)]
-        for tile_type in self.tile_mapping.keys():
-            for coord in self.tile_mapping[tile_type]:
+        new_template = [['O' if tile in 'PERT' else tile for tile in row] for row in self.template]
+        for tile_type, objects in (('R', self.traps), ('T', self.chests), ('E', self.enemies)):
+            for coord in objects:
                 new_template[coord[1]][coord[0]] = tile_type
-
-        new_template[self.player_coordinates[1]][self.player_coordinates[0]] = 'P'
-        self.template = new_template
+        if self.player_coordinates is not None:
+            new_template[self.player_coordinates[1]][self.player_coordinates[0]] = 'P'
+        if new_template != self.template:
+            mismatches = [(x, y) for y in range(BOARD_HEIGHT) for x in range(BOARD_LENGTH)
+                          if new_template[y][x] != self.template[y][x]]
+            raise Exception(f'Board grid is out of sync with its objects at {mismatches}.')
+        self._template = new_template
+        return new_template
 
     def tile_is_open(self, x, y):
-        """Method that simply returns a boolean signifying if the passed in coordinate is of an open tile."""
-        if (x, y) in set(self.traps.keys()) and (x, y) in set(self.enemies.keys()):
-            # Handles the rare case when an enemy steps on a trap but avoided triggering it. This is the only time, so
-            # far at least, when a tile can contain two objects (in this case a trap and an Enemy)
-            return False
-        if (x, y) in set(self.tile_mapping['O'] + self.tile_mapping['R']):
-            return True
+        """
+        Method that simply returns a boolean signifying if the passed in coordinate is of an open tile. Traps that
+        haven't been triggered are also walkable, unless a character is already standing on them.
+        """
+        if 0 <= x < BOARD_LENGTH and 0 <= y < BOARD_HEIGHT:
+            return self.occupancy.walkable[y * BOARD_LENGTH + x] == 1
         return False
 
+    def occupant_at(self, x, y):
+        """Returns the Enemy standing at (x, y), or None if there isn't one."""
+        return self.occupancy.occupant(y * BOARD_LENGTH + x)
+
+    def object_under(self, x, y):
+        """Returns the Trap or Chest lying at (x, y), or None if there isn't one, even under a character."""
+        return self.occupancy.under(y * BOARD_LENGTH + x)
+
+    def player_distances(self):
+        """
+        Returns the number of steps from every tile to the player, as computed by find_distances(). Other enemies are
+        ignored, since they will have moved by the time anyone gets there, so this is only recomputed when the player
+        moves or the terrain changes rather than after every enemy step.
+        """
+        key = (self._player_coordinates, self.occupancy.terrain_version)
+        if key != self._player_distances_key:
+            self._player_distances = find_distances(self._player_coordinates, self.occupancy.passable)
+            self._player_distances_key = key
+        return self._player_distances
+
+    def steps_towards_player(self, x, y, max_nodes=None):
+        """
+        Finds every step a character at (x, y) chasing the player could take, best first. These are the neighbours
+        which are closer to the player, including ones where another enemy is standing right now, since that enemy may
+        well be moving out of the way on the same turn. If none of them are open right now, the step around the other
+        characters found by next_step_on_path() is added at the end.
+        :return: A list of (x,y) coordinates, which will be empty if there is no way to get any closer to the player.
+        """
+        distances = self.player_distances()
+        distance = distances[y * BOARD_LENGTH + x]
+        if distance == UNREACHABLE:
+            return []
+        steps = list()
+        for neighbour_x, neighbour_y in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if not (0 <= neighbour_x < BOARD_LENGTH and 0 <= neighbour_y < BOARD_HEIGHT):
+                continue
+            index = neighbour_y * BOARD_LENGTH + neighbour_x
+            if distances[index] < distance and (self.occupancy.walkable[index] or self.occupancy.occupant(index)):
+                steps.append((neighbour_x, neighbour_y))
+        if not any(self.tile_is_open(*step) for step in steps):
+            step_around = self.next_step_on_path(start=(x, y), goal=self._player_coordinates, max_nodes=max_nodes)
+            if step_around[0] is not None and step_around not in steps:
+                steps.append(step_around)
+        return steps
+
+    def next_step_on_path(self, start, goal, max_nodes=None):
+        """
+        Returns the next step along the shortest path from start to goal around everything currently on the board.
+        :return: (x,y) coordinates of the best next step, or None, None if no path was found.
+        """
+        path = find_path(start, goal, self.occupancy.walkable, max_nodes)
+        if not path:
+            return None, None
+        return path[0]
+
+    def add_object(self, coord, obj):
+        """Places an Enemy, Chest or Trap on the board at coord, e.g. when a board is loaded from serialized data."""
+        if isinstance(obj, enemy.Enemy):
+            self.enemies[coord] = obj
+            self.occupancy.add(self.tile_index(*coord), ENEMY_FLAG, obj)
+        elif isinstance(obj, chest.Chest):
+            self.chests[coord] = obj
+            self.occupancy.add(self.tile_index(*coord), CHEST_FLAG, obj)
+        else:
+            self.traps[coord] = obj
+            self.occupancy.add(self.tile_index(*coord), TRAP_FLAG, obj)
+        self.refresh_tile(coord)
+
     def handle_enemy_death(self, enemy_pos):
-        """Method called when an enemy dies, removing it from the tile_mapping and rebuilding the template."""
+        """Method called when an enemy dies, removing it from the board."""
         del self.enemies[enemy_pos]
-        self.tile_mapping['E'].remove(enemy_pos)
-        self.tile_mapping['O'].append(enemy_pos)
-        board_renderer.animate_enemy_death(enemy_x=enemy_pos[0], enemy_y=enemy_pos[1])
-        self.rebuild_template()
+        self.occupancy.remove(self.tile_index(*enemy_pos), ENEMY_FLAG)
+        self.refresh_tile(enemy_pos)
+        if DEBUG_BOARD_CONSISTENCY:
+            self.rebuild_template()
 
     def update_enemy_position(self, old_pos, new_pos):
         """
-        Method called when an enemy has moved, updating it's entry in the enemies and tile_mapping dicts and
-        rebuilding the template
+        Method called when an enemy has moved, updating it's entry in the enemies dict and moving it on the grid.
         """
-        # We only update the tile mapping if the enemy moves to an open space, since if they're moving to a trap, we
-        # still want the tile to stay in the list of trap tiles.
-        if new_pos in set(self.tile_mapping['O']):
-            self.tile_mapping['O'].remove(new_pos)
-        self.tile_mapping['O'].append(old_pos)
         self.enemies[new_pos] = self.enemies.pop(old_pos)  # Updates the key-value pair of the actual Enemy object
         self.enemies[new_pos].x = new_pos[0]  # Updates the Enemy object's coordinate values
         self.enemies[new_pos].y = new_pos[1]
-        self.tile_mapping['E'].remove(old_pos)
-        self.tile_mapping['E'].append(new_pos)
+        # If the enemy was standing on a trap it avoided, the trap is uncovered again when it leaves.
+        self.occupancy.move(self.tile_index(*old_pos), self.tile_index(*new_pos), ENEMY_FLAG)
+        self.refresh_tile(old_pos)
+        self.refresh_tile(new_pos)
 
     def update_player_position(self, old_pos, new_pos):
-        """
-        Updates the position values in the Board class to reflect player movement, i.e. updating the player_coordinate
-        values and adding the old position to the set of open tiles.
-        """
-        if new_pos in set(self.tile_mapping['O']):  # Don't want to remove coordinates if the player steps on a trap
-            self.tile_mapping['O'].remove(new_pos)
-        self.tile_mapping['O'].append(old_pos)
+        """Updates the position values in the Board class to reflect player movement."""
         self.player_coordinates = new_pos
 
     def handle_chest_has_been_opened(self, chest_pos):
@@ -146,19 +324,22 @@ class Board:
     def handle_trap_triggered(self, trap_pos):
         """Removes trap from board if triggered."""
         del self.traps[trap_pos]
-        self.tile_mapping['R'].remove(trap_pos)
-        self.tile_mapping['O'].append(trap_pos)
+        self.occupancy.remove(self.tile_index(*trap_pos), TRAP_FLAG)
+        # The character which triggered the trap is still standing on the tile, so this won't change what is visible,
+        # but it still marks the board as changed.
+        self.refresh_tile(trap_pos)
 
     def move_character(self, character, new_x, new_y):
         console_text = list()
-        if self.template[new_y][new_x] == 'R':  # Moving to a tile with a trap
+        if (new_x, new_y) in self.traps:  # Moving to a tile with a trap
             console_text.append(self.handle_step_on_trap((new_x, new_y), character))
         if character.is_enemy():
             self.update_enemy_position(old_pos=(character.x, character.y), new_pos=(new_x, new_y))
         else:
             self.update_player_position(old_pos=(character.x, character.y), new_pos=(new_x, new_y))
         character.x, character.y = new_x, new_y
-        self.rebuild_template()
+        if DEBUG_BOARD_CONSISTENCY:
+            self.rebuild_template()
 
         return console_text
 
@@ -176,7 +357,7 @@ class Board:
         else:
             console_text = f'You step on a {trap.name} trap, '
         avoid_probability = 100 * (1 - trap.trigger_prob) + (trap.trigger_avoid_coeff * target.attributes["dex"])
-        if random.randint(0, 100) > avoid_probability:
+        if self.rng.combat.randint(0, 100) > avoid_probability:
             if trap.type == 'direct':
                 damage = trap.function(target)
                 target.hp[0] = max(0, target.hp[0] - damage)
@@ -211,46 +392,61 @@ class Board:
         Method run by the Game object when a new Board() object has been loaded. For each door on the Board, if it
         doesn't already have one, create an entry in the self.doors dict where the key is the door coordinates and the
         value looks like
-                'board': Board() object,
+                'board': BoardStub() or Board() object,
                 'entry_position': (x, y)
-        where 'board' is the Board object that will be loaded when this door is stepped on and 'entry_position' is the
-        tile immediately in front of the door (direction determined with the entry_position_mapping below) which is
-        where the Player will start on this new Board once it is loaded.
+        where 'board' is the board that will be loaded when this door is stepped on and 'entry_position' is the tile
+        immediately in front of the door (direction determined with the entry_position_mapping below) which is where
+        the Player will start on this new Board once it is loaded. Since most of these boards are never visited, each
+        starts out as a BoardStub, which is only generated into a full Board by board_behind_door() once the door is
+        actually stepped on.
         The level of these new board will be determined by a combination of the player level, their current exp, and
         the number of enemies on the current board.
         """
-        for door_coord in self.tile_mapping['D']:
+        door_coordinates = [(i % BOARD_LENGTH, i // BOARD_LENGTH) for i, tile in enumerate(self.grid) if tile == DOOR]
+        for door_coord in door_coordinates:
             # For every board that's not the starting board, they will be initialized with one entry in their door dict
             # that refers to the board that preceded them. We do this check so they don't get overwritten.
             if door_coord in self.doors.keys():
                 continue
-            # If this door does not have a corresponding board, generate it here.
-            board_dict = self.get_next_board_info(door_coord)
-            new_board_template, new_board_doors_dict, new_board_entry_pos = self.get_next_board_info(door_coord)
+            # If this door does not have a corresponding board, choose one here.
+            template_id, rotation, new_board_doors_dict, new_board_entry_pos = self.get_next_board_info(door_coord)
             new_board_level = player_level
             if len(self.enemies.keys()) >= player_exp[1] - player_exp[0]:
                 # If the player would level up after clearing this board, set the next board to player_level + 1
                 new_board_level += 1
-            self.doors[door_coord] = {'board': Board(board_template=new_board_template, doors_dict=new_board_doors_dict,
-                                                     level=new_board_level),
-                                      'entry_position': new_board_entry_pos}
+            stub = BoardStub(template_id=template_id, rotation=rotation, level=new_board_level,
+                             seed=self.rng.worldgen.getrandbits(32), doors_dict=new_board_doors_dict,
+                             dist_from_initial_board=self.dist_from_initial_board + 1)
+            self.doors[door_coord] = {'board': stub, 'entry_position': new_board_entry_pos}
+
+    def board_behind_door(self, door_coord, pregenerator=None):
+        """
+        Returns the Board a door leads to, generating it from its BoardStub first if it hasn't been yet.
+        :param pregenerator: The game's BoardPregenerator, if any. If it has already generated the board, that board is
+                             used rather than generating it again.
+        """
+        door = self.doors[door_coord]
+        if isinstance(door['board'], BoardStub):
+            stub = door['board']
+            board = pregenerator.take(stub) if pregenerator is not None else None
+            door['board'] = board if board is not None else stub.generate(rng=self.rng)
+        return door['board']
 
     def get_next_board_info(self, door_coord):
         """
-        Given a door, choose a random board for it to lead to and rotate it so that the entrances/exits line up. Once
-        this is determined, return the template, doors_dict, and entry_position the new board will be initialized with.
+        Given a door, choose a random board for it to lead to, rotated so that the entrances/exits line up, from the
+        TemplateCatalog. Once this is determined, return the template_id, rotation, doors_dict, and entry_position the
+        new board will be initialized with.
         """
-        # Dict which maps each direction to its opposite
-        direction_mapping = {'top': 'bottom', 'bottom': 'top', 'left': 'right', 'right': 'left'}
         # Dict which gives the value added to each door coordinate to get the appropriate starting position on the board
         entry_position_mapping = {'top': (0, 1), 'bottom': (0, -1), 'left': (1, 0), 'right': (-1, 0)}
-        exit_direction = find_exit_direction(self.template, door_coord[0], door_coord[1])
-        new_board = choose_random_board()
-        entry_door = find_appropriate_entrance(new_board, target_direction=direction_mapping[exit_direction])
-        # We keep rotating the randomly chosen template until it has an entrance that corresponds with this exit.
-        while entry_door is None:
-            new_board = rotate_board(new_board)
-            entry_door = find_appropriate_entrance(new_board, target_direction=direction_mapping[exit_direction])
+        catalog = get_catalog()
+        if self.template_id is not None:
+            exit_direction = catalog.doors[(self.template_id, self.rotation)][door_coord]
+        else:
+            exit_direction = find_exit_direction(self.template, door_coord[0], door_coord[1])
+        template_id, rotation, entry_door = catalog.choose_entrance(OPPOSITE_DIRECTIONS[exit_direction],
+                                                                    self.rng.worldgen)
         return_pos_delta = entry_position_mapping[exit_direction]
         new_board_doors_dict = {
             # Construct the doors_dict that will be used to initialize the new board.
@@ -259,9 +455,35 @@ class Board:
                 'entry_position': (door_coord[0] + return_pos_delta[0], door_coord[1] + return_pos_delta[1])
             }
         }
-        entry_pos_delta = entry_position_mapping[direction_mapping[exit_direction]]
+        entry_pos_delta = entry_position_mapping[OPPOSITE_DIRECTIONS[exit_direction]]
         entry_position = (entry_door[0] + entry_pos_delta[0], entry_door[1] + entry_pos_delta[1])
         # Return the values that will be used to initialize the new board.
-        return new_board, new_board_doors_dict, entry_position
+        return template_id, rotation, new_board_doors_dict, entry_position
+
 
+class BoardStub:
+    __slots__ = ('template_id', 'rotation', 'level', 'seed', 'doors_dict', 'dist_from_initial_board')
+
+    def __init__(self, template_id, rotation, level, seed, doors_dict, dist_from_initial_board=0):
+        """
+        Placeholder for a board behind a door which hasn't been visited yet, holding everything needed to generate it.
+        Generating a board from the same stub always gives the same board, so it doesn't matter when it's generated.
+        :param template_id: The id of the board's template in the TemplateCatalog.
+        :param rotation: The number of clockwise quarter turns the template is rotated by.
+        :param level: The level of the board.
+        :param seed: The seed the enemies, chests and traps on the board are generated with.
+        :param doors_dict: The doors_dict the board will be initialized with, holding the door back to the board this
+                           stub is behind.
+        :param dist_from_initial_board: The number of boards between this one and the starting board.
+        """
+        self.template_id = template_id
+        self.rotation = rotation
+        self.level = level
+        self.seed = seed
+        self.doors_dict = doors_dict
+        self.dist_from_initial_board = dist_from_initial_board
 
+    def generate(self, rng):
+        """Returns the full Board described by this stub, belonging to the game with the RandomStreams rng."""
+        return Board(doors_dict=self.doors_dict, level=self.level, dist_from_initial_board=self.dist_from_initial_board,
+                     rng=rng, template_id=self.template_id, rotation=self.rotation, seed=self.seed)
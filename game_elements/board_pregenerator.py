@@ -0,0 +1,84 @@
+import queue
+import threading
+
+from game_elements.board import BoardStub
+from game_elements.element_config_values import PREGENERATED_DOORS
+from utility_functions import manhattan_distance
+
+
+class BoardPregenerator:
+    def __init__(self, rng, max_doors=PREGENERATED_DOORS):
+        """
+        Background worker which generates the boards behind the doors nearest the player while they're still on the
+        current board, so that stepping through one of those doors doesn't have to wait for its board to be generated.
+        Since a BoardStub always generates the same board, a board generated here is exactly the board that would
+        have been generated when the door was stepped on, so it can be used or thrown away freely.
+
+        The worker is a thread rather than a process, since the boards it generates hold references to the boards
+        next to them. It does most of its work while the game is waiting on input, when the main thread is asleep.
+        :param rng: The RandomStreams of the game, which the generated boards belong to.
+        :param max_doors: The most doors to have boards generated for at once.
+
+        The following attributes are also set at initialization:
+        :wanted: A set of the stubs which should currently be generated. Stubs which stop being wanted before the
+                 worker gets to them are skipped.
+        :requests: A queue of the stubs waiting for the worker to generate them.
+        :finished: A queue of (stub, board) pairs which the worker has generated, waiting to be collected.
+        :prepared: A dict of stub: board of the boards which have been generated and collected.
+        :thread: The worker thread.
+        """
+        self.rng = rng
+        self.max_doors = max_doors
+        self.wanted = set()
+        self.requests = queue.Queue()
+        self.finished = queue.Queue()
+        self.prepared = dict()
+        self.thread = threading.Thread(target=self.run, name='board-pregenerator', daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """The worker's loop, generating every requested stub which is still wanted until a None is requested."""
+        while True:
+            stub = self.requests.get()
+            if stub is None:
+                return
+            if stub in self.wanted:
+                self.finished.put((stub, stub.generate(rng=self.rng)))
+
+    def request_nearest(self, board, position):
+        """
+        Has the boards behind the doors of board which are nearest to position generated, if they haven't been
+        already. Boards generated for any other doors are thrown away.
+        """
+        stubs = [(manhattan_distance(door_coord, position), door_coord, door['board'])
+                 for door_coord, door in board.doors.items() if isinstance(door['board'], BoardStub)]
+        nearest = {stub for _, _, stub in sorted(stubs, key=lambda entry: entry[:2])[:self.max_doors]}
+        self.collect()
+        for stub in list(self.prepared):
+            if stub not in nearest:
+                del self.prepared[stub]
+        for stub in nearest - self.wanted:
+            self.requests.put(stub)
+        self.wanted = nearest
+
+    def collect(self):
+        """Moves every board the worker has finished into self.prepared, if they're still wanted."""
+        while True:
+            try:
+                stub, board = self.finished.get_nowait()
+            except queue.Empty:
+                return
+            if stub in self.wanted:
+                self.prepared[stub] = board
+
+    def take(self, stub):
+        """Returns the board generated for stub, or None if it hasn't been generated yet."""
+        self.collect()
+        self.wanted.discard(stub)
+        return self.prepared.pop(stub, None)
+
+    def stop(self):
+        """Stops the worker once it has finished the board it's generating, if any."""
+        self.wanted = set()
+        self.requests.put(None)
+        self.thread.join()
@@ -1,23 +1,27 @@
+import random
+
 from element_lists.item_list import generate_random_item
 
 
 class Chest:
-    def __init__(self, level=1, type='both', item=None, opened=False):
+    def __init__(self, level=1, type='both', item=None, opened=False, rng=random):
         """
         Chest objects are used to store items on the board.
         :param level: The level used to determine the list the item will be randomly pulled from.
         :param type: The type of item this chest can contain, i.e. 'consumable', 'equipment', or 'both'
         :param item: The Item object contained inside the chest.
         :param opened: A flag to determine whether or not this chest has already been opened.
+        :param rng: The random number generator the item is picked with, if no item is given.
         """
-        self.item = item if item is not None else generate_random_item(level, type)
+        self.item = item if item is not None else generate_random_item(level, type, rng=rng)
         self.opened = opened
 
-def generate_chest(level, type='both'):
+def generate_chest(level, type='both', rng=random):
     """
     Returns a Chest object of the given tier.
     :param tier: Int representing the tier of item in the chest.
     :param type: The type of item to be in the chest.
+    :param rng: The random number generator the item is picked with.
     :return: A Chest object.
     """
-    return Chest(level=level, type=type)
\ No newline at end of file
+    return Chest(level=level, type=type, rng=rng)
\ No newline at end of file
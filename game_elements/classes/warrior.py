@@ -2,12 +2,12 @@ import random
 from copy import copy
 
 import utility_functions
-from rendering import board_renderer
+from game_elements import targeting
 from game_elements.ability import ActiveAbility, PassiveAbility
 
 
 #### ABILITY FUNCTIONS ####
-def heavy_strike_func(self, targets, skill_level):
+def heavy_strike_func(self, targets, skill_level, rng=random):
     """Ability function which deals heavy damage to target and knocks them back one tile."""
     target = targets[0]
     console_text = ''
@@ -16,7 +16,7 @@ def heavy_strike_func(self, targets, skill_level):
     # Now calculate the damage
     damage = (1 + skill_level) * (self.attributes['str'] - target.attributes['end'] + self.off_rating)
     crit_chance = max(self.attributes['dex'] + (self.attributes['wis'] - target.attributes['wis']), 0)
-    if crit_chance > random.randint(0, 100):
+    if crit_chance > rng.randint(0, 100):
         console_text += 'Critical hit! '
         damage = 2 * damage
     target.hp[0] = max(0, target.hp[0] - damage)
@@ -46,7 +46,7 @@ def trolls_blood_func(self, skill_level, **kwargs):
     }
 
 
-def leap_slam_func(self, targets, skill_level):
+def leap_slam_func(self, targets, skill_level, **kwargs):
     """Ability function which transports the player to a tile, and damages and knocks back any adjacent enemies."""
     console_text = 'You use Leap Slam'
     # Leap slam is an ability with self.save_target = True, so the coords of the selected tile are appended
@@ -102,7 +102,7 @@ def chain_hook_func(self, targets, **kwargs):
     return ability_outcomes
 
 
-def shockwave_func(self, targets, skill_level):
+def shockwave_func(self, targets, skill_level, rng=random):
     """
     Function for the Shockwave ability, which hits an enemy directly ahead of the player (in any cardinal direction)
     with a damaging projectile.
@@ -114,7 +114,7 @@ def shockwave_func(self, targets, skill_level):
         console_text = ''
         damage = (1 + skill_level) * (self.attributes['str'] - target.attributes['end'] + self.off_rating)
         crit_chance = max(self.attributes['dex'] + (self.attributes['wis'] - target.attributes['wis']), 0)
-        if crit_chance > random.randint(0, 100):
+        if crit_chance > rng.randint(0, 100):
             console_text += 'Critical hit! '
             damage = 2 * damage
         target.hp[0] = max(0, target.hp[0] - damage)
@@ -123,7 +123,7 @@ def shockwave_func(self, targets, skill_level):
     return ability_outcomes
 
 
-def bloodlust_func(self, targets, skill_level):
+def bloodlust_func(self, targets, skill_level, **kwargs):
     """
     Ability function which grants the Player an increased strength buff, the value of which scales with the number
     of enemies around them.
@@ -138,7 +138,7 @@ def bloodlust_func(self, targets, skill_level):
     return {'console_text': ['You cast Bloodlust on yourself, and suddenly feel insatiable.']}
 
 
-def soul_rend_func(self, targets, skill_level):
+def soul_rend_func(self, targets, skill_level, rng=random):
     """
     Ability function which targets an enemy to do a large amount of damage. If the enemy is killed by this ability,
     the player regains all of the MP and also get a buff which increases their MP regen.
@@ -147,7 +147,7 @@ def soul_rend_func(self, targets, skill_level):
     console_text = ['']
     damage = (2 + skill_level) * (self.attributes['str'] - target.attributes['end'] + self.off_rating)
     crit_chance = max(self.attributes['dex'] + (self.attributes['wis'] - target.attributes['wis']), 0)
-    if crit_chance > random.randint(0, 100):
+    if crit_chance > rng.randint(0, 100):
         console_text[0] += 'Critical hit! '
         damage = 2 * damage
     target.hp[0] = max(0, target.hp[0] - damage)
@@ -178,21 +178,21 @@ def retribution_func(self, skill_level, **kwargs):
 heavy_strike = ActiveAbility(name='Heavy Strike', mp_cost=2,
                              description='Strike an enemy with all your might, dealing massive damage and knocking'
                                          ' them back', level=1, cooldown=5,
-                             targeting_function=board_renderer.highlight_adjacent_tiles, function=heavy_strike_func,
+                             targeting_function=targeting.adjacent_tiles, function=heavy_strike_func,
                              details={'Damage Multiplier': '1 + {skill_level}', 'Cooldown': '5', 'MP Cost': '2'})
 
 
 trolls_blood = ActiveAbility(name="Troll's Blood", mp_cost=3, function=trolls_blood_func, level=1, cooldown=15,
                              description='Cast a spell on yourself to gain some passive health regeneration. Healing '
                                          'amount scales with WIS.',
-                             targeting_function=board_renderer.highlight_self,
+                             targeting_function=targeting.self_tile,
                              details={'HP Regen Per Turn': '{skill_level} * ({wis} - 2)',
                                       'Buff Duration': '7', 'Cooldown': '15', 'MP Cost': '3'})
 
 
 leap_slam = ActiveAbility(name='Leap Slam', mp_cost=4,
                           description='Leap towards a targeted space, damaging and knocking back all adjacent enemies',
-                          targeting_function=board_renderer.highlight_radius,
+                          targeting_function=targeting.tiles_in_radius,
                           targeting_function_params={'radius': 4}, function=leap_slam_func, cooldown=10,
                           save_target=True, multi_target_function=(utility_functions.find_tiles_in_radius, {'radius': 1}),
                           level_up_dict={'target_radius': 1, 'mp_cost': 1},
@@ -200,7 +200,7 @@ leap_slam = ActiveAbility(name='Leap Slam', mp_cost=4,
                                    'Cooldown': '10', 'MP Cost': '4'})
 
 
-shockwave = ActiveAbility(name='Shockwave', targeting_function=board_renderer.highlight_in_cross_pattern,
+shockwave = ActiveAbility(name='Shockwave', targeting_function=targeting.tiles_in_cross_pattern,
                           description='Slam your weapon into the ground, releasing a seismic shock that deals heavy '
                                       'damage to every enemy in a straight line.',
                           mp_cost=6, cooldown=10, function=shockwave_func,
@@ -211,7 +211,7 @@ shockwave = ActiveAbility(name='Shockwave', targeting_function=board_renderer.hi
 chain_hook = ActiveAbility(name='Chain Hook', mp_cost=5,
                            description='Throw a grappling hook in a straight line at a target. If the target is an '
                                        'enemy, pulls them towards you. Otherwise, pulls you to the target.',
-                           targeting_function=board_renderer.highlight_enemies_and_walls_directly_ahead,
+                           targeting_function=targeting.enemies_and_walls_directly_ahead,
                            function=chain_hook_func, cooldown=7, save_target=True,
                            level_up_dict={'cooldown': 1, 'mp_cost': -1},
                            details={'Cooldown': '7 - {skill_level}', 'MP Cost': '5 - {skill_level}'})
@@ -221,7 +221,7 @@ bloodlust = ActiveAbility(name="Bloodlust", mp_cost=6, function=bloodlust_func,
                           description='Temporarily raise your STR, by an amount that increases for each nearby '
                                       'enemy.',
                           multi_target_function=(utility_functions.find_tiles_in_radius, {'radius': 3}),
-                          targeting_function=board_renderer.highlight_self,
+                          targeting_function=targeting.self_tile,
                           details={'Base Strength Increase': '2 + {skill_level} - 1',
                                    'Strength Increase Per Enemy': '2 + int({skill_level}/3)',
                                    'Radius': '3 + {skill_level} - 1', 'Duration': '5 + {skill_level} - 1',
@@ -233,7 +233,7 @@ soul_rend = ActiveAbility(name='Soul Rend', mp_cost=6, cooldown=15,
                           description="Deal a devastating blow that targets your enemy's very spirit. If used as a "
                                       "killing blow, regain all your MP as well as a buff providing passive "
                                       "MP regeneration.",
-                          targeting_function=board_renderer.highlight_adjacent_tiles, function=soul_rend_func,
+                          targeting_function=targeting.adjacent_tiles, function=soul_rend_func,
                           level_up_dict={'cooldown': 2},
                           details={'Damage Multiplier': '2 + {skill_level}', 'MP Regen Per Turn': '2 + {skill_level}',
                                    'Buff Duration': '6 + {skill_level}', 'Cooldown': '15 - {skill_level}',
@@ -241,7 +241,7 @@ soul_rend = ActiveAbility(name='Soul Rend', mp_cost=6, cooldown=15,
 
 
 retribution = ActiveAbility(name='Retribution', mp_cost=8, cooldown=15, function=retribution_func,
-                            targeting_function=board_renderer.highlight_self,
+                            targeting_function=targeting.self_tile,
                             description='Temporarily gain a buff which reflects all incoming damage back to the '
                                         'attackers',
                             details={'Buff Duration': '5 + {skill_level} - 1', 'Cooldown': '15', 'MP Cost': '8'})
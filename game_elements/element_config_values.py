@@ -8,6 +8,18 @@ Config file that stores important variables which have to do with game element o
 
 BOARD_LENGTH = 15
 BOARD_HEIGHT = 15
+# If True, every board is fully rebuilt from its objects after each change and checked against its incrementally
+# updated grid. Slow, so only meant for debugging.
+DEBUG_BOARD_CONSISTENCY = False
+# The most tiles an enemy's pathfinding will look at before giving up on reaching the player for that turn.
+MAX_PATHFINDING_NODES = 150
+# If True, the boards behind the doors nearest the player are generated in the background by a BoardPregenerator.
+PREGENERATE_BOARDS = False
+# The most doors the BoardPregenerator will have boards generated for at once.
+PREGENERATED_DOORS = 2
+# The most boards the WorldStore keeps in memory at once. The boards visited longest ago are evicted beyond that, and are
+# loaded back in when a door leading to them is stepped on.
+MAX_RESIDENT_BOARDS = 32
 
 
 #######################################
@@ -16,3 +28,5 @@ BOARD_HEIGHT = 15
 
 INVENTORY_LIMIT = 12
 INVENTORY_ROW_LENGTH = 6
+# The highest level a skill in the skill tree can be leveled up to.
+MAX_SKILL_LEVEL = 3
@@ -25,8 +25,11 @@ class Enemy(Character):
         In addition to the above, the following attributes are also initialized for each Enemy:
         :aggro: Boolean which determines if the player has ever entered the the Enemy's aggro range. If ever set to
                 True, will never go back to False even if the player moves away, under normal circumstances.
+        :template_name: The name the enemy was created with, which is kept when a copy of it placed on a board is given
+                        a name of its own by generate_new_enemy().
         """
         super().__init__(name, x, y, attributes, status)
+        self.template_name = name
         self.aggro_range = aggro_range
         self.aggro = False
         self.attack_range = attack_range
@@ -59,7 +62,7 @@ class Enemy(Character):
         # If no valid movement, return None
         return None, None
 
-    def basic_attack(self, target):
+    def basic_attack(self, target, rng=random):
         console_text = ['']
         # Enemies will always deal at least 1 damage, unless they miss
         base_damage = max(self.attributes['str'] - target.attributes['end'] - target.def_rating, 1)
@@ -67,10 +70,10 @@ class Enemy(Character):
         crit_chance = self.attributes['dex'] + (self.attributes['wis'] - target.attributes['wis'])
         base_damage, base_accuracy = target.apply_defensive_combat_passives(base_damage, base_accuracy)
 
-        if random.randint(0, 100) <= crit_chance:
+        if rng.randint(0, 100) <= crit_chance:
             base_damage = 2 * base_damage
             console_text[0] += 'Critical hit! '
-        elif random.randint(0, 100) >= base_accuracy:
+        elif rng.randint(0, 100) >= base_accuracy:
             base_damage = 0
             console_text[0] += 'Miss! '
 
@@ -97,15 +100,20 @@ class Enemy(Character):
         self.mp[0] = self.mp[1]
 
 
-def generate_new_enemy(x, y, level):
+def generate_new_enemy(x, y, level, rng=random, board_seed=0):
+    """
+    Returns a new enemy at (x, y) of the given level, picked at random from the enemies of that tier.
+    :param board_seed: The seed of the random streams the enemy's board is generated with. Each enemy is named after
+                       it and the enemy's starting position, so that the same seed always gives the same names, without
+                       drawing anything from rng that would change the rest of the board.
+    """
     import copy
-    from uuid import uuid4
     from element_lists import enemy_list
     tier_mapping = {
         1: enemy_list.tier_1
     }
-    new_enemy = copy.deepcopy(random.choice(tier_mapping.get(level, enemy_list.tier_1)))
-    new_enemy.name = new_enemy.name + f'_{str(uuid4())}'
+    new_enemy = copy.deepcopy(rng.choice(tier_mapping.get(level, enemy_list.tier_1)))
+    new_enemy.name = f'{new_enemy.template_name}_{board_seed}-{x}-{y}'
     new_enemy.x = x
     new_enemy.y = y
     if new_enemy.level != level:
@@ -0,0 +1,101 @@
+import profiler
+from game_elements.element_config_values import MAX_PATHFINDING_NODES
+from game_elements.reservations import ReservationTable
+from utility_functions import manhattan_distance
+
+
+class EnemyTurn:
+    def __init__(self, board, player, rng=None):
+        """
+        Runs a single enemy turn as a series of phases, each of which goes through every enemy before the next one
+        starts:
+            i. Perception: every enemy checks how far away the player is, and becomes aggro'd if close enough.
+            ii. Planning: every enemy that can't attack the player proposes the tiles it would like to move to.
+            iii. Movement: the proposals are all resolved against each other at once with a ReservationTable, and the
+                 moves which go ahead are carried out.
+            iv. Attacks: every enemy that was within range of the player attacks.
+            v. Upkeep: end of turn status effects and MP regeneration.
+        Anything which every enemy needs, like the player's position or the distance of every tile to the player, is
+        found once per phase rather than once per enemy.
+        :param board: The Board the enemies are on.
+        :param player: The Player the enemies are after.
+        :param rng: The RandomStreams of the game, defaulting to the board's. Enemy decisions are made with the ai stream
+                    and their attacks rolled with the combat stream.
+
+        The following attributes are set and used by the phases:
+        :enemies: A list of the enemies taking part in this turn, in the order they act. This is sorted by position
+                  rather than taken from the order of the enemies dict, so that the same board always plays out the
+                  same way.
+        :attackers: A list of the enemies which are within attack range of the player.
+        :movers: A list of the enemies which aren't, and so might move instead.
+        :proposals: A list of (enemy, candidates) for every enemy, where candidates is a list of the tiles it would
+                    like to move to, best first.
+        :reservations: The ReservationTable used to resolve the moves.
+        :console_text: A list of every line of console text produced during the turn.
+        """
+        self.board = board
+        self.player = player
+        self.rng = rng if rng is not None else board.rng
+        self.enemies = [board.enemies[pos] for pos in sorted(board.enemies, key=lambda pos: (pos[1], pos[0]))]
+        self.attackers = list()
+        self.movers = list()
+        self.proposals = list()
+        self.reservations = ReservationTable()
+        self.console_text = list()
+
+    @profiler.timed('enemy turn')
+    def run(self):
+        """Runs each phase of the turn in order, and returns all of the console text produced."""
+        self.perceive()
+        self.plan()
+        self.move()
+        self.attack()
+        self.upkeep()
+        return self.console_text
+
+    def perceive(self):
+        player_pos = (self.player.x, self.player.y)
+        for enemy in self.enemies:
+            distance_to_player = manhattan_distance((enemy.x, enemy.y), player_pos)
+            if distance_to_player <= enemy.aggro_range:
+                if not enemy.aggro:
+                    self.console_text.append(f"{enemy.display_name} has noticed you.")
+                enemy.aggro = True
+            if distance_to_player <= enemy.attack_range:
+                self.attackers.append(enemy)
+            else:
+                self.movers.append(enemy)
+
+    def plan(self):
+        """
+        Aggro'd enemies move towards the player, and the rest are given a 50% chance to move one tile in a random
+        direction. Every enemy plans against the board as it was at the start of the turn, without changing it, so the
+        order they plan in makes no difference. Enemies which aren't moving propose nothing, and keep their tiles.
+        """
+        movers = set(self.movers)
+        for enemy in self.enemies:
+            candidates = list()
+            if enemy in movers:
+                if enemy.aggro:
+                    candidates = self.board.steps_towards_player(enemy.x, enemy.y, max_nodes=MAX_PATHFINDING_NODES)
+                elif self.rng.ai.randint(0, 100) > 50:
+                    adjacent_tiles = ([(enemy.x + i, enemy.y) for i in [-1, 1]] +
+                                      [(enemy.x, enemy.y + i) for i in [-1, 1]])
+                    adjacent_open_tiles = [tile for tile in adjacent_tiles if self.board.tile_is_open(*tile)]
+                    if adjacent_open_tiles:
+                        candidates = [self.rng.ai.choice(adjacent_open_tiles)]
+            self.proposals.append((enemy, candidates))
+
+    def move(self):
+        """Resolves every proposed move at once, and carries out the ones which go ahead."""
+        for enemy, (new_x, new_y) in self.reservations.resolve_moves(self.proposals):
+            self.console_text.extend(self.board.move_character(enemy, new_x, new_y))
+
+    def attack(self):
+        for enemy in self.attackers:
+            self.console_text.extend(enemy.basic_attack(self.player, rng=self.rng.combat))
+
+    def upkeep(self):
+        for enemy in self.enemies:
+            self.console_text.extend(enemy.apply_end_of_turn_status_effects())
+            enemy.passive_mp_regen()
@@ -0,0 +1,104 @@
+from game_elements.element_config_values import BOARD_LENGTH, BOARD_HEIGHT
+
+# The values each tile type is stored as in Board.grid, which are just the ASCII codes of the template letters.
+PLAYER, ENEMY, OPEN, TREASURE, DOOR, WALL, TRAP = (ord(tile) for tile in 'PEOTDXR')
+
+# Each tile holds a set of these flags, one for every kind of thing on it. A tile can hold several at once, e.g. an
+# enemy standing on a trap it avoided triggering.
+PLAYER_FLAG = 1
+ENEMY_FLAG = 2
+CHEST_FLAG = 4
+TRAP_FLAG = 8
+# A tile holding any of these can't be moved onto.
+BLOCKING_FLAGS = PLAYER_FLAG | ENEMY_FLAG | CHEST_FLAG
+# Translation tables mapping every tile of a grid to the terrain underneath it, and every terrain tile to whether it can
+# be walked on, so that a whole board's worth of tiles is converted in one call.
+TERRAIN_TABLE = bytes(tile if tile in (WALL, DOOR) else OPEN for tile in range(256))
+WALKABLE_TABLE = bytes(1 if tile == OPEN else 0 for tile in range(256))
+
+
+class OccupancyIndex:
+    def __init__(self, grid):
+        """
+        Index of what is on every tile of a board, stored in flat arrays indexed by y * BOARD_LENGTH + x so that every
+        query and update is O(1) and allocates nothing, however many enemies are on the board. The Board object keeps
+        this in sync as things move, die, and get triggered.
+        :param grid: The board's grid as loaded from its template. Everything that isn't a wall or a door is taken to
+                     be open floor, and the objects on top of it are added separately by the Board.
+
+        The following attributes are set at initialization:
+        :terrain: A bytearray holding the tile underneath everything else on each tile, i.e. a wall, door or open tile.
+        :flags: A bytearray holding the flags of everything currently on each tile.
+        :occupants: A list holding the Enemy standing on each tile, or None.
+        :objects: A list holding the Trap or Chest lying on each tile, or None.
+        :walkable: A bytearray where each entry is 1 if the tile can be moved onto right now and 0 otherwise. It is kept
+                   up to date on every change, so that pathfinding can read it directly.
+        :passable: Like walkable, but ignoring characters, i.e. 1 for every tile that could be moved onto if nobody was
+                   standing on it. This only changes when the terrain itself does.
+        :terrain_version: An int which is incremented every time passable changes.
+        """
+        size = BOARD_LENGTH * BOARD_HEIGHT
+        self.terrain = bytearray(grid.translate(TERRAIN_TABLE))
+        self.flags = bytearray(size)
+        self.occupants = [None] * size
+        self.objects = [None] * size
+        self.walkable = bytearray(self.terrain.translate(WALKABLE_TABLE))
+        self.passable = bytearray(self.walkable)
+        self.terrain_version = 0
+
+    def add(self, index, flag, obj=None):
+        """Adds something to the tile at index. For enemies, traps and chests, obj is the object itself."""
+        self.flags[index] |= flag
+        if flag == ENEMY_FLAG:
+            self.occupants[index] = obj
+        elif flag != PLAYER_FLAG:
+            self.objects[index] = obj
+        self.update_walkable(index)
+
+    def remove(self, index, flag):
+        """Removes something from the tile at index, leaving anything else on the tile where it is."""
+        self.flags[index] &= ~flag
+        if flag == ENEMY_FLAG:
+            self.occupants[index] = None
+        elif flag != PLAYER_FLAG:
+            self.objects[index] = None
+        self.update_walkable(index)
+
+    def move(self, old_index, new_index, flag):
+        """Moves a character from one tile to another."""
+        occupant = self.occupants[old_index]
+        self.remove(old_index, flag)
+        self.add(new_index, flag, occupant)
+
+    def update_walkable(self, index):
+        open_terrain = self.terrain[index] == OPEN
+        self.walkable[index] = open_terrain and not self.flags[index] & BLOCKING_FLAGS
+        passable = open_terrain and not self.flags[index] & CHEST_FLAG
+        if passable != self.passable[index]:
+            self.passable[index] = passable
+            self.terrain_version += 1
+
+    def is_walkable(self, index):
+        """Returns True if a character can move onto the tile at index."""
+        return self.walkable[index] == 1
+
+    def occupant(self, index):
+        """Returns the Enemy standing on the tile at index, if any."""
+        return self.occupants[index]
+
+    def under(self, index):
+        """Returns the Trap or Chest lying on the tile at index, if any."""
+        return self.objects[index]
+
+    def top_tile(self, index):
+        """Returns the tile type that is visible at index, i.e. whatever is on top of the stack."""
+        flags = self.flags[index]
+        if flags & PLAYER_FLAG:
+            return PLAYER
+        if flags & ENEMY_FLAG:
+            return ENEMY
+        if flags & CHEST_FLAG:
+            return TREASURE
+        if flags & TRAP_FLAG:
+            return TRAP
+        return self.terrain[index]
@@ -1,6 +1,6 @@
+import copy
 import json
 import random
-import pygame as pg
 
 from game_elements.classes.warrior import warrior_config
 from game_elements.character import Character
@@ -29,12 +29,18 @@ class Player(Character):
         As well as the above, the following attributes are also set and used throughout the Player's methods:
         :fatigued: A flag used when the player has become too tired. While True, all of the players attributes are
                    lowered.
-        :movement_mapping: A dict that maps keyboard inputs to the proper methods and parameters which will be called.
+        :attribute_points: The number of points the player has left to spend on their attributes. The player gains two
+                           every level-up.
+        :skill_points: The number of points the player has left to spend on skills in their skill tree. The player
+                       gains one every level-up.
+        :movement_mapping: A dict that maps each direction to the proper methods and parameters which will be called.
         :off_rating: An int which represents the player's total offensive rating after factoring equipment bonuses
         :def_rating: Similar to off_rating, but for defense.
         """
         profession_config = profession_string_map[profession]
-        super().__init__(name, x, y, profession_config['starting_attributes'], status)
+        # Copy the starting attributes, since they're changed over the course of a game and would otherwise carry over
+        # to every other player of this profession.
+        super().__init__(name, x, y, dict(profession_config['starting_attributes']), status)
         self.inventory = inventory if inventory is not None else list()
         self.equipment = equipment if equipment is not None else {
             'head': None,
@@ -58,23 +64,22 @@ class Player(Character):
             'on_kill': dict(),
             'board_mods': dict()
         }
-        self.skill_tree = profession_config['skill_tree']
+        # Like the attributes, the skill tree is copied so that its abilities aren't shared with other players.
+        self.skill_tree = copy.deepcopy(profession_config['skill_tree'])
         self.set_abilities_from_skill_tree()
         self.level = level
         self.experience = experience if experience is not None else [0, 3]
         self.fatigued = 0
+        self.attribute_points = 0
+        self.skill_points = 0
         # Here we create a mapping for all of the basic movements, so that they can all be called from one function.
         # The keys in this dict are a tuple of (method, parameter), which are called together in the perform_movement()
         # method below. Good idea? Who knows, but that's what we're trying for now
         self.movement_mapping = {
-            pg.K_UP: (self.move_up, None),
-            pg.K_w: (self.move_up, None),
-            pg.K_DOWN: (self.move_up, -1),
-            pg.K_s: (self.move_up, -1),
-            pg.K_RIGHT: (self.move_right, None),
-            pg.K_d: (self.move_right, None),
-            pg.K_LEFT: (self.move_right, -1),
-            pg.K_a: (self.move_right, -1)
+            'up': (self.move_up, None),
+            'down': (self.move_up, -1),
+            'right': (self.move_right, None),
+            'left': (self.move_right, -1)
         }
 
     def to_dict(self):
@@ -96,13 +101,15 @@ class Player(Character):
             'level': self.level,
             'profession': self.profession,
             'skill_tree': self.skill_tree,
-            'experience': self.experience
+            'experience': self.experience,
+            'attribute_points': self.attribute_points,
+            'skill_points': self.skill_points
         }
 
-    def perform_movement(self, input):
-        """Method that calls the appropriate method from self.movement_mapping based on the keyboard input."""
-        func = self.movement_mapping[input][0]
-        param = self.movement_mapping[input][1]
+    def perform_movement(self, direction):
+        """Method that calls the appropriate method from self.movement_mapping based on the direction of movement."""
+        func = self.movement_mapping[direction][0]
+        param = self.movement_mapping[direction][1]
         if param is None:
             new_x, new_y = func()
         else:
@@ -180,12 +187,15 @@ class Player(Character):
             self.apply_attribute_changes()
         return render_necessary
 
-    def consume_item(self, index):
-        """Method to consume the item located at 'index' in the player's inventory."""
+    def consume_item(self, index, rng=random):
+        """
+        Method to consume the item located at 'index' in the player's inventory. Any item effects left to chance are
+        decided with rng.
+        """
         item = self.inventory.pop(index)
         for effect, parameter_dict in zip(item.effects, item.parameters):
             parameter_dict['target'] = self
-            effect(**parameter_dict)
+            effect(rng=rng, **parameter_dict)
         return item.console_text
 
     def equip_item(self, index):
@@ -202,10 +212,10 @@ class Player(Character):
         self.update_off_def_ratings()
         return console_text
 
-    def basic_attack(self, target):
+    def basic_attack(self, target, rng=random):
         """
         For when the player attacks an enemy. Calculates damage based on strength, whether or not there's a crit or a
-        miss based on dex, and applies the damage, if any, to the target.
+        miss based on dex, and applies the damage, if any, to the target. Crits and misses are rolled with rng.
         """
         console_text = ['']
         base_damage = max(self.attributes['str'] - target.attributes['end'], 1) + self.off_rating
@@ -213,10 +223,10 @@ class Player(Character):
         crit_chance = max(self.attributes['dex'] + (self.attributes['wis'] - target.attributes['wis']), 0)
         base_damage, crit_chance, base_accuracy = self.apply_offensive_combat_passives(base_damage, crit_chance,
                                                                                        base_accuracy)
-        if random.randint(0, 100) <= crit_chance:
+        if rng.randint(0, 100) <= crit_chance:
             base_damage = 2 * base_damage
             console_text[0] += 'Critical hit! '
-        elif random.randint(0, 100) >= base_accuracy:
+        elif rng.randint(0, 100) >= base_accuracy:
             base_damage = 0
             console_text[0] += 'Miss! '
         console_text[0] += f"You dealt {base_damage} damage to {target.display_name}. "
@@ -224,7 +234,7 @@ class Player(Character):
         if target.hp[0] == 0:
             self.apply_on_kill_passives()
             from game_elements.enemy import death_phrases
-            console_text.append(random.choice(death_phrases))
+            console_text.append(rng.choice(death_phrases))
         return console_text
 
     def update_off_def_ratings(self):
@@ -238,18 +248,19 @@ class Player(Character):
             if self.equipment.get(slot, None):
                 self.def_rating += self.equipment[slot].def_rating
 
-    def use_ability(self, ability, targets):
+    def use_ability(self, ability, targets, rng=random):
         """
-        Player uses an ability on the target. If target is None, then the ability misses.
+        Player uses an ability on the target. If target is None, then the ability misses. Anything about the ability
+        left to chance is decided with rng.
         """
         if targets is not None:
-            ability_outcome = ability.function(self=self, targets=targets, skill_level=ability.level)
+            ability_outcome = ability.function(self=self, targets=targets, skill_level=ability.level, rng=rng)
             ability.turns_left = ability.cooldown
             self.mp[0] = max(0, self.mp[0] - ability.mp_cost)
             for target in targets:
                 if target.hp[0] == 0:
                     from game_elements.enemy import death_phrases
-                    ability_outcome['console_text'].append(random.choice(death_phrases))
+                    ability_outcome['console_text'].append(rng.choice(death_phrases))
                     self.apply_on_kill_passives()
         else:
             ability_outcome = {
@@ -270,9 +281,11 @@ class Player(Character):
     def level_up(self):
         """
         Increases the player level, and also sets new experience level based on the overflow of the previous level's
-        experience bar.
+        experience bar. The player also gains two attribute points and a skill point to spend.
         """
         self.level += 1
+        self.attribute_points += 2
+        self.skill_points += 1
         self.hp[0] = self.hp[1]
         self.mp[0] = self.mp[1]
         self.experience[1] = level_to_max_exp_map.get(self.level, 10)
@@ -292,6 +305,29 @@ class Player(Character):
 
         return refresh_necessary
 
+    def level_up_skill(self, tree_level, index):
+        """
+        Increases the level of a skill in the skill tree and updates the ability accordingly. Active abilities have a
+        level_up method which will be called, whereas passive abilities just have their values incremented by the
+        level-1 value. Then sets the player's abilities from the updated skill tree.
+        :param tree_level: The key of the skill tree level the skill is in, e.g. 'active_1'.
+        :param index: The index of the skill in that level.
+        """
+        ability_entry = self.skill_tree[tree_level][index]
+        ability = ability_entry['ability']
+        if not ability.active and ability.level > 0:
+            ability.value += int(ability.value / ability.level)
+        if ability.active and ability.level > 0:
+            ability.level_up()
+        ability.level += 1
+        if ability_entry.get('disabled', None) is not None:
+            # If the allocated ability is a non-starting active ability, we disable the other abilities in this level,
+            # since the players only get to chose one ability per layer.
+            for entry in self.skill_tree[tree_level]:
+                if entry['ability'].name is not ability.name:
+                    entry['disabled'] = True
+        self.set_abilities_from_skill_tree()
+
     def set_abilities_from_skill_tree(self):
         """Sets the players passive and active abilities based off the values in the skill tree dict."""
         self.active_abilities = list()
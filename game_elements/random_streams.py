@@ -0,0 +1,34 @@
+import random
+
+# The subsystems which each draw from their own stream of random numbers.
+STREAM_NAMES = ('combat', 'ai', 'worldgen', 'loot')
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        """
+        Registry of the random number generators used by a single game, with a separate stream for each subsystem, all
+        seeded from one seed. Keeping the streams separate means that a game can be reproduced exactly from its seed,
+        and that e.g. generating a different number of boards doesn't change the outcome of any fight.
+        :param seed: Int, the seed every stream is derived from. If None, a random seed is chosen, which is kept so that
+                     the game can still be reproduced.
+
+        The following attributes are also set at initialization, each a random.Random, which has the same methods as
+        the random module:
+        :combat: Hits, misses, crits, traps and item effects.
+        :ai: Enemy decisions, such as where to wander.
+        :worldgen: Board templates, and the enemies and traps on them.
+        :loot: The items in chests.
+        """
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        for name in STREAM_NAMES:
+            setattr(self, name, random.Random(f'{self.seed}:{name}'))
+
+    def get_state(self):
+        """Returns the state of every stream, which can be passed to set_state() to pick up from the same point."""
+        return {name: getattr(self, name).getstate() for name in STREAM_NAMES}
+
+    def set_state(self, state):
+        """Restores every stream to a state returned by get_state()."""
+        for name in STREAM_NAMES:
+            getattr(self, name).setstate(state[name])
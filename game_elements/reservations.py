@@ -0,0 +1,103 @@
+class ReservationTable:
+    def __init__(self):
+        """
+        Map of which character has claimed each tile over a single turn, so that every enemy can propose a move at the
+        same time and have them all resolved together, instead of moving one at a time against a board which the
+        enemies before them have already changed. Conflicts are always resolved the same way for the same proposals,
+        however the enemies happen to be stored, so that turns can be replayed exactly. Claims only last for the turn
+        they're made in, so a new table is used for every turn.
+
+        The following attributes are set at initialization:
+        :reservations: A dict in the format {(x, y): character}, holding the tile each character is standing on at the
+                       start of the turn, and once resolve_moves() has run, the tile it ends the turn on.
+        """
+        self.reservations = dict()
+
+    def reserve(self, tile, character):
+        self.reservations[tile] = character
+
+    def holder(self, tile):
+        """Returns the character which has claimed tile, or None if it's free."""
+        return self.reservations.get(tile)
+
+    def resolve_moves(self, proposals):
+        """
+        Given a move proposal from every character, works out which of them can go ahead.
+        :param proposals: A list of (character, candidates) for every character on the board, in order of priority,
+                          where candidates is a list of the tiles the character would like to move to, best first. An
+                          empty list means the character is staying where it is.
+        :return: A list of (character, (new_x, new_y)) for every move which goes ahead, in an order in which they can
+                 be carried out one at a time without anyone moving onto a tile which is still occupied.
+
+        The rules, applied repeatedly until nothing changes, are:
+            i. A character which ends up staying where it is always keeps its own tile.
+            ii. Otherwise, when several characters want the same tile, the one with the highest priority gets it.
+            iii. Two characters can't swap tiles with each other, so the one with the lower priority gives way.
+        Whenever a character loses out, it moves on to its next candidate, or stays where it is if it has none left.
+        Characters moving in a closed loop are then left where they are, since there is no order in which to move them.
+        """
+        positions = {character: (character.x, character.y) for character, _ in proposals}
+        priorities = {character: i for i, (character, _) in enumerate(proposals)}
+        for character, position in positions.items():
+            self.reserve(position, character)
+        choices = {character: 0 for character, _ in proposals}
+
+        settled = False
+        while not settled:
+            settled = True
+            targets = dict()
+            for character, candidates in proposals:
+                choice = choices[character]
+                targets[character] = candidates[choice] if choice < len(candidates) else positions[character]
+            claimed = dict()
+            for character, _ in proposals:
+                target = targets[character]
+                rival = claimed.get(target)
+                if rival is None:
+                    claimed[target] = character
+                elif target == positions[character]:
+                    # The rival has a higher priority, but this character is staying put, so the rival gives way.
+                    claimed[target] = character
+                    choices[rival] += 1
+                    settled = False
+                else:
+                    choices[character] += 1
+                    settled = False
+            if not settled:
+                continue
+            for character, _ in proposals:
+                other = self.holder(targets[character])
+                if other is not None and other is not character and targets[other] == positions[character]:
+                    # A swap, so the one with the lower priority gives way.
+                    choices[max(character, other, key=priorities.get)] += 1
+                    settled = False
+                    break
+
+        moves = order_moves(positions, targets)
+        next_positions = dict(positions)
+        next_positions.update(moves)
+        self.reservations.clear()
+        for character, position in next_positions.items():
+            self.reserve(position, character)
+        return moves
+
+
+def order_moves(positions, targets):
+    """
+    Orders the moves so that nobody moves onto a tile before whoever is standing on it has moved away, and leaves out
+    any moves around a closed loop.
+    """
+    pending = {character: target for character, target in targets.items() if target != positions[character]}
+    occupied = {position: character for character, position in positions.items()}
+    moves = list()
+    progress = True
+    while pending and progress:
+        progress = False
+        for character, target in list(pending.items()):
+            if target not in occupied:
+                moves.append((character, target))
+                del occupied[positions[character]]
+                occupied[target] = character
+                del pending[character]
+                progress = True
+    return moves
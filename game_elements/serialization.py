@@ -0,0 +1,227 @@
+import copy
+import marshal
+import zlib
+
+from element_lists import enemy_list, item_list, status_list, trap_list
+from game_elements.board import Board, BoardStub
+from game_elements.chest import Chest
+from game_elements.element_config_values import BOARD_LENGTH
+from game_elements.player import Player
+from game_elements.status import Status
+from game_elements.trap import Trap
+
+# Every piece of content which can be referenced by name in serialized data, i.e. the enemies, items and traps that are
+# copied into the game and the statuses that are copied and modified. Functions, flavour text and the like are never
+# serialized, only the name of the content they come from and the state which has changed since it was copied.
+ENEMIES = {enemy.name: enemy for enemy in enemy_list.tier_1}
+ITEMS = {item.name: item for item in item_list.tier_1_c + item_list.tier_1_e}
+TRAPS = {trap.name: trap for trap in vars(trap_list).values() if isinstance(trap, Trap)}
+STATUSES = {status.name: status for status in vars(status_list).values() if isinstance(status, Status)}
+# Statuses handed out by abilities are copies of the statuses above, which keep the effects of the status they were
+# copied from, so that's what they are looked up by.
+STATUS_BASES = {(status.__class__, status.end_of_turn_effect, getattr(status, 'combat_function', None)): name
+                for name, status in reversed(list(STATUSES.items()))}
+# Maps every tile that has something on it to the open tile underneath.
+TERRAIN_TABLE = bytes.maketrans(b'PETR', b'OOOO')
+# The marshal format version serialized data is written with, pinned so that data written by one version of Python can
+# be read by another.
+MARSHAL_VERSION = 4
+
+
+def pack(data):
+    """Returns serialized data, made up only of tuples, dicts, strings, bytes, numbers and None, as compressed bytes."""
+    return zlib.compress(marshal.dumps(data, MARSHAL_VERSION))
+
+
+def unpack(packed):
+    """Returns the serialized data held in bytes returned by pack()."""
+    return marshal.loads(zlib.decompress(packed))
+
+
+def status_to_data(status):
+    """Returns the data a Status is serialized as."""
+    base = STATUS_BASES[(status.__class__, status.end_of_turn_effect, getattr(status, 'combat_function', None))]
+    return (base, status.name, status.duration, status.turns_left, status.params, status.attribute_effects)
+
+
+def status_from_data(data):
+    """Returns the Status described by data, as returned by status_to_data()."""
+    base, name, duration, turns_left, params, attribute_effects = data
+    status = copy.copy(STATUSES[base])
+    status.name = name
+    status.duration = duration
+    status.turns_left = turns_left
+    status.params = dict(params) if params is not None else None
+    status.attribute_effects = dict(attribute_effects) if attribute_effects is not None else None
+    return status
+
+
+def statuses_to_data(character):
+    """Returns the data every status on a character is serialized as."""
+    return (tuple(status_to_data(status) for status in character.status['buffs']),
+            tuple(status_to_data(status) for status in character.status['debuffs']))
+
+
+def statuses_from_data(data):
+    """
+    Returns the status dict of a character described by data, as returned by statuses_to_data(). The attribute effects
+    of the statuses are already included in the character's serialized attributes, so they aren't applied again.
+    """
+    return {'buffs': [status_from_data(status) for status in data[0]],
+            'debuffs': [status_from_data(status) for status in data[1]]}
+
+
+def item_to_data(item):
+    """Returns the data an Item is serialized as, which is just its name, or None if there's no item."""
+    return item.name if item is not None else None
+
+
+def item_from_data(data):
+    """
+    Returns the Item described by data, as returned by item_to_data(). Items never change once they're created, apart
+    from the parameters a consumable passes to its effects, so those are all that's copied.
+    """
+    if data is None:
+        return None
+    item = copy.copy(ITEMS[data])
+    if item.is_consumable():
+        item.parameters = [dict(parameters) for parameters in item.parameters]
+    return item
+
+
+def enemy_to_data(enemy):
+    """Returns the data an Enemy is serialized as."""
+    return (enemy.template_name, enemy.name, enemy.x, enemy.y, enemy.level, enemy.attributes, tuple(enemy.hp), tuple(enemy.mp),
+            enemy.aggro, enemy.aggro_range, getattr(enemy, 'in_combat', False), statuses_to_data(enemy))
+
+
+def enemy_from_data(data):
+    """Returns the Enemy described by data, as returned by enemy_to_data()."""
+    template_name, name, x, y, level, attributes, hp, mp, aggro, aggro_range, in_combat, statuses = data
+    # Every attribute that changes over the course of a game is replaced below, so a shallow copy is enough.
+    enemy = copy.copy(ENEMIES[template_name])
+    enemy.name = name
+    enemy.x, enemy.y = x, y
+    enemy.level = level
+    enemy.attributes = dict(attributes)
+    enemy.hp = list(hp)
+    enemy.mp = list(mp)
+    enemy.aggro = aggro
+    enemy.aggro_range = aggro_range
+    if in_combat:
+        enemy.in_combat = True
+    enemy.status = statuses_from_data(statuses)
+    return enemy
+
+
+def door_target_to_data(target):
+    """
+    Returns the data the target of a door is serialized as. Boards are referenced by their board_id, while a BoardStub
+    is serialized whole, apart from the door back to the board it's behind.
+    """
+    if isinstance(target, BoardStub):
+        (entry_door, back_door), = target.doors_dict.items()
+        return ('stub', target.template_id, target.rotation, target.level, target.seed, target.dist_from_initial_board,
+                entry_door, back_door['entry_position'])
+    return ('board', target.board_id)
+
+
+def board_to_data(board):
+    """
+    Returns the data a Board is serialized as. Every board it leads to must already have a board_id. Caches such as the
+    player distances aren't serialized, and are rebuilt as they're needed once the board is loaded.
+    """
+    return (board.board_id, board.template_id, board.rotation, board.seed, board.level, board.dist_from_initial_board,
+            bytes(board.grid), board.applied_passives, board.player_coordinates,
+            tuple(enemy_to_data(enemy) for enemy in board.enemies.values()),
+            tuple((x, y, item_to_data(chest.item), chest.opened) for (x, y), chest in board.chests.items()),
+            tuple((x, y, trap.name) for (x, y), trap in board.traps.items()),
+            tuple((door_coord, door['entry_position'], door_target_to_data(door['board']))
+                  for door_coord, door in board.doors.items()))
+
+
+def board_from_data(data, rng, resolve):
+    """
+    Returns the Board described by data, as returned by board_to_data().
+    :param rng: The RandomStreams of the game the board belongs to.
+    :param resolve: A function which returns whatever a door to the board with the given board_id should lead to.
+    """
+    (board_id, template_id, rotation, seed, level, dist_from_initial_board, grid, applied_passives, player_coordinates,
+     enemies, chests, traps, doors) = data
+    terrain = grid.translate(TERRAIN_TABLE).decode('ascii')
+    # The seed is only needed to generate what's on the board, which is all placed below instead.
+    board = Board(board_template=[terrain[i:i + BOARD_LENGTH] for i in range(0, len(terrain), BOARD_LENGTH)],
+                  level=level, dist_from_initial_board=dist_from_initial_board, rng=rng, template_id=template_id,
+                  rotation=rotation)
+    board.seed = seed
+    board.board_id = board_id
+    board.applied_passives = dict(applied_passives)
+    for x, y, name in traps:
+        placed_trap = copy.copy(TRAPS[name])
+        placed_trap.x, placed_trap.y = x, y
+        board.add_object((x, y), placed_trap)
+    for x, y, item, opened in chests:
+        board.add_object((x, y), Chest(item=item_from_data(item), opened=opened))
+    for enemy_data in enemies:
+        enemy = enemy_from_data(enemy_data)
+        board.add_object((enemy.x, enemy.y), enemy)
+    board.player_coordinates = player_coordinates
+    for door_coord, entry_position, target in doors:
+        if target[0] == 'stub':
+            _, stub_template_id, stub_rotation, stub_level, stub_seed, stub_dist, entry_door, return_position = target
+            target = BoardStub(template_id=stub_template_id, rotation=stub_rotation, level=stub_level, seed=stub_seed,
+                               doors_dict={entry_door: {'board': board, 'entry_position': return_position}},
+                               dist_from_initial_board=stub_dist)
+        else:
+            target = resolve(target[1])
+        board.doors[door_coord] = {'board': target, 'entry_position': entry_position}
+    return board
+
+
+def player_to_data(player):
+    """
+    Returns the data a Player is serialized as. Items are referenced by name, and each skill in the skill tree is
+    serialized as its level, cooldown and whether it's disabled, since everything else about it follows from its level.
+    The attribute and skill points the player has yet to spend are serialized along with it.
+    """
+    return (player.name, player.profession, player.x, player.y, player.level, tuple(player.experience),
+            player.attributes, tuple(player.hp), tuple(player.mp),
+            {condition: tuple(values) for condition, values in player.conditions.items()}, player.fatigued,
+            getattr(player, 'in_combat', False), statuses_to_data(player),
+            tuple(item_to_data(item) for item in player.inventory),
+            {slot: item_to_data(item) for slot, item in player.equipment.items()},
+            tuple((tree_level, tuple((entry['ability'].level, getattr(entry['ability'], 'turns_left', 0),
+                                      entry.get('disabled', None)) for entry in entries))
+                  for tree_level, entries in player.skill_tree.items()),
+            player.attribute_points, player.skill_points)
+
+
+def player_from_data(data):
+    """Returns the Player described by data, as returned by player_to_data()."""
+    (name, profession, x, y, level, experience, attributes, hp, mp, conditions, fatigued, in_combat, statuses,
+     inventory, equipment, skill_tree, attribute_points, skill_points) = data
+    player = Player(name=name, x=x, y=y, status=statuses_from_data(statuses),
+                    inventory=[item_from_data(item) for item in inventory],
+                    equipment={slot: item_from_data(item) for slot, item in equipment.items()},
+                    condition={condition: list(values) for condition, values in conditions.items()}, level=level,
+                    experience=list(experience), profession=profession)
+    # Each skill is leveled up the same way it was in the game, from the level it starts at in a new skill tree.
+    for tree_level, entries in skill_tree:
+        for index, (skill_level, turns_left, disabled) in enumerate(entries):
+            for _ in range(skill_level - player.skill_tree[tree_level][index]['ability'].level):
+                player.level_up_skill(tree_level, index)
+    for tree_level, entries in skill_tree:
+        for entry, (skill_level, turns_left, disabled) in zip(player.skill_tree[tree_level], entries):
+            if entry['ability'].active:
+                entry['ability'].turns_left = turns_left
+            if disabled is not None:
+                entry['disabled'] = disabled
+    player.attributes = dict(attributes)
+    player.hp = list(hp)
+    player.mp = list(mp)
+    player.fatigued = fatigued
+    player.attribute_points = attribute_points
+    player.skill_points = skill_points
+    if in_combat:
+        player.in_combat = True
+    return player
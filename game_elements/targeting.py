@@ -0,0 +1,70 @@
+from game_elements.element_config_values import BOARD_LENGTH, BOARD_HEIGHT
+from utility_functions import find_tiles_in_radius
+
+
+# Each of these functions is used as the targeting_function of an ActiveAbility. Given the board and the position of
+# whoever is using the ability, they return a list of every tile the ability could be aimed at, along with the set of
+# tile types which can actually be targeted. The front end highlights these, and lets the player pick one.
+
+
+def adjacent_tiles(board, target_x, target_y):
+    """Targets the tiles adjacent to (target_x, target_y)."""
+    tiles_to_target = list()
+    for i in [-1, 1]:
+        tiles_to_target.append((target_x + i, target_y))
+        tiles_to_target.append((target_x, target_y + i))
+    return tiles_to_target, {'O', 'E', 'R'}
+
+
+def self_tile(board, target_x, target_y):
+    """Targets just the player."""
+    return [(target_x, target_y)], {'P'}
+
+
+def tiles_in_radius(board, target_x, target_y, radius):
+    """Targets every open/trap tile within radius of (target_x, target_y)."""
+    board_template = board.template
+    potential_tiles_to_target = find_tiles_in_radius(center_x=target_x, center_y=target_y, radius=radius)
+    tiles_to_target = [(x, y) for (x, y) in potential_tiles_to_target if board_template[y][x] in {'O', 'R'}]
+    return tiles_to_target, {'O', 'R'}
+
+
+def enemies_and_walls_directly_ahead(board, target_x, target_y):
+    """
+    Targets the first enemy or wall to appear on the same x- or y-axis as the target in each cardinal direction,
+    but is stopped when hitting a non-open tile.
+    """
+    board_template = board.template
+    tiles_to_target = list()
+    for direction in [1, -1]:
+        for j in range(1, BOARD_HEIGHT):
+            if board_template[target_y + j*direction][target_x] == 'E':
+                tiles_to_target.append((target_x, target_y + j * direction))
+                break
+            elif board_template[target_y + j*direction][target_x] in {'X', 'T', 'D'}:
+                tiles_to_target.append((target_x, target_y + (j - 1) * direction))
+                break
+        for j in range(1, BOARD_LENGTH):
+            if board_template[target_y][target_x + j*direction] == 'E':
+                tiles_to_target.append((target_x + j * direction, target_y))
+                break
+            elif board_template[target_y][target_x + j*direction] in {'X', 'T', 'D'}:
+                tiles_to_target.append((target_x + (j - 1) * direction, target_y))
+                break
+    return tiles_to_target, {'O', 'E', 'T', 'D'}
+
+
+def tiles_in_cross_pattern(board, target_x, target_y):
+    """Targets every tile in a cross pattern around (target_x, target_y), stopping when hitting a wall or door."""
+    board_template = board.template
+    tiles_to_target = list()
+    for direction in [1, -1]:
+        for j in range(BOARD_HEIGHT):
+            if board_template[target_y + j*direction][target_x] in {'X', 'D'}:
+                break
+            tiles_to_target.append((target_x, target_y + j*direction))
+        for j in range(BOARD_LENGTH):
+            if board_template[target_y][target_x + j*direction] in {'X', 'D'}:
+                break
+            tiles_to_target.append((target_x + j*direction, target_y))
+    return tiles_to_target, {'O', 'E', 'R', 'T', 'D'}
@@ -0,0 +1,88 @@
+import sys
+
+from element_lists.board_templates import starting_board, get_board_list
+from utility_functions import find_exit_direction
+
+# The id of the starting board's template. Every other template's id is its index in get_board_list() plus one.
+STARTING_TEMPLATE_ID = 0
+DIRECTIONS = ('top', 'right', 'bottom', 'left')
+# Maps each direction to the direction opposite it, i.e. the direction a door must face to connect to it.
+OPPOSITE_DIRECTIONS = {'top': 'bottom', 'bottom': 'top', 'left': 'right', 'right': 'left'}
+
+# The catalog shared by every board, built the first time it's asked for.
+_catalog = None
+
+
+class TemplateCatalog:
+    def __init__(self, templates):
+        """
+        Catalog of every board template in each of its four rotations, built once so that choosing and orienting the
+        board behind a door is a lookup rather than a search. Each rotated template is stored as a tuple of interned
+        strings, so that the rows shared between templates are only stored once.
+        :param templates: The list of templates, indexed by template id.
+
+        The following attributes are also set at initialization:
+        :variants: A dict of (template_id, rotation): template, where rotation is the number of clockwise quarter turns
+                   the template has been rotated by.
+        :doors: A dict of (template_id, rotation): {door_coord: exit_direction, ...}, holding the direction every
+                door on the rotated template leads out of the board.
+        :entrances: A dict mapping each direction to a tuple holding, for each template which can be entered from that
+                    direction, a tuple of its (template_id, rotation, entry_door) variants with a door facing that way.
+                    The starting template is left out, since it never appears behind a door.
+        """
+        self.variants = dict()
+        self.doors = dict()
+        entrances = {direction: list() for direction in DIRECTIONS}
+        for template_id, template in enumerate(templates):
+            variant = tuple(sys.intern(''.join(row)) for row in template)
+            template_entrances = {direction: list() for direction in DIRECTIONS}
+            for rotation in range(4):
+                self.variants[(template_id, rotation)] = variant
+                doors = dict()
+                for y, row in enumerate(variant):
+                    for x, tile in enumerate(row):
+                        if tile == 'D':
+                            doors[(x, y)] = find_exit_direction(variant, x, y)
+                self.doors[(template_id, rotation)] = doors
+                for direction in DIRECTIONS:
+                    # Like the doors themselves, the entry door is the first door facing that way, going row by row.
+                    entry_door = next((door for door, exit_direction in doors.items() if exit_direction == direction),
+                                      None)
+                    if entry_door is not None:
+                        template_entrances[direction].append((template_id, rotation, entry_door))
+                variant = rotate_clockwise(variant)
+            if template_id == STARTING_TEMPLATE_ID:
+                continue
+            for direction in DIRECTIONS:
+                if template_entrances[direction]:
+                    entrances[direction].append(tuple(template_entrances[direction]))
+        self.entrances = {direction: tuple(candidates) for direction, candidates in entrances.items()}
+
+    def template(self, template_id, rotation=0):
+        """Returns the template with the given id, rotated by rotation clockwise quarter turns."""
+        return self.variants[(template_id, rotation)]
+
+    def choose_entrance(self, direction, rng):
+        """
+        Chooses a template to lead on from a door, along with how to orient it so that it has an entrance facing the
+        given direction. Every template which can be entered from that direction is equally likely to be chosen, no
+        matter how many of its rotations can be.
+        :param direction: The direction the entrance on the new board has to face, e.g. 'bottom' for a board entered
+                          from a door at the top of the current board.
+        :param rng: The random number generator the template is chosen with.
+        :return: A tuple of (template_id, rotation, entry_door), where entry_door is the coordinates of the entrance.
+        """
+        return rng.choice(rng.choice(self.entrances[direction]))
+
+
+def rotate_clockwise(template):
+    """Returns the template rotated by a quarter turn clockwise, so that its left border becomes its top border."""
+    return tuple(sys.intern(''.join(row[x] for row in reversed(template))) for x in range(len(template[0])))
+
+
+def get_catalog():
+    """Returns the TemplateCatalog of every board template, building it the first time it's called."""
+    global _catalog
+    if _catalog is None:
+        _catalog = TemplateCatalog([starting_board] + list(get_board_list()))
+    return _catalog
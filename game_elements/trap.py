@@ -1,3 +1,4 @@
+import random
 
 
 class Trap:
@@ -32,12 +33,11 @@ class Trap:
 DIRECT_DAMAGE_TRAPS = {}
 DEBUFF_TRAPS = {'lesser poison'}
 
-def generate_random_trap(coord):
-    import random
+def generate_random_trap(coord, rng=random):
     from copy import copy
     from element_lists.trap_list import TRAP_LIST
 
-    trap = copy(random.choice(TRAP_LIST))
+    trap = copy(rng.choice(TRAP_LIST))
     trap.x = coord[0]
     trap.y = coord[1]
 
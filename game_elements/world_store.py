@@ -0,0 +1,165 @@
+import gc
+import sys
+import types
+
+from game_elements.board import Board
+from game_elements.element_config_values import MAX_RESIDENT_BOARDS
+from game_elements.random_streams import RandomStreams
+from game_elements.serialization import board_to_data, board_from_data, pack, unpack
+
+
+class EvictedBoard:
+    __slots__ = ('board_id',)
+
+    def __init__(self, board_id):
+        """
+        Placeholder left behind the doors leading to a board which has been evicted from memory by the WorldStore. The
+        board is loaded back in by WorldStore.board_behind_door() when one of those doors is stepped on.
+        :param board_id: The id the board is stored under in the WorldStore.
+        """
+        self.board_id = board_id
+
+
+class WorldStore:
+    def __init__(self, rng, max_resident=MAX_RESIDENT_BOARDS):
+        """
+        Keeps track of every board that has been visited in a game, and keeps the memory they take up bounded by
+        evicting the boards visited longest ago once there are more than max_resident of them. An evicted board is
+        serialized and compressed, and the doors leading to it are pointed at an EvictedBoard placeholder, so that it's
+        only loaded back in once a door to it is stepped on again. Boards are loaded back exactly as they were left, so
+        evicting them doesn't change how the game plays out.
+        :param rng: The RandomStreams of the game, which loaded boards belong to.
+        :param max_resident: The most boards to keep in memory at once.
+
+        The following attributes are also set at initialization:
+        :boards: A dict of board_id: Board of the boards currently in memory.
+        :evicted: A dict of board_id: bytes of the compressed serialized data of every evicted board.
+        :last_visits: A dict of board_id: turn, holding the turn each board was last entered on. Turns are used rather
+                      than the time, so that the same game always evicts the same boards.
+        :next_id: The id the next board added will be given.
+        """
+        self.rng = rng
+        self.max_resident = max_resident
+        self.boards = dict()
+        self.evicted = dict()
+        self.last_visits = dict()
+        self.next_id = 0
+
+    def add(self, board, turn=0):
+        """Gives a board which isn't in the store yet its board_id, and adds it to the resident boards."""
+        board.board_id = self.next_id
+        self.next_id += 1
+        self.boards[board.board_id] = board
+        self.last_visits[board.board_id] = turn
+
+    def visit(self, board, turn):
+        """
+        Method run whenever the player enters a board, adding it to the store if it's new and recording the visit.
+        Boards are then evicted until the budget is met again, the board visited longest ago going first, and the
+        board furthest from the starting board going first among boards visited on the same turn.
+        """
+        if board.board_id is None:
+            self.add(board, turn)
+        self.last_visits[board.board_id] = turn
+        while len(self.boards) > self.max_resident:
+            board_id = min((board_id for board_id in self.boards if board_id != board.board_id),
+                           key=lambda board_id: (self.last_visits[board_id],
+                                                 -self.boards[board_id].dist_from_initial_board, board_id))
+            self.evict(board_id)
+
+    def board_behind_door(self, board, door_coord, pregenerator=None):
+        """
+        Returns the Board a door on board leads to, loading it back into memory if it has been evicted, or generating it
+        if it hasn't been visited yet.
+        """
+        target = board.doors[door_coord]['board']
+        if isinstance(target, EvictedBoard):
+            return self.load(target.board_id)
+        return board.board_behind_door(door_coord, pregenerator=pregenerator)
+
+    def evict(self, board_id):
+        """Serializes and compresses the board with the given id, and points the doors leading to it at placeholders."""
+        board = self.boards[board_id]
+        for neighbour in self.neighbours(board):
+            if neighbour.board_id is None:
+                self.add(neighbour, self.last_visits[board_id])
+            for door in neighbour.doors.values():
+                if door['board'] is board:
+                    door['board'] = EvictedBoard(board_id)
+        self.evicted[board_id] = pack(board_to_data(board))
+        del self.boards[board_id]
+
+    def load(self, board_id):
+        """Loads the evicted board with the given id back into memory, and points the doors leading to it back at it."""
+        board = board_from_data(unpack(self.evicted.pop(board_id)), rng=self.rng,
+                                resolve=lambda neighbour_id: self.boards.get(neighbour_id, EvictedBoard(neighbour_id)))
+        self.boards[board_id] = board
+        for neighbour in self.neighbours(board):
+            for door in neighbour.doors.values():
+                if isinstance(door['board'], EvictedBoard) and door['board'].board_id == board_id:
+                    door['board'] = board
+        return board
+
+    def to_data(self):
+        """
+        Returns the data the whole store is serialized as, for saving the game. The evicted boards are decompressed
+        first, since the save is compressed as a whole, and compressing each board on its own only makes it bigger.
+        """
+        return (self.next_id, self.last_visits, tuple(board_to_data(board) for board in self.boards.values()),
+                {board_id: unpack(packed) for board_id, packed in self.evicted.items()})
+
+    def restore(self, data):
+        """Fills the store, which should be empty, with the boards held in data, as returned by to_data()."""
+        self.next_id, last_visits, boards, evicted = data
+        self.last_visits = dict(last_visits)
+        self.evicted = {board_id: pack(board_data) for board_id, board_data in evicted.items()}
+        # The boards a board leads to may not have been loaded yet, so every door is left behind a placeholder until
+        # all of them have been.
+        for board_data in boards:
+            board = board_from_data(board_data, rng=self.rng, resolve=EvictedBoard)
+            self.boards[board.board_id] = board
+        for board in self.boards.values():
+            for door in board.doors.values():
+                if isinstance(door['board'], EvictedBoard) and door['board'].board_id in self.boards:
+                    door['board'] = self.boards[door['board'].board_id]
+
+    @staticmethod
+    def neighbours(board):
+        """Returns every Board in memory which one of board's doors leads to."""
+        return [door['board'] for door in board.doors.values() if isinstance(door['board'], Board)]
+
+    def report(self):
+        """
+        Returns a dict describing how many boards are in memory and how much memory they take up:
+            'resident': The number of boards in memory.
+            'evicted': The number of boards which have been evicted.
+            'resident_bytes': The approximate number of bytes taken up by the boards in memory and everything on them.
+            'evicted_bytes': The number of bytes taken up by the compressed data of the evicted boards.
+        """
+        return {
+            'resident': len(self.boards),
+            'evicted': len(self.evicted),
+            'resident_bytes': sum(deep_size(board) for board in self.boards.values()),
+            'evicted_bytes': sum(len(data) for data in self.evicted.values())
+        }
+
+
+def deep_size(board):
+    """
+    Returns the approximate number of bytes taken up by a board and everything it holds, not counting the other boards
+    it leads to, or anything shared by the whole game such as its RandomStreams, or functions and classes.
+    """
+    shared_types = (Board, RandomStreams, type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+                    types.MethodType)
+    seen = {id(board)}
+    size = 0
+    pending = [board]
+    while pending:
+        obj = pending.pop()
+        size += sys.getsizeof(obj)
+        for referent in gc.get_referents(obj):
+            if id(referent) in seen or (isinstance(referent, shared_types) and referent is not board):
+                continue
+            seen.add(id(referent))
+            pending.append(referent)
+    return size
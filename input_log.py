@@ -0,0 +1,166 @@
+import hashlib
+import struct
+
+"""
+Module holding the input log, which records every action a player takes in a game along with the seed of the game's
+random number generators. Since the simulation plays out the same way every time it's given the same seed and actions,
+the log is all that's needed to play a whole game back, e.g. to reproduce a crash, check that a change hasn't altered
+how a game plays out, or benchmark the simulation on a real game. See replay.py to play a log back.
+
+While a game is being recorded, each action is just appended to a list, so recording costs next to nothing. The log is
+only encoded when it's saved, into a compact binary format:
+    header      b'RPLY', the format version (1 byte), and the seed as a length-prefixed (2 bytes) string
+    actions     the number of actions (4 bytes), then each action as an opcode byte followed by its parameters, which
+                are each a single byte, so that e.g. a move takes 1 byte and an ability use 4
+    footer      a flag byte, which if set is followed by the turn the game finished on (4 bytes) and a digest of its
+                final state (8 bytes), so that a replay can check it finished in the same state
+All numbers are little-endian.
+"""
+
+MAGIC = b'RPLY'
+VERSION = 1
+HEADER = struct.Struct('<4sBH')
+COUNT = struct.Struct('<I')
+FOOTER = struct.Struct('<I8s')
+
+# Opcodes of the moves in each direction, which take no parameters.
+MOVE_OPCODES = {'up': 0, 'down': 1, 'left': 2, 'right': 3}
+MOVE_DIRECTIONS = {opcode: direction for direction, opcode in MOVE_OPCODES.items()}
+WAIT = 4
+ABILITY = 5  # Followed by the ability index and the x, y of the target, which are NO_TARGET if nothing was targeted
+ITEM = 6  # Followed by the item index
+ATTRIBUTE = 7  # Followed by the index of the attribute in ATTRIBUTES
+SKILL = 8  # Followed by the length of the tree level's name, the name, and the index of the skill in that level
+NO_TARGET = 255
+ATTRIBUTES = ('str', 'dex', 'int', 'end', 'vit', 'wis')
+
+
+class InputLog:
+    def __init__(self, seed, actions=None):
+        """
+        The log of every action taken in a game, in the order they were taken, which are the same action tuples that
+        are passed to the Simulation.
+        :param seed: The seed of the game's RandomStreams.
+        :param actions: A list of the actions taken so far, defaulting to an empty list.
+
+        The following attributes are also set at initialization, and filled in when a finished game's log is saved:
+        :final_turn: The turn the game finished on, or None if it isn't known.
+        :final_digest: The state_digest() of the game once it finished, or None if it isn't known.
+        """
+        self.seed = seed
+        self.actions = actions if actions is not None else list()
+        self.final_turn = None
+        self.final_digest = None
+
+    def record(self, action):
+        """Adds an action to the end of the log."""
+        self.actions.append(action)
+
+    def encode(self):
+        """Returns the log encoded as bytes, in the format described at the top of the module."""
+        seed = str(self.seed).encode('utf-8')
+        data = bytearray(HEADER.pack(MAGIC, VERSION, len(seed)))
+        data += seed
+        data += COUNT.pack(len(self.actions))
+        for action in self.actions:
+            data += encode_action(action)
+        if self.final_digest is None:
+            data.append(0)
+        else:
+            data.append(1)
+            data += FOOTER.pack(self.final_turn, self.final_digest)
+        return bytes(data)
+
+    def save(self, path, simulation=None):
+        """
+        Writes the encoded log to path.
+        :param simulation: The Simulation the log was recorded from. If given, the turn it finished on and a digest of
+                           its final state are saved along with the log.
+        """
+        if simulation is not None:
+            self.final_turn = simulation.turn
+            self.final_digest = state_digest(simulation)
+        with open(path, 'wb') as file:
+            file.write(self.encode())
+
+
+def encode_action(action):
+    """Returns the bytes an action tuple is encoded as."""
+    action_type = action[0]
+    if action_type == 'move':
+        return bytes((MOVE_OPCODES[action[1]],))
+    elif action_type == 'wait':
+        return bytes((WAIT,))
+    elif action_type == 'ability':
+        target = action[2] if action[2] is not None else (NO_TARGET, NO_TARGET)
+        return bytes((ABILITY, action[1], target[0], target[1]))
+    elif action_type == 'item':
+        return bytes((ITEM, action[1]))
+    elif action_type == 'attribute':
+        return bytes((ATTRIBUTE, ATTRIBUTES.index(action[1])))
+    elif action_type == 'skill':
+        tree_level = action[1].encode('utf-8')
+        return bytes((SKILL, len(tree_level))) + tree_level + bytes((action[2],))
+    raise Exception(f'Tried to encode an unknown action, {action}.')
+
+
+def decode(data):
+    """Returns the InputLog encoded in data, the bytes of a saved log."""
+    magic, version, seed_length = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise Exception('Tried to decode something which is not an input log.')
+    if version != VERSION:
+        raise Exception(f'Tried to decode an input log of unsupported version {version}.')
+    position = HEADER.size
+    seed = data[position:position + seed_length].decode('utf-8')
+    position += seed_length
+    action_count, = COUNT.unpack_from(data, position)
+    position += COUNT.size
+    actions = list()
+    for _ in range(action_count):
+        opcode = data[position]
+        if opcode in MOVE_DIRECTIONS:
+            actions.append(('move', MOVE_DIRECTIONS[opcode]))
+            position += 1
+        elif opcode == WAIT:
+            actions.append(('wait',))
+            position += 1
+        elif opcode == ABILITY:
+            index, x, y = data[position + 1:position + 4]
+            actions.append(('ability', index, (x, y) if x != NO_TARGET else None))
+            position += 4
+        elif opcode == ITEM:
+            actions.append(('item', data[position + 1]))
+            position += 2
+        elif opcode == ATTRIBUTE:
+            actions.append(('attribute', ATTRIBUTES[data[position + 1]]))
+            position += 2
+        elif opcode == SKILL:
+            name_length = data[position + 1]
+            tree_level = data[position + 2:position + 2 + name_length].decode('utf-8')
+            actions.append(('skill', tree_level, data[position + 2 + name_length]))
+            position += 3 + name_length
+        else:
+            raise Exception(f'Tried to decode an unknown action opcode, {opcode}.')
+    # The seed is kept as the string it was saved as, which seeds the RandomStreams exactly the same as the original.
+    input_log = InputLog(seed, actions)
+    if data[position]:
+        input_log.final_turn, input_log.final_digest = FOOTER.unpack_from(data, position + 1)
+    return input_log
+
+
+def load(path):
+    """Returns the InputLog saved at path."""
+    with open(path, 'rb') as file:
+        return decode(file.read())
+
+
+def state_digest(simulation):
+    """
+    Returns an 8 byte digest of the state of a game, covering the turn, the player and the board they're on, which two
+    games that played out the same will share.
+    """
+    player = simulation.player
+    state = (simulation.turn, player.x, player.y, player.level, player.experience, player.hp, player.mp,
+             player.attributes, [(position, enemy.hp) for position, enemy in simulation.board.enemies.items()])
+    return hashlib.blake2b(repr(state).encode('utf-8') + bytes(simulation.board.grid), digest_size=8).digest()
@@ -8,7 +8,7 @@ Module that stores all the possible effects an item can have, which are imported
 of items.
 """
 
-def increase_hp(target, value):
+def increase_hp(target, value, **kwargs):
     """Increase the hp of 'target' by 'value'"""
     if value >= 0:
         target.hp[0] = min(target.hp[0] + value, target.hp[1])
@@ -16,7 +16,7 @@ def increase_hp(target, value):
         target.hp[0] = max(target.hp[0] - value, 0)
 
 
-def increase_mp(target, value):
+def increase_mp(target, value, **kwargs):
     """Increase the mp of 'target' by 'value'"""
     if value >= 0:
         target.mp[0] = min(target.mp[0] + value, target.mp[1])
@@ -24,7 +24,7 @@ def increase_mp(target, value):
         target.mp[0] = max(target.mp[0] - value, 0)
 
 
-def improve_conditions(target, conditions, values):
+def improve_conditions(target, conditions, values, **kwargs):
     """Improves conditions by the associated value. Can effect multiple conditions at once."""
     for condition, value in zip(conditions, values):
         if value >= 0:
@@ -34,15 +34,15 @@ def improve_conditions(target, conditions, values):
             target.conditions[condition][0] = max(target.conditions[condition][0] - value, 0)
 
 
-def chance_to_poison(target, probability, status_duration=5):
+def chance_to_poison(target, probability, status_duration=5, rng=random):
     """Item effect for items which have a chance to inflict poison on consumption."""
-    if random.randint(0, 100) < probability:
+    if rng.randint(0, 100) < probability:
         poison_status = copy.copy(status_list.lesser_poison)
         poison_status.duration = status_duration
         target.apply_status(poison_status)
 
 
-def remove_poison(target):
+def remove_poison(target, **kwargs):
     """If the character has the poison debuff, remove it."""
     for debuff in target.status['debuffs']:
         if debuff.name == 'Lesser Poison':
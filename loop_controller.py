@@ -0,0 +1,59 @@
+from collections import deque
+
+import pygame as pg
+
+import timeline
+from config import TARGET_FPS, IDLE_WAIT_TIMEOUT
+from rendering import frame_compositor
+
+
+class LoopController:
+    def __init__(self, fps=TARGET_FPS, idle_wait_timeout=IDLE_WAIT_TIMEOUT):
+        """
+        Paces every loop in the game which waits on input, i.e. the main game loop and the targeting loop, so that
+        neither of them spins the CPU while nothing is happening. While there are animations on the timeline, each
+        frame is capped to the target FPS. Otherwise, the loop sleeps until the next event arrives.
+        :param fps: The most frames per second to run at while animating.
+        :param idle_wait_timeout: The longest time in milliseconds to wait for an event while idle, before returning an
+                                  empty frame anyway.
+
+        The following attributes are also set at initialization:
+        :clock: The pg.time.Clock used to cap the frame rate.
+        :pending_events: A deque of the events fetched for the current frame which haven't been handled yet, shared by
+                         every loop.
+        """
+        self.fps = fps
+        self.idle_wait_timeout = idle_wait_timeout
+        self.clock = pg.time.Clock()
+        self.pending_events = deque()
+
+    def get_events(self):
+        """
+        Yields the events for this frame one at a time. The events are handed out from a queue shared by every loop,
+        so that when a loop is entered while handling an event, e.g. the targeting loop once an ability key is pressed,
+        it carries on with the rest of the same frame's events, such as the click picking the target, rather than
+        waiting for new ones. The loop it was entered from then doesn't see those events again.
+        """
+        if not self.pending_events:
+            self.pending_events.extend(self.wait_for_events())
+        while self.pending_events:
+            yield self.pending_events.popleft()
+
+    def wait_for_events(self):
+        """
+        Returns the list of events which have arrived since the last frame. If nothing is waiting on the timeline, this
+        blocks until an event arrives or the timeout is up, so that the game uses next to no CPU while it waits for the
+        player.
+        """
+        if timeline.is_busy():
+            self.clock.tick(self.fps)
+            return pg.event.get()
+        event = pg.event.wait(self.idle_wait_timeout)
+        self.clock.tick()
+        events = [event] if event.type != pg.NOEVENT else list()
+        return events + pg.event.get()
+
+    def end_frame(self):
+        """Runs anything due on the timeline, and pushes everything drawn this frame to the display."""
+        timeline.update()
+        frame_compositor.present()
@@ -1,13 +1,16 @@
-import pygame as pg
+import sys
 
+from config import HEADLESS
 from game import Game
 from console import Console
 from game_elements.board import Board
 from game_elements.player import Player
+from rendering import window_renderer
 
 
 """
-Main module of the game, which kicks things off by calling the main_menu() method.
+Main module of the game, which kicks things off by calling the main_menu() method. Run with --headless to play
+without opening a window, and with --load to pick up the game saved on the last exit instead of starting a new one.
 """
 
 
@@ -18,14 +21,16 @@ def main_menu():
 
 def main_game():
     """Loads the main game."""
-    game = Game(console=Console(), player=Player())
+    window_renderer.init_display(headless=HEADLESS or '--headless' in sys.argv)
+    game = Game(console=Console(), player=Player(), load='--load' in sys.argv)
     run = True
     game.draw_window()
     game.console.refresh_console()
     while run:
         # game_loop_iteration() returns a boolean based on whether or not the game should keep running
         run = game.game_loop_iteration()
-        pg.display.update()
+        game.loop_controller.end_frame()
+    game.save()
 
 
 if __name__ == '__main__':
@@ -34,8 +34,8 @@ class MiscPanel:
             focus_function_mapping = {
                 'E': self.load_enemy_info
             }
-            # Get the letter representation of the tile from the board template
-            tile_type = self.board.template[self.focus_tile[1]][self.focus_tile[0]]
+            # Get the letter representation of the tile from the board
+            tile_type = self.board.tile_at(self.focus_tile[0], self.focus_tile[1])
             # If focus is on an empty tile, return None so that nothing is rendered in the focus window
             if tile_type == 'O':
                 return None
@@ -5,14 +5,16 @@ from rendering import player_panel_renderer
 from skill_tree import SkillTreeController
 
 class PlayerPanel:
-    def __init__(self, player):
+    def __init__(self, player, check_skill_unavailable):
         """
         Object that governs the player panel which displays all of the players information including stats, attributes,
         condition, inventory, and skills. Also acts as a middle-man between the Game object and the panel-rendering
         module.
-        :param player: the Player object being controlled by the user.
-        :param level_up_points: Every time the player levels up, they get two points to spend on their attributes. If
-                                this value is != 0, then the extra buttons to add points to attributes will be visible.
+        :param player: the Player object being controlled by the user. Every time the player levels up, they get two
+                       points to spend on their attributes. While they have any left, the extra buttons to add points
+                       to attributes will be visible.
+        :param check_skill_unavailable: The simulation's check_skill_unavailable() method, which the skill tree asks
+                                        whether a point can be spent on a skill.
 
         In the init method of this class, functions in the player_panel_render module are called to draw the individual
         components, and all of these functions return the Rect object that encloses their subject areas. These Rects
@@ -28,7 +30,6 @@ class PlayerPanel:
                             to tell the Player object which item is being clicked on.
         """
         self.player = player
-        self.level_up_points = 0
         self.player_dict = player.to_dict()
         self.panel_rect = player_panel_renderer.draw_player_panel(self.player_dict['name'])
         self.hp_mp_rect = player_panel_renderer.draw_hp_mp(self.player_dict['hp'], self.player_dict['mp'])
@@ -37,7 +38,7 @@ class PlayerPanel:
                                                                             self.player_dict['status']['debuffs'])
         self.conditions_rect = player_panel_renderer.draw_conditions(self.player_dict['conditions'])
         self.attributes_rect = player_panel_renderer.draw_attributes(self.player_dict['attributes'],
-                                                                     self.level_up_points)
+                                                                     self.player_dict['attribute_points'])
         self.level_and_exp_rect = player_panel_renderer.draw_level_and_experience(self.player_dict['level'],
                                                                                   self.player_dict['profession'],
                                                                                   self.player_dict['experience'])
@@ -49,7 +50,8 @@ class PlayerPanel:
         self.skill_tree = SkillTreeController(self.player_dict['skill_tree'], self.player_dict['profession'],
                                               self.player_dict['level'], self.player_dict['attributes'],
                                               self.player_dict['active_abilities'],
-                                              self.player_dict['passive_abilities'])
+                                              self.player_dict['passive_abilities'],
+                                              self.player_dict['skill_points'], check_skill_unavailable)
         self.skill_tree_displaying = False
 
     def refresh_player_panel(self):
@@ -92,9 +94,10 @@ class PlayerPanel:
         """Method to refresh the displayed players attributes."""
         if self.skill_tree_displaying:
             return
-        player_panel_renderer.draw_attributes(self.player_dict['attributes'], self.level_up_points, refresh=True)
-        if self.level_up_points > 0:
-            player_panel_renderer.draw_attribute_level_up_buttons(self.level_up_points)
+        player_panel_renderer.draw_attributes(self.player_dict['attributes'], self.player.attribute_points,
+                                              refresh=True)
+        if self.player.attribute_points > 0:
+            player_panel_renderer.draw_attribute_level_up_buttons(self.player.attribute_points)
 
     def refresh_conditions(self):
         """Method to refresh the displayed conditions."""
@@ -116,7 +119,7 @@ class PlayerPanel:
             return
         self.ability_tiles, _ = player_panel_renderer.draw_active_abilities(self.player_dict['active_abilities'],
                                                                             refresh=True,
-                                                                            skill_points=self.skill_tree.skill_points)
+                                                                            skill_points=self.player.skill_points)
 
     def refresh_equipment(self):
         """Refresh the displayed inventory, as well as reset self.equipment_tiles base on occupied equipment slots."""
@@ -198,10 +201,11 @@ class PlayerPanel:
 
     def handle_allocate_attribute_point(self):
         """
-        Called when the Game object registers a left click and the mouse is on the attribute rectangle. If player has
-        attribute points to spend, allocates them accordingly.
+        Called when the Game object registers a left click and the mouse is on the attribute rectangle, to find the
+        attribute whose button was clicked. The simulation then spends one of the player's attribute points on it.
+        :return: The name of the attribute whose button was clicked, or None if no button was clicked.
         """
-        level_up_buttons = player_panel_renderer.draw_attribute_level_up_buttons(self.level_up_points,
+        level_up_buttons = player_panel_renderer.draw_attribute_level_up_buttons(self.player.attribute_points,
                                                                                  return_only=True)
         mouse_pos = pg.mouse.get_pos()
         index_attribute_mapping = {
@@ -214,12 +218,8 @@ class PlayerPanel:
         }
         for i, button in enumerate(level_up_buttons):
             if button.collidepoint(mouse_pos):
-                clicked_attribute = index_attribute_mapping[i]
-                self.player.attributes[clicked_attribute] += 1
-                self.level_up_points -= 1
-                self.player.apply_attribute_changes()
-                self.refresh_player_panel()
-                return
+                return index_attribute_mapping[i]
+        return None
 
     def handle_inventory_mouseover(self):
         """
@@ -321,10 +321,15 @@ class PlayerPanel:
 
         raise Exception('Incompatible element passed into get_tooltip_index() method of player_panel.')
 
-    def level_up(self):
-        self.level_up_points += 2
-        self.skill_tree.level += 1
-        self.skill_tree.skill_points += 1
+    def refresh_skill_tree(self):
+        """
+        Updates the player's level and skill points held by the skill tree, which are changed by leveling up and by
+        spending points, and re-renders the tree if it's displayed.
+        """
+        self.skill_tree.level = self.player.level
+        self.skill_tree.skill_points = self.player.skill_points
+        if self.skill_tree_displaying:
+            self.skill_tree.render_skill_tree()
 
     def display_skill_tree(self):
         """
@@ -335,9 +340,8 @@ class PlayerPanel:
 
     def handle_skill_point_allocation(self):
         """
-        Calls methods to handle skill point allocation in SkillTreeController, and updates the players abilities
-        accordingly.
+        Calls methods to handle skill point allocation in SkillTreeController.
+        :return: The (tree_level, index) of the skill clicked on, which the simulation then spends a skill point on, or
+                 None if no skill can be allocated.
         """
-        changes_made = self.skill_tree.allocate_skill_points()  # This function returns a boolean
-        if changes_made:
-            self.player.set_abilities_from_skill_tree()
+        return self.skill_tree.allocate_skill_points()
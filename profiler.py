@@ -0,0 +1,111 @@
+import atexit
+import json
+from array import array
+from functools import wraps
+from time import perf_counter
+
+from config import PROFILING, PROFILER_BUFFER_SIZE, PROFILER_OUTPUT
+
+"""
+Module holding the profiler, which records how long each phase of the game takes into a fixed-size ring buffer held in
+memory. Nothing is written to disk while the game runs; the timings and a summary of them are written out on exit.
+
+Functions are timed by decorating them with @timed(phase), and anything else by wrapping it in start() and stop(). If
+PROFILING is False, @timed returns the function untouched and stop() returns straight away, so the profiler costs
+nothing when it is disabled.
+"""
+
+PHASES = ('input', 'player action', 'enemy turn', 'pathfinding', 'render', 'present')
+PERCENTILES = (50, 90, 99)
+
+enabled = PROFILING
+# The ring buffer, as parallel arrays holding the phase, start time and duration of each timing. next_sample is the
+# slot the next timing is written to, and sample_count the number of slots which hold a timing.
+sample_phases = bytearray(PROFILER_BUFFER_SIZE)
+sample_starts = array('d', bytes(8 * PROFILER_BUFFER_SIZE))
+sample_durations = array('d', bytes(8 * PROFILER_BUFFER_SIZE))
+next_sample = 0
+sample_count = 0
+
+
+def record(phase, start, duration):
+    """Writes a timing to the ring buffer, overwriting the oldest one if it is full. phase is its index in PHASES."""
+    global next_sample, sample_count
+    sample_phases[next_sample] = phase
+    sample_starts[next_sample] = start
+    sample_durations[next_sample] = duration
+    next_sample = (next_sample + 1) % PROFILER_BUFFER_SIZE
+    sample_count = min(sample_count + 1, PROFILER_BUFFER_SIZE)
+
+
+def timed(phase):
+    """Decorator which records the time each call to the decorated function takes under phase."""
+    def decorator(function):
+        if not enabled:
+            return function
+        phase_index = PHASES.index(phase)
+
+        @wraps(function)
+        def timed_function(*args, **kwargs):
+            start_time = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(phase_index, start_time, perf_counter() - start_time)
+        return timed_function
+    return decorator
+
+
+def start():
+    """Returns the start time to pass to stop(), for timing a block of code that isn't a function of its own."""
+    return perf_counter() if enabled else 0
+
+
+def stop(phase, start_time):
+    """Records the time since start_time under phase."""
+    if enabled:
+        record(PHASES.index(phase), start_time, perf_counter() - start_time)
+
+
+def get_samples():
+    """Returns every timing in the ring buffer as a list of (phase, start, duration), from oldest to newest."""
+    first = (next_sample - sample_count) % PROFILER_BUFFER_SIZE
+    slots = [(first + i) % PROFILER_BUFFER_SIZE for i in range(sample_count)]
+    return [(PHASES[sample_phases[i]], sample_starts[i], sample_durations[i]) for i in slots]
+
+
+def summarize():
+    """
+    Returns a dict mapping each phase with any timings in the ring buffer to a summary of them, holding the number of
+    timings, and the mean, max and each of PERCENTILES of their durations, in milliseconds.
+    """
+    durations = {phase: list() for phase in PHASES}
+    for phase, _, duration in get_samples():
+        durations[phase].append(duration * 1000)
+    summary = dict()
+    for phase, phase_durations in durations.items():
+        if not phase_durations:
+            continue
+        phase_durations.sort()
+        summary[phase] = {'count': len(phase_durations),
+                          'mean': sum(phase_durations) / len(phase_durations),
+                          'max': phase_durations[-1]}
+        for percentile in PERCENTILES:
+            index = min(len(phase_durations) - 1, len(phase_durations) * percentile // 100)
+            summary[phase][f'p{percentile}'] = phase_durations[index]
+    return summary
+
+
+def flush(output=PROFILER_OUTPUT):
+    """Writes every timing in the ring buffer to output + .csv, and their summary to output + .json."""
+    if not sample_count:
+        return
+    with open(f'{output}.csv', 'w') as f:
+        f.write('phase,start,duration\n')
+        f.writelines(f'{phase},{start_time},{duration}\n' for phase, start_time, duration in get_samples())
+    with open(f'{output}.json', 'w') as f:
+        json.dump(summarize(), f, indent=4)
+
+
+if enabled:
+    atexit.register(flush)
@@ -1,114 +1,124 @@
 import pygame as pg
 from copy import copy
-from time import sleep
+from functools import partial
+from weakref import WeakKeyDictionary
 
 import colors
+import profiler
+import timeline
 from config import TOP_LEFT_Y, TOP_LEFT_X, PLAY_HEIGHT, PLAY_LENGTH, TILE_SIZE, TILE_COLORS
 from game_elements.element_config_values import BOARD_LENGTH, BOARD_HEIGHT
-from rendering.window_renderer import MAIN_WINDOW
-from utility_functions import find_tiles_in_radius, tile_from_xy_coords
+from rendering.frame_compositor import mark_dirty
+from rendering import window_renderer
+from utility_functions import tile_from_xy_coords
 
 """
 Module that will handle all of the rendering logic for the game boards.
 """
 
-def render_game_board(board_template, tiles_to_highlight=None, highlight_color=colors.RED,
-                      targetable_tile_types=None):
-    """
-    Renders a game board based on the template passed in. If tiles_to_highlight is not None, this implies that this
-    function is being called to target certain tiles, usually in the case of a Player using an item or ability. In this
-    case, we highlight the passed-in tiles with highlight_color, but only if they are in targetable_tile_types.
-    """
-    tiles_to_highlight = tiles_to_highlight if tiles_to_highlight is not None else set()
-    for y in range(BOARD_HEIGHT):
-        for x in range(BOARD_LENGTH):
-            if (x, y) in tiles_to_highlight and board_template[y][x] in targetable_tile_types:
-                pg.draw.rect(MAIN_WINDOW, highlight_color,
-                             (TOP_LEFT_X + x * TILE_SIZE + 1 , TOP_LEFT_Y + y * TILE_SIZE + 1,
-                              TILE_SIZE - 2, TILE_SIZE - 2), 1)
-                continue
-            pg.draw.rect(MAIN_WINDOW, TILE_COLORS[board_template[y][x]],
-                         (TOP_LEFT_X + x * TILE_SIZE, TOP_LEFT_Y + y * TILE_SIZE, TILE_SIZE, TILE_SIZE), 0)
-    pg.draw.rect(MAIN_WINDOW, colors.WHITE,
-                 (TOP_LEFT_X - 4, TOP_LEFT_Y - 4, PLAY_LENGTH + 8, PLAY_HEIGHT + 8), 4)
-    pg.display.update((TOP_LEFT_X, TOP_LEFT_Y, PLAY_LENGTH, PLAY_HEIGHT))
-
-
-def highlight_adjacent_tiles(board_template, target_x, target_y, color=colors.BLACK):
-    """
-    Renders the game board with tiles adjacent to (target_x, target_y) highlighted. Obtains target tiles in pixel-
-    coordinate format, to be used by for collision detection when the player selects a target with the mouse.
-    """
-    tiles_to_highlight = list()
-    for i in [-1, 1]:
-        tiles_to_highlight.append((target_x + i, target_y))
-        tiles_to_highlight.append((target_x, target_y + i))
+# What is currently drawn on each tile of the board on screen, stored as (tile type, highlight color) and indexed by
+# y * BOARD_LENGTH + x, so that each render only has to repaint the tiles which have changed since the last one. None
+# means that nothing can be assumed about what is on screen, and the next render will repaint the whole board.
+rendered_tiles = None
+# Pre-rendered surfaces of the walls, doors and open tiles of each board, which never change, stored along with the
+# terrain they were built from. This is a WeakKeyDictionary so that each background is freed along with its board.
+board_backgrounds = WeakKeyDictionary()
+# Surfaces for each type of tile that is drawn on top of the background, and for the outline of each highlight color.
+tile_surfaces = dict()
+highlight_surfaces = dict()
 
-    render_game_board(board_template, tiles_to_highlight=set(tiles_to_highlight), highlight_color=color,
-                      targetable_tile_types={'O', 'E', 'R'})
-    return tiles_to_highlight
 
+def invalidate_rendered_board():
+    """Makes the next call to render_game_board() repaint the whole board, e.g. if something was drawn over it."""
+    global rendered_tiles
+    rendered_tiles = None
 
-def highlight_self(board_template, target_x, target_y, color=colors.BLACK):
-    """ Renders the game board with just the player highlighted. """
-    render_game_board(board_template, tiles_to_highlight={(target_x, target_y)}, highlight_color=color,
-                      targetable_tile_types={'P'})
-    return [(target_x, target_y)]
 
+def get_tile_surface(tile):
+    """Returns a surface filled with the color of the tile type, given as it's value in Board.grid."""
+    if tile not in tile_surfaces:
+        tile_surfaces[tile] = pg.Surface((TILE_SIZE, TILE_SIZE))
+        tile_surfaces[tile].fill(TILE_COLORS[chr(tile)])
+    return tile_surfaces[tile]
 
-def highlight_radius(board_template, target_x, target_y, radius, color=colors.BLACK):
-    """
-    Targets every open/trap tile on the board, and returns as a list of targets every tile directly adjacent to the
-    tile selected.
-    """
-    potential_tiles_to_highlight = find_tiles_in_radius(center_x=target_x, center_y=target_y, radius=radius)
-    tiles_to_highlight = [(x, y) for (x, y) in potential_tiles_to_highlight if board_template[y][x] in {'O', 'R'}]
-    render_game_board(board_template, tiles_to_highlight=set(tiles_to_highlight), highlight_color=color,
-                      targetable_tile_types={'O', 'R'})
-    return tiles_to_highlight
 
+def get_highlight_surface(color):
+    """Returns a transparent surface with the outline that is drawn around a highlighted tile."""
+    if color not in highlight_surfaces:
+        highlight_surfaces[color] = pg.Surface((TILE_SIZE, TILE_SIZE), pg.SRCALPHA)
+        pg.draw.rect(highlight_surfaces[color], color, (1, 1, TILE_SIZE - 2, TILE_SIZE - 2), 1)
+    return highlight_surfaces[color]
 
-def highlight_enemies_and_walls_directly_ahead(board_template, target_x, target_y, color=colors.BLACK):
+
+def get_board_background(board):
+    """
+    Returns the surface of the parts of the board which never change, i.e. the walls, doors and open tiles underneath
+    everything else. This is built the first time the board is rendered, and only rebuilt if the terrain changes.
     """
-    Targets the first enemy or wall to appear on the same x- or y-axis as the target in each cardinal direction,
-    but is stopped when hitting a non-open tile.
+    terrain = bytes(board.occupancy.terrain)
+    background, built_from = board_backgrounds.get(board, (None, None))
+    if built_from != terrain:
+        background = pg.Surface((PLAY_LENGTH, PLAY_HEIGHT))
+        background.blits([(get_tile_surface(tile), ((i % BOARD_LENGTH) * TILE_SIZE, (i // BOARD_LENGTH) * TILE_SIZE))
+                          for i, tile in enumerate(terrain)], doreturn=False)
+        board_backgrounds[board] = (background, terrain)
+    return background
+
+
+@profiler.timed('render')
+def render_game_board(board, tiles_to_highlight=None, highlight_color=colors.RED, targetable_tile_types=None):
     """
-    tiles_to_highlight = list()
-    for direction in [1, -1]:
-        for j in range(1, BOARD_HEIGHT):
-            if board_template[target_y + j*direction][target_x] == 'E':
-                tiles_to_highlight.append((target_x, target_y + j * direction))
-                break
-            elif board_template[target_y + j*direction][target_x] in {'X', 'T', 'D'}:
-                tiles_to_highlight.append((target_x, target_y + (j - 1) * direction ))
-                break
-        for j in range(1, BOARD_LENGTH):
-            if board_template[target_y][target_x + j*direction] == 'E':
-                tiles_to_highlight.append((target_x + j * direction, target_y))
-                break
-            elif board_template[target_y][target_x + j*direction] in {'X', 'T', 'D'}:
-                tiles_to_highlight.append((target_x + (j - 1) * direction, target_y))
-                break
-    render_game_board(board_template, tiles_to_highlight=set(tiles_to_highlight), highlight_color=color,
-                      targetable_tile_types={'O', 'E', 'T', 'D'})
-    return tiles_to_highlight
-
-
-def highlight_in_cross_pattern(board_template, target_x, target_y, color=colors.BLACK):
-    """ Highlights every tile in a cross patter around (target_x, target_y), stopping when hitting a wall or door. """
-    tiles_to_highlight = list()
-    for direction in [1, -1]:
-        for j in range(BOARD_HEIGHT):
-           if board_template[target_y + j*direction][target_x] in {'X', 'D'}:
-                break
-           tiles_to_highlight.append((target_x, target_y + j*direction))
-        for j in range(BOARD_LENGTH):
-            if board_template[target_y][target_x  + j*direction] in {'X','D'}:
-                break
-            tiles_to_highlight.append((target_x + j*direction, target_y))
-    render_game_board(board_template, tiles_to_highlight=set(tiles_to_highlight), highlight_color=color,
-                      targetable_tile_types={'O', 'E', 'R', 'T', 'D'})
-    return tiles_to_highlight
+    Renders the game board passed in. If tiles_to_highlight is not None, this implies that this function is being called
+    to target certain tiles, usually in the case of a Player using an item or ability. In this case, we highlight the
+    passed-in tiles with highlight_color, but only if they are in targetable_tile_types.
+    Only the tiles which look different from the last time the board was rendered are repainted and marked to be
+    pushed to the display, which after a normal turn is just the few tiles that characters have moved between. Each of those is
+    repainted by copying the tile from the board's background, and then drawing whatever is on top of it, all in a
+    single call to blits().
+    """
+    global rendered_tiles
+    highlighted_tiles = {y * BOARD_LENGTH + x for (x, y) in tiles_to_highlight} if tiles_to_highlight else set()
+    targetable_tiles = {ord(tile) for tile in targetable_tile_types} if targetable_tile_types else set()
+    background = get_board_background(board)
+    terrain = board.occupancy.terrain
+    full_render = rendered_tiles is None
+    blit_sequence = list()
+    dirty_rects = list()
+    if full_render:
+        rendered_tiles = [None] * (BOARD_LENGTH * BOARD_HEIGHT)
+        blit_sequence.append((background, (TOP_LEFT_X, TOP_LEFT_Y)))
+    for i, tile in enumerate(board.grid):
+        highlighted = i in highlighted_tiles and tile in targetable_tiles
+        tile_state = (tile, highlight_color if highlighted else None)
+        if rendered_tiles[i] == tile_state:
+            continue
+        rendered_tiles[i] = tile_state
+        background_rect = pg.Rect((i % BOARD_LENGTH) * TILE_SIZE, (i // BOARD_LENGTH) * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+        tile_rect = background_rect.move(TOP_LEFT_X, TOP_LEFT_Y)
+        if not full_render:
+            blit_sequence.append((background, tile_rect, background_rect))
+            dirty_rects.append(tile_rect)
+        if tile != terrain[i]:
+            blit_sequence.append((get_tile_surface(tile), tile_rect))
+        if highlighted:
+            blit_sequence.append((get_highlight_surface(highlight_color), tile_rect))
+    window_renderer.MAIN_WINDOW.blits(blit_sequence, doreturn=False)
+    if full_render:
+        pg.draw.rect(window_renderer.MAIN_WINDOW, colors.WHITE,
+                     (TOP_LEFT_X - 4, TOP_LEFT_Y - 4, PLAY_LENGTH + 8, PLAY_HEIGHT + 8), 4)
+        mark_dirty((TOP_LEFT_X - 4, TOP_LEFT_Y - 4, PLAY_LENGTH + 8, PLAY_HEIGHT + 8))
+    else:
+        for tile_rect in dirty_rects:
+            mark_dirty(tile_rect)
+
+
+def highlight_tiles(board, tiles_to_highlight, targetable_tile_types, color=colors.BLACK):
+    """
+    Renders the game board with the tiles an ability can be aimed at highlighted, as found by one of the targeting
+    functions in game_elements.targeting.
+    """
+    render_game_board(board, tiles_to_highlight=set(tiles_to_highlight), highlight_color=color,
+                      targetable_tile_types=targetable_tile_types)
 
 
 def animate_enemy_death(enemy_x, enemy_y):
@@ -123,6 +133,8 @@ def animate_enemy_death(enemy_x, enemy_y):
              This is done so that the animation doesn't end prematurely when one of the hues reaches ~173 before the
              other two, and to allow the loop to iterate fewer times as the visual difference of values from
              170-175 is largely negligible.
+    Each color is drawn as a separate step on the 'board' channel of the timeline, 0.1 seconds apart, so the game
+    doesn't stop while the enemy fades out.
     """
     new_color = copy(TILE_COLORS['E'])
     enemy_rect = pg.Rect(tile_from_xy_coords(x=enemy_x, y=enemy_y))
@@ -131,6 +143,18 @@ def animate_enemy_death(enemy_x, enemy_y):
         new_color = (int((new_color[0] + 173) / 2),
                      int((new_color[1] + 173) / 2),
                      int((new_color[2] + 173) / 2))
-        MAIN_WINDOW.fill(rect=enemy_rect, color=new_color)
-        pg.display.update(enemy_rect)
-        sleep(0.1)
+        timeline.schedule(partial(fill_tile, enemy_rect, new_color), duration=0.1, channel='board')
+    # The board may have been rendered since the enemy died, so make sure that the next render paints over whatever
+    # the animation has left on the tile.
+    timeline.schedule(partial(forget_rendered_tile, enemy_x, enemy_y), channel='board')
+
+
+def fill_tile(tile_rect, color):
+    window_renderer.MAIN_WINDOW.fill(rect=tile_rect, color=color)
+    mark_dirty(tile_rect)
+
+
+def forget_rendered_tile(x, y):
+    """Makes the next call to render_game_board() repaint the tile at (x, y)."""
+    if rendered_tiles is not None:
+        rendered_tiles[y * BOARD_LENGTH + x] = None
@@ -0,0 +1,70 @@
+import pygame as pg
+
+import profiler
+from config import WINDOW_LENGTH, WINDOW_HEIGHT
+
+"""
+Module which collects every area of the window that the renderers have drawn on during a frame, and pushes them all to
+the display together with a single call to pg.display.update() when the frame is presented. Renderers only ever call
+mark_dirty(), and present() is called once at the end of each frame, or before any pause in which the player should
+be able to see what has been drawn so far, e.g. between the steps of an animation.
+"""
+
+# pg.Rect's of every area drawn on since the last present.
+dirty_rects = list()
+# Running totals over every frame presented so far, and the same values for just the last frame.
+frame_stats = {'frames': 0, 'rects_marked': 0, 'rects_presented': 0, 'area_presented': 0}
+last_frame_stats = {'rects_marked': 0, 'rects_presented': 0, 'area_presented': 0}
+
+
+def mark_dirty(rect):
+    """Records that rect has been drawn on, so that it is pushed to the display at the end of the frame."""
+    dirty_rects.append(pg.Rect(rect))
+
+
+def mark_window_dirty():
+    """Records that the whole window needs to be pushed to the display."""
+    mark_dirty((0, 0, WINDOW_LENGTH, WINDOW_HEIGHT))
+
+
+def merge_rects(rects):
+    """
+    Merges every group of overlapping rects into the single rect that bounds them, so that areas which are drawn on
+    several times in a frame, e.g. a panel and the tooltip on top of it, are only pushed to the display once.
+    """
+    merged = list()
+    for rect in rects:
+        rect = rect.copy()
+        overlap = rect.collidelist(merged)
+        while overlap != -1:
+            rect.union_ip(merged.pop(overlap))
+            overlap = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+@profiler.timed('present')
+def present():
+    """Pushes every area drawn on since the last present to the display, with a single call to pg.display.update()."""
+    if not dirty_rects:
+        return
+    merged = merge_rects(dirty_rects)
+    if pg.display.get_surface() is not None:  # In headless mode everything is just left drawn on MAIN_WINDOW
+        pg.display.update(merged)
+    last_frame_stats['rects_marked'] = len(dirty_rects)
+    last_frame_stats['rects_presented'] = len(merged)
+    last_frame_stats['area_presented'] = sum(rect.width * rect.height for rect in merged)
+    frame_stats['frames'] += 1
+    for stat in last_frame_stats:
+        frame_stats[stat] += last_frame_stats[stat]
+    dirty_rects.clear()
+
+
+def get_stats():
+    """Returns the number of frames presented, and how many rects and how much area were pushed per frame."""
+    stats = dict(frame_stats)
+    stats['last_frame'] = dict(last_frame_stats)
+    frames = max(frame_stats['frames'], 1)
+    stats['average_rects_presented'] = frame_stats['rects_presented'] / frames
+    stats['average_area_presented'] = frame_stats['area_presented'] / frames
+    return stats
@@ -3,7 +3,10 @@ import pygame as pg
 import colors
 
 from config import WINDOW_HEIGHT, WINDOW_LENGTH, TOP_LEFT_X, SIDE_PANEL_HEIGHT, SIDE_PANEL_LENGTH
-from rendering.window_renderer import MAIN_WINDOW, FONT_15, FONT_20, FONT_30, FONT_CALIBRI_12
+from rendering.frame_compositor import mark_dirty
+from rendering.text_cache import render_text
+from rendering import window_renderer
+from rendering.window_renderer import default_font, calibri_font
 from utility_functions import parse_description
 
 """
@@ -31,8 +34,9 @@ PORTRAIT_HEIGHT = int(0.3 * F_WINDOW_HEIGHT)
 
 def render_misc_panel():
     """Draws the main panel rectangle."""
-    pg.draw.rect(MAIN_WINDOW, colors.WHITE,
+    pg.draw.rect(window_renderer.MAIN_WINDOW, colors.WHITE,
                  (PANEL_TOP_LEFT_X, PANEL_TOP_LEFT_Y, SIDE_PANEL_LENGTH, SIDE_PANEL_HEIGHT), 2)
+    mark_dirty((PANEL_TOP_LEFT_X, PANEL_TOP_LEFT_Y, SIDE_PANEL_LENGTH, SIDE_PANEL_HEIGHT))
     render_focus_window()
 
 def render_focus_window(focus_info=None, refresh=False):
@@ -45,10 +49,12 @@ def render_focus_window(focus_info=None, refresh=False):
     :return: n/a
     """
     f_window_rect = (F_WINDOW_TOP_LEFT_X, F_WINDOW_TOP_LEFT_Y, F_WINDOW_LENGTH, F_WINDOW_HEIGHT)
-    pg.draw.rect(MAIN_WINDOW, colors.WHITE, f_window_rect, 1)
+    pg.draw.rect(window_renderer.MAIN_WINDOW, colors.WHITE, f_window_rect, 1)
+    mark_dirty(f_window_rect)
     if refresh:
-        MAIN_WINDOW.fill(colors.BLACK,
-                         rect=(f_window_rect[0] + 1, f_window_rect[1] + 1, f_window_rect[2] - 2, f_window_rect[3] - 2))
+        window_renderer.MAIN_WINDOW.fill(colors.BLACK,
+                                         rect=(f_window_rect[0] + 1, f_window_rect[1] + 1,
+                                               f_window_rect[2] - 2, f_window_rect[3] - 2))
     if focus_info is not None:
         if focus_info['type'] == 'enemy':
             render_enemy_info(focus_info)
@@ -59,7 +65,7 @@ def render_enemy_info(enemy_dict):
     :param enemy_dict: A dict with all of the enemy details needed to display.
     :return: n/a
     """
-    pg.draw.rect(MAIN_WINDOW, colors.WHITE,
+    pg.draw.rect(window_renderer.MAIN_WINDOW, colors.WHITE,
                  (PORTRAIT_TOP_LEFT_X, PORTRAIT_TOP_LEFT_Y, PORTRAIT_LENGTH, PORTRAIT_HEIGHT), 1)
 
     enemy_hp_percentage = float(enemy_dict['hp'][0]) / float(enemy_dict['hp'][1])
@@ -72,15 +78,17 @@ def render_enemy_info(enemy_dict):
     else:
         health_text = 'This creature is on the brink of death.'
 
-    enemy_name = FONT_20.render(enemy_dict['name'], 1, colors.WHITE)
+    enemy_name = render_text(default_font(20), enemy_dict['name'], colors.WHITE)
     parsed_flavour_text = parse_description(enemy_dict['flavour_text'], char_limit=55)
-    flavour_text = [FONT_15.render(line, 1, colors.WHITE) for line in parsed_flavour_text]
-    health_indicator = FONT_15.render(health_text, 1, colors.WHITE)
+    flavour_text = [render_text(default_font(15), line, colors.WHITE) for line in parsed_flavour_text]
+    health_indicator = render_text(default_font(15), health_text, colors.WHITE)
 
-    MAIN_WINDOW.blit(enemy_name, (PORTRAIT_TOP_LEFT_X + PORTRAIT_LENGTH + 5, PORTRAIT_TOP_LEFT_Y))
+    window_renderer.MAIN_WINDOW.blit(enemy_name, (PORTRAIT_TOP_LEFT_X + PORTRAIT_LENGTH + 5, PORTRAIT_TOP_LEFT_Y))
     for i, string in enumerate(flavour_text):
-        MAIN_WINDOW.blit(string, (PORTRAIT_TOP_LEFT_X, PORTRAIT_TOP_LEFT_Y + PORTRAIT_HEIGHT + 3 + 16 * i))
-    MAIN_WINDOW.blit(health_indicator, (PORTRAIT_TOP_LEFT_X, PORTRAIT_TOP_LEFT_Y + PORTRAIT_HEIGHT + 45 + 16 * i))
+        window_renderer.MAIN_WINDOW.blit(string, (PORTRAIT_TOP_LEFT_X,
+                                                  PORTRAIT_TOP_LEFT_Y + PORTRAIT_HEIGHT + 3 + 16 * i))
+    window_renderer.MAIN_WINDOW.blit(health_indicator, (PORTRAIT_TOP_LEFT_X,
+                                                        PORTRAIT_TOP_LEFT_Y + PORTRAIT_HEIGHT + 45 + 16 * i))
     if len(enemy_dict['buffs']) + len(enemy_dict['debuffs']) > 0:
         render_enemy_statuses(buffs=enemy_dict['buffs'], debuffs=enemy_dict['debuffs'])
 
@@ -91,15 +99,15 @@ def render_enemy_statuses(buffs, debuffs):
     buff_top_left_y = PORTRAIT_TOP_LEFT_Y + 25
     for i, buff in enumerate(buffs):
         buff_indicator = pg.Rect((i*17) + buff_top_left_x, buff_top_left_y, 15, 15)
-        buff_turns_left = FONT_CALIBRI_12.render(str(buff['turns_left']), 1, colors.YELLOW)
-        MAIN_WINDOW.blit(buff_turns_left, (buff_indicator[0] + 2, buff_indicator[1] + 2))
-        pg.draw.rect(MAIN_WINDOW, colors.GREEN, buff_indicator, 1)
+        buff_turns_left = render_text(calibri_font(12), str(buff['turns_left']), colors.YELLOW)
+        window_renderer.MAIN_WINDOW.blit(buff_turns_left, (buff_indicator[0] + 2, buff_indicator[1] + 2))
+        pg.draw.rect(window_renderer.MAIN_WINDOW, colors.GREEN, buff_indicator, 1)
 
     debuff_top_left_x = buff_top_left_x
     debuff_top_left_y = buff_top_left_y + 17
     for i, debuff in enumerate(debuffs):
         debuff_indicator = pg.Rect((i*17) + debuff_top_left_x, debuff_top_left_y, 15, 15)
-        debuff_turns_left = FONT_CALIBRI_12.render(str(debuff['turns_left']), 1, colors.YELLOW)
-        MAIN_WINDOW.blit(debuff_turns_left, (debuff_indicator[0] + 2, debuff_indicator[1] + 2))
-        pg.draw.rect(MAIN_WINDOW, colors.RED, debuff_indicator, 1)
+        debuff_turns_left = render_text(calibri_font(12), str(debuff['turns_left']), colors.YELLOW)
+        window_renderer.MAIN_WINDOW.blit(debuff_turns_left, (debuff_indicator[0] + 2, debuff_indicator[1] + 2))
+        pg.draw.rect(window_renderer.MAIN_WINDOW, colors.RED, debuff_indicator, 1)
 
@@ -4,7 +4,10 @@ import colors
 
 from config import SIDE_PANEL_HEIGHT, SIDE_PANEL_LENGTH, PLAYER_PANEL_TOP_LEFT_X, PLAYER_PANEL_TOP_LEFT_Y, font_SIL
 from game_elements.element_config_values import INVENTORY_LIMIT, INVENTORY_ROW_LENGTH
-from rendering.window_renderer import MAIN_WINDOW, FONT_15, FONT_20, FONT_30, FONT_CALIBRI_12, draw_detail_window
+from rendering.frame_compositor import mark_dirty
+from rendering.text_cache import get_font, render_text
+from rendering import window_renderer
+from rendering.window_renderer import default_font, calibri_font, draw_detail_window
 from utility_functions import parse_description
 
 """
@@ -15,6 +18,11 @@ mouseovers.
 The following are the dimensions for all the main rectangles drawn in this panel.
 """
 
+#### MAIN PANEL ####
+# Every drawing function marks the whole panel as needing to be pushed to the display, since everything they draw is
+# inside it and the frame compositor merges them into a single rect anyway.
+PANEL_RECT = (PLAYER_PANEL_TOP_LEFT_X, PLAYER_PANEL_TOP_LEFT_Y, SIDE_PANEL_LENGTH, SIDE_PANEL_HEIGHT)
+
 #### INVENTORY ####
 INVENTORY_LENGTH = int(0.95 * SIDE_PANEL_LENGTH)
 INVENTORY_TOP_LEFT_X = int((SIDE_PANEL_LENGTH - INVENTORY_LENGTH) * 0.5) + PLAYER_PANEL_TOP_LEFT_X
@@ -51,12 +59,13 @@ def draw_player_panel(player_name, refresh=False):
     :param player_dict:
     :return: panel_rect, the rect that makes up the main panel
     """
+    mark_dirty(PANEL_RECT)
     panel_rect = pg.Rect(PLAYER_PANEL_TOP_LEFT_X, PLAYER_PANEL_TOP_LEFT_Y, SIDE_PANEL_LENGTH, SIDE_PANEL_HEIGHT)
     if refresh:
-        MAIN_WINDOW.fill(colors.BLACK, panel_rect)
-    pg.draw.rect(MAIN_WINDOW, colors.WHITE, panel_rect, 2)
-    player_name = FONT_30.render(player_name, 1, colors.WHITE)
-    MAIN_WINDOW.blit(player_name, (PLAYER_PANEL_TOP_LEFT_X + 5, PLAYER_PANEL_TOP_LEFT_Y + 5))
+        window_renderer.MAIN_WINDOW.fill(colors.BLACK, panel_rect)
+    pg.draw.rect(window_renderer.MAIN_WINDOW, colors.WHITE, panel_rect, 2)
+    player_name = render_text(default_font(30), player_name, colors.WHITE)
+    window_renderer.MAIN_WINDOW.blit(player_name, (PLAYER_PANEL_TOP_LEFT_X + 5, PLAYER_PANEL_TOP_LEFT_Y + 5))
 
     return panel_rect
 
@@ -67,31 +76,33 @@ def draw_active_abilities(abilities, refresh=False, skill_points=0):
     draw the number of turns left in the cooldown on the tile. If skill_points > 0, then draw a message telling
     the player that they have skill points to spend.
     """
+    mark_dirty(PANEL_RECT)
     abilities_rect = pg.Rect(ABILITIES_TOP_LEFT_X, ABILITIES_TOP_LEFT_Y, ABILITY_TILE_LENGTH * 5, ABILITY_TILE_LENGTH)
     if refresh:
-        MAIN_WINDOW.fill(color=colors.BLACK, rect=abilities_rect)
+        window_renderer.MAIN_WINDOW.fill(color=colors.BLACK, rect=abilities_rect)
     while len(abilities) < 5:  # Pad the abilities list with None until it is of length 5
         abilities.append(None)
-    abilities_label = FONT_20.render('ABILITIES', 1, colors.WHITE)
-    MAIN_WINDOW.blit(abilities_label, (ABILITIES_TOP_LEFT_X, ABILITIES_TOP_LEFT_Y - 25))
+    abilities_label = render_text(default_font(20), 'ABILITIES', colors.WHITE)
+    window_renderer.MAIN_WINDOW.blit(abilities_label, (ABILITIES_TOP_LEFT_X, ABILITIES_TOP_LEFT_Y - 25))
     ability_tiles = list()
     for i, ability in enumerate(abilities):
         ability_tile = pg.Rect((i * ABILITY_TILE_LENGTH) + ABILITIES_TOP_LEFT_X, ABILITIES_TOP_LEFT_Y,
                                ABILITY_TILE_LENGTH, ABILITY_TILE_LENGTH)
-        pg.draw.rect(MAIN_WINDOW, colors.GREY, ability_tile, 1)
+        pg.draw.rect(window_renderer.MAIN_WINDOW, colors.GREY, ability_tile, 1)
         if ability is not None:
             ability_tiles.append(ability_tile)
             populate_ability_tile(ability, ability_tile)
 
-        ability_number = FONT_20.render(str(i + 1), 1, colors.YELLOW)
-        MAIN_WINDOW.blit(ability_number, (ABILITIES_TOP_LEFT_X + (1 + i) * ABILITY_TILE_LENGTH - 20,
-                                          ABILITIES_TOP_LEFT_Y + ABILITY_TILE_LENGTH - 30))
+        ability_number = render_text(default_font(20), str(i + 1), colors.YELLOW)
+        window_renderer.MAIN_WINDOW.blit(ability_number, (ABILITIES_TOP_LEFT_X + (1 + i) * ABILITY_TILE_LENGTH - 20,
+                                                          ABILITIES_TOP_LEFT_Y + ABILITY_TILE_LENGTH - 30))
 
     if skill_points > 0:
-        skill_point_message = FONT_20.render(f"{skill_points} unspent skill point{'s' if skill_points > 1 else ''}, "
-                                             f"press T to allocate", 1,
-                                             colors.YELLOW)
-        MAIN_WINDOW.blit(skill_point_message, (ABILITIES_TOP_LEFT_X, ABILITIES_TOP_LEFT_Y + 1.1 * ABILITY_TILE_LENGTH))
+        skill_point_message = render_text(default_font(20),
+                                          f"{skill_points} unspent skill point{'s' if skill_points > 1 else ''}, "
+                                          f"press T to allocate", colors.YELLOW)
+        window_renderer.MAIN_WINDOW.blit(skill_point_message, (ABILITIES_TOP_LEFT_X,
+                                                               ABILITIES_TOP_LEFT_Y + 1.1 * ABILITY_TILE_LENGTH))
 
     return ability_tiles, abilities_rect
 
@@ -99,14 +110,14 @@ def draw_active_abilities(abilities, refresh=False, skill_points=0):
 def populate_ability_tile(ability, ability_tile):
     """Adds color and cooldown timer to ability tile depending on if the ability is currently on cooldown."""
     if ability['turns_left'] > 0:  # Check if the ability is currently on cooldown
-        turns_left_label = FONT_30.render(str(ability['turns_left']), 1, colors.WHITE)
-        MAIN_WINDOW.fill(color=colors.DARK_BLUE, rect=(ability_tile[0] + 1, ability_tile[1] + 1,
-                                                       ability_tile[2] - 2, ability_tile[3] - 2))
-        MAIN_WINDOW.blit(turns_left_label, (ability_tile[0] + (ABILITY_TILE_LENGTH * 0.4),
-                                            ability_tile[1] + (ABILITY_TILE_LENGTH * 0.2)))
+        turns_left_label = render_text(default_font(30), str(ability['turns_left']), colors.WHITE)
+        window_renderer.MAIN_WINDOW.fill(color=colors.DARK_BLUE, rect=(ability_tile[0] + 1, ability_tile[1] + 1,
+                                                                       ability_tile[2] - 2, ability_tile[3] - 2))
+        window_renderer.MAIN_WINDOW.blit(turns_left_label, (ability_tile[0] + (ABILITY_TILE_LENGTH * 0.4),
+                                                            ability_tile[1] + (ABILITY_TILE_LENGTH * 0.2)))
     else:
-        MAIN_WINDOW.fill(color=colors.BLUE, rect=(ability_tile[0] + 1, ability_tile[1] + 1,
-                                                  ability_tile[2] - 2, ability_tile[3] - 2))
+        window_renderer.MAIN_WINDOW.fill(color=colors.BLUE, rect=(ability_tile[0] + 1, ability_tile[1] + 1,
+                                                                  ability_tile[2] - 2, ability_tile[3] - 2))
 
 
 def draw_level_and_experience(level, profession, experience, refresh=False):
@@ -118,18 +129,19 @@ def draw_level_and_experience(level, profession, experience, refresh=False):
     :param refresh: A boolean which determines if the area around this info is filled to black, as a refresh.
     :return: The Rect enclosing all of the level and experience info.
     """
+    mark_dirty(PANEL_RECT)
     level_and_exp_rect = pg.Rect(LEVEL_EXP_TOP_LEFT_X, LEVEL_EXP_TOP_LEFT_Y, LEVEL_EXP_LENGTH, LEVEL_EXP_HEIGHT)
     if refresh:
-        MAIN_WINDOW.fill(colors.BLACK, level_and_exp_rect)
-    level_indicator = FONT_20.render(f"LEVEL {level} {profession.upper()}", 1, colors.WHITE)
-    MAIN_WINDOW.blit(level_indicator, (LEVEL_EXP_TOP_LEFT_X, LEVEL_EXP_TOP_LEFT_Y))
-    pg.draw.rect(MAIN_WINDOW, colors.GREY,
+        window_renderer.MAIN_WINDOW.fill(colors.BLACK, level_and_exp_rect)
+    level_indicator = render_text(default_font(20), f"LEVEL {level} {profession.upper()}", colors.WHITE)
+    window_renderer.MAIN_WINDOW.blit(level_indicator, (LEVEL_EXP_TOP_LEFT_X, LEVEL_EXP_TOP_LEFT_Y))
+    pg.draw.rect(window_renderer.MAIN_WINDOW, colors.GREY,
                  (LEVEL_EXP_TOP_LEFT_X, LEVEL_EXP_TOP_LEFT_Y + 24, LEVEL_EXP_LENGTH, LEVEL_EXP_HEIGHT - 27), 1)
 
     exp_percent = experience[0] / experience[1]
     current_exp_length = int(exp_percent * (SIDE_PANEL_LENGTH - 18 - PLAYER_PANEL_TOP_LEFT_X))
     if current_exp_length > 0:
-        pg.draw.rect(MAIN_WINDOW, colors.PALE_YELLOW,
+        pg.draw.rect(window_renderer.MAIN_WINDOW, colors.PALE_YELLOW,
                      (LEVEL_EXP_TOP_LEFT_X, LEVEL_EXP_TOP_LEFT_Y + 26, current_exp_length, 6), 0)
 
     return level_and_exp_rect
@@ -144,9 +156,10 @@ def draw_attributes(attributes, level_up_points, refresh=False):
     :param refresh: A boolean determining if the area around this info is filled to black, as a refresh.
     :return: The Rect object enclosing the attributes.
     """
+    mark_dirty(PANEL_RECT)
     attributes_rect = pg.Rect(PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 95, 150, 180)
     if refresh:
-        MAIN_WINDOW.fill(colors.BLACK, attributes_rect)
+        window_renderer.MAIN_WINDOW.fill(colors.BLACK, attributes_rect)
     coord_mapping = {
         'str': (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 120),
         'dex': (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 145),
@@ -155,14 +168,14 @@ def draw_attributes(attributes, level_up_points, refresh=False):
         'vit': (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 220),
         'wis': (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 245)
     }
-    font = pg.font.Font(font_SIL, 20)
+    font = get_font(font_SIL, 20)
     for stat in coord_mapping:
         # Render the stat names and values separately, so that they can be properly aligned
         # TODO: Add logic to color stat values differently based on buffs/debuffs
-        stat_name = font.render(f"{stat.upper()}: ", 1, colors.WHITE)
-        stat_value = font.render(str(attributes[stat]), 1, colors.WHITE)
-        MAIN_WINDOW.blit(stat_name, coord_mapping[stat])
-        MAIN_WINDOW.blit(stat_value, (coord_mapping[stat][0] + 50, coord_mapping[stat][1]))
+        stat_name = render_text(font, f"{stat.upper()}: ", colors.WHITE)
+        stat_value = render_text(font, str(attributes[stat]), colors.WHITE)
+        window_renderer.MAIN_WINDOW.blit(stat_name, coord_mapping[stat])
+        window_renderer.MAIN_WINDOW.blit(stat_value, (coord_mapping[stat][0] + 50, coord_mapping[stat][1]))
 
     if level_up_points > 0:
         draw_attribute_level_up_buttons(level_up_points)
@@ -181,16 +194,17 @@ def draw_attribute_level_up_buttons(level_up_points, return_only=False):
     top_left_x = PLAYER_PANEL_TOP_LEFT_X + 85
     top_left_y = PLAYER_PANEL_TOP_LEFT_Y + 125
     if not return_only:
-        level_up_label = FONT_20.render(f"Points Available: {level_up_points}", 1, colors.GREY)
-        MAIN_WINDOW.blit(level_up_label, (top_left_x - 75, top_left_y - 27))
+        mark_dirty(PANEL_RECT)
+        level_up_label = render_text(default_font(20), f"Points Available: {level_up_points}", colors.GREY)
+        window_renderer.MAIN_WINDOW.blit(level_up_label, (top_left_x - 75, top_left_y - 27))
     level_up_buttons = list()
-    button_label = FONT_20.render("+", 1, colors.WHITE)
+    button_label = render_text(default_font(20), "+", colors.WHITE)
     for i in range(6):
         button_rect = pg.Rect(top_left_x, top_left_y + (i * 25), 20, 20)
         level_up_buttons.append(button_rect)
         if not return_only:
-            MAIN_WINDOW.fill(color=colors.DARK_RED, rect=button_rect)
-            MAIN_WINDOW.blit(button_label, (button_rect[0] + 4, button_rect[1]  - 5))
+            window_renderer.MAIN_WINDOW.fill(color=colors.DARK_RED, rect=button_rect)
+            window_renderer.MAIN_WINDOW.blit(button_label, (button_rect[0] + 4, button_rect[1]  - 5))
 
     return level_up_buttons
 
@@ -203,13 +217,14 @@ def draw_hp_mp(hp, mp, refresh=False):
     :param refresh: As above.
     :return: The Rect object that encloses hp and mp.
     """
+    mark_dirty(PANEL_RECT)
     hp_mp_rect = pg.Rect(PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 40, 100, 50)
     if refresh:
-        MAIN_WINDOW.fill(colors.BLACK, hp_mp_rect)
-    hp_indicator = FONT_20.render("HP: {0} / {1}".format(hp[0], hp[1]), 1, colors.RED)
-    mp_indicator = FONT_20.render("MP: {0} / {1}".format(mp[0], mp[1]), 1, colors.BLUE)
-    MAIN_WINDOW.blit(hp_indicator, (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 40))
-    MAIN_WINDOW.blit(mp_indicator, (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 65))
+        window_renderer.MAIN_WINDOW.fill(colors.BLACK, hp_mp_rect)
+    hp_indicator = render_text(default_font(20), "HP: {0} / {1}".format(hp[0], hp[1]), colors.RED)
+    mp_indicator = render_text(default_font(20), "MP: {0} / {1}".format(mp[0], mp[1]), colors.BLUE)
+    window_renderer.MAIN_WINDOW.blit(hp_indicator, (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 40))
+    window_renderer.MAIN_WINDOW.blit(mp_indicator, (PLAYER_PANEL_TOP_LEFT_X + 10, PLAYER_PANEL_TOP_LEFT_Y + 65))
     return hp_mp_rect
 
 
@@ -222,25 +237,26 @@ def draw_status(buffs, debuffs, refresh=False):
     :param refresh: Same as above.
     :return: Lists of each rect for the buff and debuff indicators.
     """
+    mark_dirty(PANEL_RECT)
     status_rect = pg.Rect(PLAYER_PANEL_TOP_LEFT_X + 130, PLAYER_PANEL_TOP_LEFT_Y + 40, 200, 50)
     if refresh:
-        MAIN_WINDOW.fill(colors.BLACK, status_rect)
+        window_renderer.MAIN_WINDOW.fill(colors.BLACK, status_rect)
     buff_rects = list()
     debuff_rects = list()
 
     for i, buff in enumerate(buffs):
         buff_indicator = pg.Rect((i*17) + PLAYER_PANEL_TOP_LEFT_X + 130, PLAYER_PANEL_TOP_LEFT_Y + 40, 15, 15)
         buff_rects.append(buff_indicator)
-        buff_turns_left = FONT_CALIBRI_12.render(str(buff['turns_left']), 1, colors.YELLOW)
-        MAIN_WINDOW.blit(buff_turns_left, (buff_indicator[0] + 2, buff_indicator[1] + 2))
-        pg.draw.rect(MAIN_WINDOW, colors.GREEN, buff_indicator, 1)
+        buff_turns_left = render_text(calibri_font(12), str(buff['turns_left']), colors.YELLOW)
+        window_renderer.MAIN_WINDOW.blit(buff_turns_left, (buff_indicator[0] + 2, buff_indicator[1] + 2))
+        pg.draw.rect(window_renderer.MAIN_WINDOW, colors.GREEN, buff_indicator, 1)
 
     for i, debuff in enumerate(debuffs):
         debuff_indicator = pg.Rect((i*17) + PLAYER_PANEL_TOP_LEFT_X + 130, PLAYER_PANEL_TOP_LEFT_Y + 57, 15, 15)
         debuff_rects.append(debuff_indicator)
-        debuff_turns_left = FONT_CALIBRI_12.render(str(debuff['turns_left']), 1, colors.YELLOW)
-        MAIN_WINDOW.blit(debuff_turns_left, (debuff_indicator[0] + 2, debuff_indicator[1] + 2))
-        pg.draw.rect(MAIN_WINDOW, colors.RED, debuff_indicator, 1)
+        debuff_turns_left = render_text(calibri_font(12), str(debuff['turns_left']), colors.YELLOW)
+        window_renderer.MAIN_WINDOW.blit(debuff_turns_left, (debuff_indicator[0] + 2, debuff_indicator[1] + 2))
+        pg.draw.rect(window_renderer.MAIN_WINDOW, colors.RED, debuff_indicator, 1)
 
     return status_rect, buff_rects, debuff_rects
 
@@ -253,9 +269,10 @@ def draw_conditions(conditions, refresh=False):
     :param refresh: As above.
     :return: The Rect object that encloses the conditions.
     """
+    mark_dirty(PANEL_RECT)
     condition_rect = (PLAYER_PANEL_TOP_LEFT_X + SIDE_PANEL_LENGTH - 90, PLAYER_PANEL_TOP_LEFT_Y + 10, 80, 90)
     if refresh:
-        MAIN_WINDOW.fill(colors.BLACK, condition_rect)
+        window_renderer.MAIN_WINDOW.fill(colors.BLACK, condition_rect)
     condition_y_mapping = {'thirsty': 10, 'hungry': 35, 'tired': 60}
     for condition in conditions:
         # Condition names are only rendered if the level is below 50%
@@ -272,9 +289,10 @@ def draw_conditions(conditions, refresh=False):
                 color = colors.ORANGE
             else:
                 color = colors.YELLOW
-            condition_indicator = FONT_20.render(condition.upper(), 1, color)
-            MAIN_WINDOW.blit(condition_indicator, (PLAYER_PANEL_TOP_LEFT_X + SIDE_PANEL_LENGTH - 90,
-                                                   PLAYER_PANEL_TOP_LEFT_Y + condition_y_mapping[condition]))
+            condition_indicator = render_text(default_font(20), condition.upper(), color)
+            window_renderer.MAIN_WINDOW.blit(condition_indicator,
+                                             (PLAYER_PANEL_TOP_LEFT_X + SIDE_PANEL_LENGTH - 90,
+                                              PLAYER_PANEL_TOP_LEFT_Y + condition_y_mapping[condition]))
     return pg.Rect(condition_rect)
 
 
@@ -286,22 +304,24 @@ def draw_inventory(inventory, refresh=False):
     :return: inventory_tile, a list of every item rect in the inventory, and inventory_rect the rect of the whole
              inventory
     """
+    mark_dirty(PANEL_RECT)
     inventory_rect = pg.Rect(INVENTORY_TOP_LEFT_X, INVENTORY_TOP_LEFT_Y,
                              ITEM_LENGTH * int(INVENTORY_LIMIT / INVENTORY_NUM_ROWS), ITEM_LENGTH * INVENTORY_NUM_ROWS)
     if refresh:
-        MAIN_WINDOW.fill(color=colors.BLACK, rect=inventory_rect)
-    inventory_label = FONT_20.render("INVENTORY", 1, colors.WHITE)
-    MAIN_WINDOW.blit(inventory_label, (INVENTORY_TOP_LEFT_X, INVENTORY_TOP_LEFT_Y - 25))
+        window_renderer.MAIN_WINDOW.fill(color=colors.BLACK, rect=inventory_rect)
+    inventory_label = render_text(default_font(20), "INVENTORY", colors.WHITE)
+    window_renderer.MAIN_WINDOW.blit(inventory_label, (INVENTORY_TOP_LEFT_X, INVENTORY_TOP_LEFT_Y - 25))
     inventory_tiles = list()
     for y in range(INVENTORY_NUM_ROWS):
         for x in range(int(INVENTORY_LIMIT / INVENTORY_NUM_ROWS)):
             item_tile = pg.Rect((x * ITEM_LENGTH) + INVENTORY_TOP_LEFT_X,
                                 (y * ITEM_LENGTH) + INVENTORY_TOP_LEFT_Y, ITEM_LENGTH, ITEM_LENGTH)
-            pg.draw.rect(MAIN_WINDOW, colors.GREY, item_tile, 1)
+            pg.draw.rect(window_renderer.MAIN_WINDOW, colors.GREY, item_tile, 1)
             if len(inventory) >= (y * 6) + x + 1:
-                MAIN_WINDOW.fill(color=colors.ORANGE, rect=((x * ITEM_LENGTH) + INVENTORY_TOP_LEFT_X + 1,
-                                                            (y * ITEM_LENGTH) + INVENTORY_TOP_LEFT_Y + 1,
-                                                            ITEM_LENGTH - 2, ITEM_LENGTH - 2))
+                window_renderer.MAIN_WINDOW.fill(color=colors.ORANGE,
+                                                 rect=((x * ITEM_LENGTH) + INVENTORY_TOP_LEFT_X + 1,
+                                                       (y * ITEM_LENGTH) + INVENTORY_TOP_LEFT_Y + 1,
+                                                       ITEM_LENGTH - 2, ITEM_LENGTH - 2))
                 inventory_tiles.append(item_tile)
     return inventory_tiles, inventory_rect
 
@@ -321,11 +341,12 @@ def draw_equipment(equipment_dict, refresh=False):
     :return: equipment_tiles, a dict where the key is an equipment slot and the value is the Rect enclosing that slot,
              equipment_rect, a Rect object enclosing all of the equipment info.
     """
+    mark_dirty(PANEL_RECT)
     equipment_rect = pg.Rect(EQUIPMENT_TOP_LEFT_X, EQUIPMENT_TOP_LEFT_Y, EQUIPMENT_LENGTH, EQUIPMENT_HEIGHT)
     if refresh:
-        MAIN_WINDOW.fill(color=colors.BLACK, rect=equipment_rect)
-    equipment_label = FONT_20.render("EQUIPMENT", 1, colors.WHITE)
-    MAIN_WINDOW.blit(equipment_label, (EQUIPMENT_TOP_LEFT_X, EQUIPMENT_TOP_LEFT_Y - 8))
+        window_renderer.MAIN_WINDOW.fill(color=colors.BLACK, rect=equipment_rect)
+    equipment_label = render_text(default_font(20), "EQUIPMENT", colors.WHITE)
+    window_renderer.MAIN_WINDOW.blit(equipment_label, (EQUIPMENT_TOP_LEFT_X, EQUIPMENT_TOP_LEFT_Y - 8))
     grid_equipment_mapping = {
         (1, 0): 'head',
         (0, 1): 'hands',
@@ -341,12 +362,13 @@ def draw_equipment(equipment_dict, refresh=False):
             item_tile = pg.Rect((0.5 + x) * EQUIP_ITEM_LENGTH + EQUIPMENT_TOP_LEFT_X,
                                 (0.5 + y) * EQUIP_ITEM_LENGTH + EQUIPMENT_TOP_LEFT_Y,
                                 EQUIP_ITEM_LENGTH, EQUIP_ITEM_LENGTH)
-            pg.draw.rect(MAIN_WINDOW, colors.GREY, item_tile, 1)
+            pg.draw.rect(window_renderer.MAIN_WINDOW, colors.GREY, item_tile, 1)
             # Check if the corresponding equipment slot currently has any items equipped.
             if equipment_dict[grid_equipment_mapping[(x, y)]]:
-                MAIN_WINDOW.fill(color=colors.ORANGE, rect=((0.5 + x) * EQUIP_ITEM_LENGTH + EQUIPMENT_TOP_LEFT_X + 1,
-                                                            (0.5 + y) * EQUIP_ITEM_LENGTH + EQUIPMENT_TOP_LEFT_Y + 1,
-                                                            EQUIP_ITEM_LENGTH - 2, EQUIP_ITEM_LENGTH - 2))
+                window_renderer.MAIN_WINDOW.fill(color=colors.ORANGE,
+                                                 rect=((0.5 + x) * EQUIP_ITEM_LENGTH + EQUIPMENT_TOP_LEFT_X + 1,
+                                                       (0.5 + y) * EQUIP_ITEM_LENGTH + EQUIPMENT_TOP_LEFT_Y + 1,
+                                                       EQUIP_ITEM_LENGTH - 2, EQUIP_ITEM_LENGTH - 2))
 
             equipment_tiles[grid_equipment_mapping[(x, y)]] = item_tile
     return equipment_tiles, equipment_rect
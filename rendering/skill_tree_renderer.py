@@ -3,7 +3,10 @@ import pygame as pg
 import colors
 
 from config import SIDE_PANEL_HEIGHT, SIDE_PANEL_LENGTH, font_SIL, PLAYER_PANEL_TOP_LEFT_X, PLAYER_PANEL_TOP_LEFT_Y
-from rendering.window_renderer import MAIN_WINDOW, FONT_15, FONT_20, FONT_30, FONT_50, FONT_CALIBRI_12, draw_detail_window
+from rendering.frame_compositor import mark_dirty
+from rendering.text_cache import render_text
+from rendering import window_renderer
+from rendering.window_renderer import default_font, calibri_font, draw_detail_window
 from rendering.player_panel_renderer import ABILITY_TILE_LENGTH, draw_ability_details
 
 
@@ -22,17 +25,20 @@ def draw_skill_tree(skill_tree, profession, player_level, skill_points):
              corresponding rect. E.g., the entry for the 2nd skill in the active_2 row would have the entry:
                 ('active_2', 1) : pg.Rect(...)
     """
+    mark_dirty((PLAYER_PANEL_TOP_LEFT_X, PLAYER_PANEL_TOP_LEFT_Y, SIDE_PANEL_LENGTH, SIDE_PANEL_HEIGHT))
     # Reset the player panel to black.
-    MAIN_WINDOW.fill(color=colors.BLACK,
-                     rect=(PLAYER_PANEL_TOP_LEFT_X + 1, PLAYER_PANEL_TOP_LEFT_Y + 1, SIDE_PANEL_LENGTH - 2, SIDE_PANEL_HEIGHT - 2))
+    window_renderer.MAIN_WINDOW.fill(color=colors.BLACK,
+                                     rect=(PLAYER_PANEL_TOP_LEFT_X + 1, PLAYER_PANEL_TOP_LEFT_Y + 1,
+                                           SIDE_PANEL_LENGTH - 2, SIDE_PANEL_HEIGHT - 2))
 
     skill_tile_length = 0.7 * ABILITY_TILE_LENGTH
     space_between_levels = 0.9 * skill_tile_length  # The vertical space between each layer of the tree
     draw_skill_tree_level_progression(player_level, space_between_levels, skill_tile_length)
-    skill_tree_title = FONT_20.render(f'PATH OF THE {profession.upper()}', 1, colors.WHITE)  # Skill tree title
-    MAIN_WINDOW.blit(skill_tree_title, (PLAYER_PANEL_TOP_LEFT_X + 5, PLAYER_PANEL_TOP_LEFT_Y + 5))
-    points_remaining = FONT_20.render(f'Skill points remaining: {skill_points}', 1, colors.WHITE)
-    MAIN_WINDOW.blit(points_remaining, (PLAYER_PANEL_TOP_LEFT_X + 5, PLAYER_PANEL_TOP_LEFT_Y + 30))
+    # Skill tree title
+    skill_tree_title = render_text(default_font(20), f'PATH OF THE {profession.upper()}', colors.WHITE)
+    window_renderer.MAIN_WINDOW.blit(skill_tree_title, (PLAYER_PANEL_TOP_LEFT_X + 5, PLAYER_PANEL_TOP_LEFT_Y + 5))
+    points_remaining = render_text(default_font(20), f'Skill points remaining: {skill_points}', colors.WHITE)
+    window_renderer.MAIN_WINDOW.blit(points_remaining, (PLAYER_PANEL_TOP_LEFT_X + 5, PLAYER_PANEL_TOP_LEFT_Y + 30))
     rect_map = dict()
     for tree_level, level_name in enumerate(skill_tree):
         num_skills_in_row = len(skill_tree[level_name])
@@ -46,16 +52,17 @@ def draw_skill_tree(skill_tree, profession, player_level, skill_points):
                           (tree_level + 1) * space_between_levels + tree_level * skill_tile_length + PLAYER_PANEL_TOP_LEFT_Y + 40,
                           skill_tile_length, skill_tile_length)
             rect_map[(level_name, i)] = pg.Rect(skill_rect)
-            pg.draw.rect(MAIN_WINDOW, colors.GREY, skill_rect, 0 if skill_tree[level_name][i]['ability'].level > 0 else 1)
+            pg.draw.rect(window_renderer.MAIN_WINDOW, colors.GREY, skill_rect,
+                         0 if skill_tree[level_name][i]['ability'].level > 0 else 1)
             if skill_points > 0:
                 draw_skill_as_upgradable(player_level, ability_entry=skill_tree[level_name][i], rect=pg.Rect(skill_rect))
             if level_name in {'active_2', 'active_3', 'active_4'} and i > 0:
                 # On the active skill layers (excluding the first), render an 'OR' between each skill. Location of the
                 # text will be calculated based on the top-left coordinates of the skill that will appear after it
                 # in a left-to-right order.
-                MAIN_WINDOW.blit(FONT_20.render('OR', 1, colors.PALE_YELLOW),
-                                 (skill_rect[0] - 0.54 * space_between_skills - 10,
-                                  skill_rect[1] + 0.2 * space_between_levels))
+                window_renderer.MAIN_WINDOW.blit(render_text(default_font(20), 'OR', colors.PALE_YELLOW),
+                                                 (skill_rect[0] - 0.54 * space_between_skills - 10,
+                                                  skill_rect[1] + 0.2 * space_between_levels))
 
     return rect_map
 
@@ -67,9 +74,9 @@ def draw_skill_as_upgradable(player_level, ability_entry, rect):
     """
     if ability_entry['ability'].level < 3 and ability_entry['level_prereq'] <= player_level and \
             not ability_entry.get('disabled', False):
-        plus_sign = FONT_50.render('+', 1, colors.YELLOW)
+        plus_sign = render_text(default_font(50), '+', colors.YELLOW)
         text_rect = plus_sign.get_rect(center=(rect[0] + 0.5 * rect[2], rect[1] + 0.5 * rect[3]))
-        MAIN_WINDOW.blit(plus_sign, text_rect)
+        window_renderer.MAIN_WINDOW.blit(plus_sign, text_rect)
 
 
 def draw_skill_tree_level_progression(player_level, space_between_levels, skill_tile_length):
@@ -94,9 +101,10 @@ def draw_skill_tree_level_progression(player_level, space_between_levels, skill_
         9: 0.873,
         10: 1
     }
-    MAIN_WINDOW.fill(color=colors.DARK_RED,
-                     rect=(PLAYER_PANEL_TOP_LEFT_X + 1, PLAYER_PANEL_TOP_LEFT_Y + 1, SIDE_PANEL_LENGTH - 2,
-                           window_fill_from_player_level[player_level] * (SIDE_PANEL_HEIGHT - 2)))
+    window_renderer.MAIN_WINDOW.fill(color=colors.DARK_RED,
+                                     rect=(PLAYER_PANEL_TOP_LEFT_X + 1, PLAYER_PANEL_TOP_LEFT_Y + 1,
+                                           SIDE_PANEL_LENGTH - 2,
+                                           window_fill_from_player_level[player_level] * (SIDE_PANEL_HEIGHT - 2)))
     x = PLAYER_PANEL_TOP_LEFT_X + 0.3  * skill_tile_length
     y = PLAYER_PANEL_TOP_LEFT_Y + 2 * skill_tile_length
     badge_length = 0.3 * skill_tile_length
@@ -113,11 +121,11 @@ def draw_skill_tree_level_progression(player_level, space_between_levels, skill_
     }
     for i in range(7):
         badge_points = [(a, b + i * (skill_tile_length + space_between_levels)) for (a, b) in base_badge_points]
-        pg.draw.polygon(MAIN_WINDOW, colors.YELLOW, badge_points)
-        level_text = FONT_CALIBRI_12.render(req_level_from_tree_level[i], 1, colors.BLACK)
+        pg.draw.polygon(window_renderer.MAIN_WINDOW, colors.YELLOW, badge_points)
+        level_text = render_text(calibri_font(12), req_level_from_tree_level[i], colors.BLACK)
         text_rect = level_text.get_rect(center=(badge_points[0][0] + 0.5 * badge_length,
                                                 badge_points[0][1] + 0.75* badge_length))
-        MAIN_WINDOW.blit(level_text, text_rect)
+        window_renderer.MAIN_WINDOW.blit(level_text, text_rect)
 
 
 def draw_ability_details_in_skill_tree(ability, player_attributes):
@@ -0,0 +1,64 @@
+import pygame as pg
+from collections import OrderedDict
+
+from config import TEXT_CACHE_SIZE
+
+"""
+Module holding a shared cache of every font and rendered piece of text, so that the same text isn't rasterized again
+every time a panel is refreshed or a tooltip is redrawn on mouseover.
+"""
+
+# Font objects, in the format {(name, size, is_system_font): pg.font.Font}
+fonts = dict()
+# Rendered text surfaces, in the format {(font, text, color, antialias): pg.Surface}, with the most recently used last
+rendered_text = OrderedDict()
+cache_stats = {'font_hits': 0, 'font_misses': 0, 'text_hits': 0, 'text_misses': 0}
+
+
+def get_font(name, size, system_font=False):
+    """
+    Returns the font of the given size, loading it the first time it's asked for.
+    :param name: The path of the font file, or the name of a system font if system_font is True.
+    :param size: Int, the size of the font.
+    :param system_font: Boolean, if True the font is loaded with pg.font.SysFont instead of from a file.
+    """
+    key = (name, size, system_font)
+    font = fonts.get(key)
+    if font is None:
+        cache_stats['font_misses'] += 1
+        if not pg.font.get_init():
+            pg.font.init()
+        font = pg.font.SysFont(name, size) if system_font else pg.font.Font(name, size)
+        fonts[key] = font
+    else:
+        cache_stats['font_hits'] += 1
+    return font
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Drop-in replacement for font.render(text, antialias, color), which returns the same surface every time the same
+    text is rendered. The surface is shared, so it should only ever be blitted, and never drawn on.
+    """
+    key = (font, text, tuple(color), bool(antialias))
+    surface = rendered_text.get(key)
+    if surface is None:
+        cache_stats['text_misses'] += 1
+        surface = font.render(text, antialias, color)
+        rendered_text[key] = surface
+        if len(rendered_text) > TEXT_CACHE_SIZE:
+            rendered_text.popitem(last=False)
+    else:
+        cache_stats['text_hits'] += 1
+        rendered_text.move_to_end(key)
+    return surface
+
+
+def get_stats():
+    """Returns the hit counts and hit rates of the font and text caches, for profiling."""
+    stats = dict(cache_stats)
+    for cache in ['font', 'text']:
+        lookups = stats[f'{cache}_hits'] + stats[f'{cache}_misses']
+        stats[f'{cache}_hit_rate'] = stats[f'{cache}_hits'] / lookups if lookups else 0.0
+    stats['cached_text_surfaces'] = len(rendered_text)
+    return stats
@@ -3,29 +3,57 @@ import pygame as pg
 
 import colors
 from config import WINDOW_HEIGHT, WINDOW_LENGTH, PLAYER_PANEL_TOP_LEFT_X, PLAYER_PANEL_TOP_LEFT_Y, SIDE_PANEL_HEIGHT, \
-    SIDE_PANEL_LENGTH , font_SIL
+    SIDE_PANEL_LENGTH , font_SIL, HEADLESS
+from rendering.frame_compositor import mark_dirty
+from rendering.text_cache import get_font, render_text
 
 """
-Module that initializes pygame and the rendering of the game window. Holds the MAIN_WINDOW surface which every 
-subsequent rendering method draws upon. Also holds the font objects that are imported into rendering modules, and some
-general functions that are useful for all rendering modules.
+Module that handles the rendering of the game window. Holds the MAIN_WINDOW surface which every subsequent rendering
+method draws upon, which is only created once init_display() is called, so that importing the rendering modules doesn't
+initialize pygame or open a window. Also holds the fonts used by the rendering modules, which are each loaded the first
+time they are used, and some general functions that are useful for all rendering modules.
+
+In headless mode, SDL's dummy drivers are used so that no display or sound device is needed, and MAIN_WINDOW is just an
+offscreen surface that is never pushed to a display.
 """
 
-os.environ['SDL_VIDEO_WINDOW_POS'] = "25, 45"
-pg.init()
-MAIN_WINDOW = pg.display.set_mode((WINDOW_LENGTH, WINDOW_HEIGHT))
-MAIN_WINDOW.fill(colors.BLACK)
-pg.display.set_caption('Untitled Game #1')
+# The surface everything is drawn on, set by init_display().
+MAIN_WINDOW = None
+
+
+def init_display(headless=HEADLESS):
+    """
+    Initializes pygame and creates MAIN_WINDOW. This has to be called before anything is rendered, and does nothing if
+    the display has already been initialized.
+    :param headless: Boolean, if True MAIN_WINDOW is an offscreen surface rather than a window on the screen.
+    :return: MAIN_WINDOW
+    """
+    global MAIN_WINDOW
+    if MAIN_WINDOW is not None:
+        return MAIN_WINDOW
+    if headless:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    else:
+        os.environ['SDL_VIDEO_WINDOW_POS'] = "25, 45"
+    pg.init()
+    if headless:
+        MAIN_WINDOW = pg.Surface((WINDOW_LENGTH, WINDOW_HEIGHT))
+    else:
+        MAIN_WINDOW = pg.display.set_mode((WINDOW_LENGTH, WINDOW_HEIGHT))
+        pg.display.set_caption('Untitled Game #1')
+    MAIN_WINDOW.fill(colors.BLACK)
+    return MAIN_WINDOW
+
+
+def default_font(size):
+    """Returns the default font, Shadows Into Light, at the given size."""
+    return get_font(font_SIL, size)
+
 
-# Font objects. Default font used is Shadows_into_light, with Times New Roman used for some small text.
-FONT_50 = pg.font.Font(font_SIL, 50)
-FONT_30 = pg.font.Font(font_SIL, 30)
-FONT_25 = pg.font.Font(font_SIL, 25)
-FONT_20 = pg.font.Font(font_SIL, 20)
-FONT_15 = pg.font.Font(font_SIL, 15)
-FONT_10 = pg.font.Font(font_SIL, 10)
-FONT_CALIBRI_12 = pg.font.SysFont('calibri', 12)
-FONT_CALIBRI_13 = pg.font.SysFont('calibri', 13)
+def calibri_font(size):
+    """Returns Calibri at the given size, which is used for some small text."""
+    return get_font('calibri', size, system_font=True)
 
 
 def draw_detail_window(body_strings, rect_dimensions, header_string=None, window_color=colors.NAVY, font_size=13,
@@ -58,19 +86,20 @@ def draw_detail_window(body_strings, rect_dimensions, header_string=None, window
     if header_string is not None:
         # If a header is given, render that at the top of the window and offset the body by 27 pixels.
         body_offset = 35
-        header = FONT_20.render(header_string, 1, colors.WHITE)
+        header = render_text(default_font(20), header_string, colors.WHITE)
         tooltip_surface.blit(header, (5, 2))
-    body_font = pg.font.SysFont('calibri', font_size)
+    body_font = calibri_font(font_size)
     for i, entry in enumerate(body_strings):
         if type(entry) != tuple:
             body_strings[i] = (entry, colors.WHITE)
-    body = [body_font.render(string, 1, color) for (string, color) in body_strings]
+    body = [render_text(body_font, string, color) for (string, color) in body_strings]
     # The first two elements of rect_dimensions correspond to the top_left_x and top_left_y of the window, resp.
     for i, string in enumerate(body):
         tooltip_surface.blit(string, (10, body_offset + 16*i))
     if location:
         rect_dimensions = adjust_window_location(rect_dimensions, location)
     MAIN_WINDOW.blit(tooltip_surface, (rect_dimensions[0], rect_dimensions[1]))
+    mark_dirty((rect_dimensions[0], rect_dimensions[1], rect_dimensions[2], rect_dimensions[3]))
 
 
 def find_auto_dimensions(auto_height, auto_width, rect_dimensions, body_strings, header_string, font_size):
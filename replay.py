@@ -0,0 +1,116 @@
+import argparse
+import sys
+from time import perf_counter
+
+import input_log
+import timeline
+from config import HEADLESS, INPUT_LOG_OUTPUT
+from simulation import Simulation
+
+"""
+Runner which plays back a game recorded by input_log.py. By default the log is played against the simulation alone, with
+nothing rendered, as fast as possible, and the time taken is printed. Otherwise the game is rendered as it plays out, at
+--speed times the normal speed. Either way, if the log holds the state the recorded game finished in, the replay is
+checked against it, and the exit status is 1 if it doesn't match, so that replays can be used as regression checks.
+
+Usage: python replay.py [path] [--speed N] [--headless]
+"""
+
+# Seconds between each action when a replay is rendered, before being divided by the speed.
+ACTION_DELAY = 0.25
+
+
+def plays_enemy_turn(log, simulation):
+    """
+    Returns True if the enemy turn after the player's action should be played out. The recorded game may have ended
+    after the player's last action but before the enemy turn that followed it, which the log's final turn tells us.
+    """
+    return log.final_turn is None or simulation.turn < log.final_turn
+
+
+def replay_headless(log):
+    """
+    Plays every action in the log against a new simulation, without rendering anything.
+    :return: The simulation once every action has been played, and the number of seconds it took.
+    """
+    simulation = Simulation(seed=log.seed)
+    start = perf_counter()
+    for action in log.actions:
+        events = simulation.act(action)
+        if events and events[-1]['type'] == 'player_turn_over' and plays_enemy_turn(log, simulation):
+            simulation.end_turn()
+    return simulation, perf_counter() - start
+
+
+def play_frames(game, duration):
+    """
+    Runs frames until everything on the timeline has played out and at least duration seconds have passed.
+    :return: False if the window was closed in the meantime, and True otherwise.
+    """
+    import pygame as pg
+    end = perf_counter() + duration
+    while timeline.is_busy() or perf_counter() < end:
+        for event in pg.event.get():
+            if event.type == pg.QUIT:
+                return False
+        game.loop_controller.clock.tick(game.loop_controller.fps)
+        game.loop_controller.end_frame()
+    return True
+
+
+def replay_rendered(log, speed, headless=HEADLESS):
+    """
+    Plays every action in the log through a Game, rendering it at speed times the normal speed.
+    :return: The game's simulation once every action has been played, and the number of seconds it took.
+    """
+    from console import Console
+    from game import Game
+    from rendering import window_renderer
+    window_renderer.init_display(headless=headless)
+    timeline.speed = speed
+    game = Game(console=Console(), seed=log.seed, record_inputs=False)
+    game.draw_window()
+    game.console.refresh_console()
+    start = perf_counter()
+    for action in log.actions:
+        if not play_frames(game, ACTION_DELAY / speed):
+            break
+        if game.take_action(action) and plays_enemy_turn(log, game.simulation):
+            game.handle_player_turn_over()
+        else:
+            game.load_game_board()
+    else:
+        play_frames(game, 0)
+    return game.simulation, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plays back a game recorded by input_log.py.')
+    parser.add_argument('path', nargs='?', default=INPUT_LOG_OUTPUT, help='the input log to play back')
+    parser.add_argument('--speed', type=float, default=None,
+                        help='render the replay at this many times the normal speed, rather than not at all')
+    parser.add_argument('--headless', action='store_true', help='render into an offscreen surface, without a window')
+    args = parser.parse_args()
+
+    log = input_log.load(args.path)
+    if args.speed is None:
+        simulation, elapsed = replay_headless(log)
+    else:
+        simulation, elapsed = replay_rendered(log, args.speed, headless=HEADLESS or args.headless)
+    print(f'Replayed {len(log.actions)} actions over {simulation.turn} turns in {1000 * elapsed:.1f} ms '
+          f'({simulation.turn / elapsed if elapsed else 0:.0f} turns/s)')
+    world = simulation.world.report()
+    print(f"Boards in memory: {world['resident']} ({world['resident_bytes'] / 1024:.0f} KiB), evicted: {world['evicted']} "
+          f"({world['evicted_bytes'] / 1024:.1f} KiB compressed)")
+    if log.final_digest is None:
+        return 0
+    if simulation.turn == log.final_turn and input_log.state_digest(simulation) == log.final_digest:
+        print('Finished in the same state as the recorded game.')
+        return 0
+    print(f'Finished in a different state than the recorded game, on turn {simulation.turn} (recorded game finished on '
+          f'turn {log.final_turn}).')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
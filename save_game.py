@@ -0,0 +1,61 @@
+import struct
+
+from game_elements.element_config_values import PREGENERATE_BOARDS
+from game_elements.random_streams import RandomStreams
+from game_elements.serialization import pack, unpack, player_to_data, player_from_data
+from game_elements.world_store import WorldStore
+from simulation import Simulation
+
+"""
+Module for saving a game in progress to a file, and loading it back into a Simulation which picks up exactly where the
+saved one left off, including the state of its random number generators.
+
+Nothing in a save is pickled. The enemies, items, traps and statuses in a game are all copies of the content defined in
+element_lists, so they're saved as the name of what they were copied from along with whatever has changed since, and
+the abilities in the player's skill tree are saved as their levels. Everything is encoded as plain tuples, dicts,
+strings, bytes and numbers by game_elements.serialization, in the format:
+    header      b'SAVE' and the format version (1 byte)
+    payload     the zlib-compressed marshal encoding of a tuple of the seed, the state of each random number generator,
+                the turn, the board_id of the board the player is on, the player, and the WorldStore, in which each
+                board's grid is saved as its raw bytes and the boards it has evicted are kept as they are, compressed
+The version is bumped whenever the payload changes, so that an old save is rejected rather than loaded wrongly.
+"""
+
+MAGIC = b'SAVE'
+VERSION = 3
+HEADER = struct.Struct('<4sB')
+
+
+def encode(simulation):
+    """Returns the state of a Simulation encoded as bytes, in the format described at the top of the module."""
+    payload = (simulation.rng.seed, simulation.rng.get_state(), simulation.turn, simulation.board.board_id,
+               player_to_data(simulation.player), simulation.world.to_data())
+    return HEADER.pack(MAGIC, VERSION) + pack(payload)
+
+
+def decode(data, pregenerate_boards=PREGENERATE_BOARDS):
+    """Returns a Simulation of the game saved in data, the bytes of a save file."""
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise Exception('Tried to decode something which is not a saved game.')
+    if version != VERSION:
+        raise Exception(f'Tried to decode a saved game of unsupported version {version}.')
+    seed, rng_state, turn, board_id, player, world_data = unpack(data[HEADER.size:])
+    rng = RandomStreams(seed)
+    rng.set_state(rng_state)
+    world = WorldStore(rng)
+    world.restore(world_data)
+    return Simulation(board=world.boards[board_id], player=player_from_data(player),
+                      pregenerate_boards=pregenerate_boards, world=world, turn=turn)
+
+
+def save(simulation, path):
+    """Saves the state of a Simulation to path."""
+    with open(path, 'wb') as file:
+        file.write(encode(simulation))
+
+
+def load(path, pregenerate_boards=PREGENERATE_BOARDS):
+    """Returns a Simulation of the game saved at path."""
+    with open(path, 'rb') as file:
+        return decode(file.read(), pregenerate_boards=pregenerate_boards)
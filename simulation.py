@@ -0,0 +1,387 @@
+from game_elements.board import Board
+from game_elements.board_pregenerator import BoardPregenerator
+from game_elements.element_config_values import PREGENERATE_BOARDS, MAX_SKILL_LEVEL
+from game_elements.enemy_turn import EnemyTurn
+from game_elements.player import Player
+from game_elements.random_streams import RandomStreams
+from game_elements.template_catalog import STARTING_TEMPLATE_ID
+from game_elements.world_store import WorldStore
+
+"""
+Module holding the simulation core of the game, i.e. all of the game logic with none of the rendering. Nothing in here
+imports pygame, so it can be run without a window, e.g. to play through thousands of turns in a test or benchmark.
+
+The game is played by passing actions to Simulation.step(), each of which is a tuple of the action type followed by its
+parameters:
+    ('move', direction)           where direction is one of 'up', 'down', 'left' or 'right'
+    ('wait',)
+    ('ability', index, target)    where index is the ability's index in Player.active_abilities, and target is the
+                                  (x, y) tile it was aimed at, or None if nothing was targeted
+    ('item', index)               where index is the item's index in Player.inventory
+    ('attribute', name)           where name is the attribute a level up point was spent on, e.g. 'str'
+    ('skill', tree_level, index)  where tree_level and index locate the skill a point was spent on in Player.skill_tree
+step() returns a list of events describing everything that happened, which the pygame front end in game.py uses to
+update the screen. Each event is a dict holding its 'type', along with any details, e.g.
+    {'type': 'enemy_died', 'position': (x, y)}
+The event types are:
+    'console_text'         New lines for the console, under 'lines'.
+    'enemy_turn'           Every line of console text produced by the enemy turn at once, under 'lines'.
+    'enemy_attacked'       The player attacked the enemy at 'position'.
+    'enemy_died'           The enemy at 'position' died, and was removed from the board.
+    'level_up'             The player leveled up.
+    'player_changed'       Anything about the player may have changed.
+    'abilities_changed'    The player's ability cooldowns changed.
+    'attributes_changed'   The player's attributes changed.
+    'inventory_changed'    An item was added to the player's inventory.
+    'item_used'            An item was consumed or equipped from the player's inventory.
+    'skills_changed'       A skill in the player's skill tree was leveled up.
+    'allocation_rejected'  An attribute or skill point couldn't be spent, for the reason given under 'lines'. Nothing
+                           about the player was changed.
+    'board_changed'        The player went through a door, so Simulation.board is now a different board.
+    'player_turn_over'     The player's action used up their turn, so the enemies act next.
+
+Everything left to chance is decided with the simulation's RandomStreams, a separate seeded random number generator for
+each subsystem (combat rolls, enemy decisions, board generation and loot), so that a whole game can be reproduced from a
+single seed, and e.g. an extra board being generated doesn't change the outcome of every fight after it.
+"""
+
+
+class Simulation:
+    def __init__(self, board=None, player=None, seed=None, pregenerate_boards=PREGENERATE_BOARDS, world=None, turn=0):
+        """
+        Holds the whole state of a game in progress, and carries out every action taken in it.
+        :param board: The Board the game starts on. Defaults to a new board loaded from the starting template.
+        :param player: The Player controlled by the user. Defaults to a new Player.
+        :param seed: The seed for the simulation's random number generators. Two simulations with the same seed, given
+                     the same actions, play out exactly the same. If None, a random seed is chosen.
+        :param pregenerate_boards: Boolean, if True the boards behind the doors nearest the player are generated in the
+                                   background, so that going through a door doesn't have to wait for it. This doesn't
+                                   change how the game plays out.
+        :param world: The WorldStore of a saved game, which board must be one of the boards of. The simulation then
+                      shares its RandomStreams, rather than seeding new ones. Defaults to a new, empty WorldStore.
+        :param turn: The number of turns that have already been played out, for a saved game.
+
+        The following attributes are also set and used by methods outside of init:
+        :rng: The RandomStreams everything in the game left to chance is decided with, shared with every board.
+        :turn: The number of turns that have been played out.
+        :events: The list of events produced by the action or enemy turn currently being played out.
+        :world: The WorldStore keeping track of every board that has been visited, which evicts the boards visited
+                longest ago from memory.
+        :pregenerator: The BoardPregenerator generating boards in the background, or None if it's turned off.
+        :actions: A dict mapping each action type to the method which carries it out.
+        """
+        self.rng = world.rng if world is not None else RandomStreams(seed)
+        self.board = board if board is not None else Board(template_id=STARTING_TEMPLATE_ID, rng=self.rng)
+        # A board passed in may have been created with its own streams, but it has to share the simulation's.
+        self.board.rng = self.rng
+        self.player = player if player is not None else Player()
+        # Player coordinates are initialized from the board template
+        self.player.x = self.board.player_coordinates[0]
+        self.player.y = self.board.player_coordinates[1]
+        self.turn = turn
+        self.events = list()
+        self.actions = {
+            'move': self.move_player,
+            'wait': self.wait,
+            'ability': self.use_ability,
+            'item': self.use_item,
+            'attribute': self.allocate_attribute_point,
+            'skill': self.allocate_skill_point
+        }
+        self.board.generate_adjacent_boards(self.player.level, self.player.experience)
+        self.world = world if world is not None else WorldStore(self.rng)
+        # The boards of a saved game are already in the world, along with the turn they were last visited on.
+        if self.board.board_id is None:
+            self.world.visit(self.board, self.turn)
+        self.pregenerator = BoardPregenerator(self.rng) if pregenerate_boards else None
+        self.pregenerate_boards()
+
+    def emit(self, event_type, **details):
+        """Adds an event to the list of events for the action or enemy turn currently being played out."""
+        self.events.append({'type': event_type, **details})
+
+    def step(self, action):
+        """
+        Plays out a whole turn: the player's action, and then, if that used up the player's turn, the enemy turn.
+        :return: The list of every event produced along the way.
+        """
+        events = self.act(action)
+        if events and events[-1]['type'] == 'player_turn_over':
+            events += self.end_turn()
+        return events
+
+    def act(self, action):
+        """
+        Carries out the player's action, and if it used up their turn, applies the player's end of turn status effects.
+        The front end calls this and end_turn() separately, so that it can pause between the two.
+        :return: The list of events produced, ending with a 'player_turn_over' event if the turn was used up.
+        """
+        self.events = list()
+        action_type, *params = action
+        turn_taken = self.actions[action_type](*params)
+        if turn_taken:
+            self.emit('console_text', lines=self.player.apply_end_of_turn_status_effects())
+        self.board.apply_player_passives(self.player.passive_abilities['board_mods'])
+        if turn_taken:
+            self.emit('player_turn_over')
+        return self.events
+
+    def end_turn(self):
+        """
+        Runs an EnemyTurn, having every enemy act if necessary, and then calls all necessary functions at the end of
+        a turn, to check the players status and update things accordingly.
+        :return: The list of events produced.
+        """
+        self.events = list()
+        self.emit('enemy_turn', lines=EnemyTurn(board=self.board, player=self.player, rng=self.rng).run())
+        if self.player.conditions_worsen():
+            self.emit('player_changed')
+        if self.player.decrement_ability_cooldowns():
+            self.emit('abilities_changed')
+        self.player.passive_mp_regen()
+        if self.player.check_fatigue():
+            self.emit('attributes_changed')
+        self.board.apply_player_passives(self.player.passive_abilities['board_mods'])
+        self.turn += 1
+        self.pregenerate_boards()
+        return self.events
+
+    def pregenerate_boards(self):
+        """Has the boards behind the doors nearest the player generated in the background, if that's turned on."""
+        if self.pregenerator is not None:
+            self.pregenerator.request_nearest(self.board, (self.player.x, self.player.y))
+
+    def close(self):
+        """Stops anything the simulation is running in the background."""
+        if self.pregenerator is not None:
+            self.pregenerator.stop()
+
+    def wait(self):
+        """The player waits a turn."""
+        self.player.wait()
+        return True
+
+    def move_player(self, direction):
+        """Given a basic movement direction, moves the player character and updates its position on the board."""
+        new_x, new_y = self.player.perform_movement(direction)
+        # Checks if player is moving to an open tile or trap
+        if self.board.tile_is_open(new_x, new_y):
+            self.emit('console_text', lines=self.board.move_character(character=self.player, new_x=new_x, new_y=new_y))
+        else:
+            tile = self.board.tile_at(new_x, new_y)
+            if tile == 'E':  # Moving to a tile which contains an enemy attacks the enemy
+                self.attack_enemy((new_x, new_y))
+            elif tile == 'T':  # Moving to a tile which contains a chest opens the chest
+                self.open_chest((new_x, new_y))
+            elif tile == 'D':  # Moving to a tile which is a door to the next board
+                self.handle_board_transition(door_coordinates=(new_x, new_y))
+        return True
+
+    def open_chest(self, chest_pos):
+        """Calls methods to set chest status to 'open' and add item to player inventory."""
+        target_chest = self.board.chests[chest_pos]
+        if target_chest.opened:
+            self.emit('console_text', lines='This chest is empty. ')
+            return
+        # pick_up_item returns text for the console as well as a boolean signifying the success of picking up item
+        console_text, success = self.player.pick_up_item(target_chest.item, from_chest=True)
+        if success:
+            self.board.handle_chest_has_been_opened(chest_pos)
+            self.emit('inventory_changed')
+            self.emit('console_text', lines=console_text)
+
+    def attack_enemy(self, enemy_pos):
+        """Has the player attack the enemy at enemy_pos, and if enemy.hp=0, handles enemy death."""
+        self.emit('enemy_attacked', position=enemy_pos)
+        target_enemy = self.board.enemies[enemy_pos]
+        self.emit('console_text', lines=self.player.basic_attack(target_enemy, rng=self.rng.combat))
+        if target_enemy.hp[0] == 0:
+            self.handle_enemy_death(target_enemy)
+
+    def handle_enemy_death(self, enemy):
+        """
+        When an enemy dies, the following things will happen:
+            i. Enemy must be removed from the board
+            ii. Player gains experience, and possibly levels up, in which case any new board-modifying passives are
+                applied.
+        """
+        self.board.handle_enemy_death(enemy_pos=(enemy.x, enemy.y))
+        self.emit('enemy_died', position=(enemy.x, enemy.y))
+        # Player.gain_experience() evaluates to True if the Player has leveled up.
+        if self.player.gain_experience():
+            self.emit('level_up')
+            self.emit('console_text', lines=f"{self.player.name} has reached level {self.player.level}.")
+            # Apply player's passives that modify the board, in case any new ones were allocated.
+            self.board.apply_player_passives(self.player.passive_abilities['board_mods'])
+        self.emit('player_changed')
+
+    def handle_board_transition(self, door_coordinates):
+        """Handles all the necessary updates when the Player steps on a door and transitions to the next board."""
+        new_board = self.world.board_behind_door(self.board, door_coordinates, pregenerator=self.pregenerator)
+        self.player.x, self.player.y = self.board.doors[door_coordinates]['entry_position']
+        self.board = new_board
+        self.board.player_coordinates = (self.player.x, self.player.y)
+        self.board.generate_adjacent_boards(self.player.level, self.player.experience)
+        self.world.visit(self.board, self.turn)
+        self.pregenerate_boards()
+        self.emit('board_changed')
+
+    def use_item(self, item_index):
+        """
+        Handles the player using an item. This will differ depending on if the item is a consumable or equipment.
+        """
+        item = self.player.inventory[item_index]
+        if item.is_consumable() and self.check_item_prerequisites(item):
+            self.emit('console_text', lines=self.player.consume_item(item_index, rng=self.rng.combat))
+        elif item.is_equipment():
+            self.emit('console_text', lines=self.player.equip_item(item_index))
+        self.emit('item_used')
+        return True
+
+    def allocate_attribute_point(self, attribute):
+        """
+        Spends one of the player's attribute points to increase one of their attributes by a point, if they have any
+        left. Spending points doesn't use up the player's turn.
+        """
+        if attribute not in self.player.attributes:
+            self.emit('allocation_rejected', lines='There is no such attribute.')
+            return False
+        if self.player.attribute_points == 0:
+            self.emit('allocation_rejected', lines='You have no attribute points to spend.')
+            return False
+        self.player.attribute_points -= 1
+        self.player.attributes[attribute] += 1
+        self.player.apply_attribute_changes()
+        self.emit('player_changed')
+        return False
+
+    def allocate_skill_point(self, tree_level, index):
+        """
+        Spends one of the player's skill points to level up a skill in their skill tree, if check_skill_unavailable()
+        allows it. Spending points doesn't use up the player's turn.
+        """
+        unavailable_reason = self.check_skill_unavailable(tree_level, index)
+        if unavailable_reason is not None:
+            self.emit('allocation_rejected', lines=unavailable_reason)
+            return False
+        self.player.skill_points -= 1
+        self.player.level_up_skill(tree_level, index)
+        self.emit('skills_changed')
+        return False
+
+    def check_skill_unavailable(self, tree_level, index):
+        """
+        Returns the console text explaining why a skill point can't be spent on the skill at index in tree_level of the
+        player's skill tree right now, or None if it can.
+        """
+        entries = self.player.skill_tree.get(tree_level, [])
+        # Todo: the blank entries are only there while skill trees are still being filled in
+        if not 0 <= index < len(entries) or entries[index]['ability'].name == '':
+            return 'There is no such skill.'
+        ability_entry = entries[index]
+        if self.player.skill_points == 0:
+            return 'You have no skill points to spend.'
+        elif ability_entry['ability'].level >= MAX_SKILL_LEVEL:
+            return 'That skill is already at its highest level.'
+        elif self.player.level < ability_entry['level_prereq']:
+            return f"You need to reach level {ability_entry['level_prereq']} to learn that skill."
+        elif ability_entry.get('disabled', False):
+            return 'Another skill on that level of the tree has already been chosen.'
+        return None
+
+    def check_item_prerequisites(self, item):
+        """
+        Some consumable items have prerequisite conditions before they can be used. Those are checked here.
+        Return True if all prerequisites are met (of if there are None), and False otherwise.
+        """
+        if item.prerequisites_for_use is None:
+            return True
+        for prerequisite in item.prerequisites_for_use:
+            if prerequisite == 'no_enemies_on_board' and len(self.board.enemies.keys()) > 0:
+                self.emit('console_text', lines='Conditions to use this item are not met.')
+                return False
+
+        return True
+
+    def check_ability_unavailable(self, ability_index):
+        """Returns the console text explaining why the ability can't be used right now, or None if it can."""
+        ability = self.player.active_abilities[ability_index]
+        if ability.turns_left > 0:
+            return 'That ability is still on cooldown!'
+        elif ability.mp_cost > self.player.mp[0]:
+            return 'Not enough MP to use that ability!'
+        return None
+
+    def get_target_tiles(self, ability_index):
+        """
+        Returns every tile the ability could be aimed at from the player's position, along with the set of tile types
+        which can actually be targeted, as found by the ability's targeting function.
+        """
+        ability = self.player.active_abilities[ability_index]
+        return ability.targeting_function(self.board, self.player.x, self.player.y, **ability.targeting_function_params)
+
+    def get_targets(self, ability, targeted_coord):
+        """Returns every character affected by the ability when it is aimed at targeted_coord."""
+        targets = list()
+        target_coords = [targeted_coord]
+        if ability.multi_target_function:
+            if len(ability.multi_target_function) == 2:
+                # In this case multi_target_function was passed a a 2-tuple of (function, parameters_dict)
+                target_coords += ability.multi_target_function[0](targeted_coord[0], targeted_coord[1],
+                                                                   player_x=self.player.x, player_y=self.player.y,
+                                                                   **ability.multi_target_function[1])
+            else:
+                target_coords += ability.multi_target_function(targeted_coord[0], targeted_coord[1],
+                                                               player_x=self.player.x, player_y=self.player.y)
+        for target_coord in target_coords:
+            if self.board.enemies.get(target_coord, None):
+                targets.append(self.board.enemies[target_coord])
+            elif self.board.player_coordinates == target_coord:
+                targets.append(self.player)
+        if ability.save_target:
+            targets.append(targeted_coord)
+        return targets
+
+    def use_ability(self, ability_index, target=None):
+        """
+        Handles the player using an ability. Generally goes something like:
+            i.   Check that the ability is off cooldown and the player has enough MP
+            ii.  Find every character affected by the ability, from the tile it was aimed at
+            iii. Use ability on those targets, if there are any
+            iv.  If targets were moved as part of the ability, update positions on board accordingly
+        :param ability_index: The index of the ability in the player's active abilities.
+        :param target: The (x, y) coordinates of the tile the ability was aimed at, or None if nothing was targeted.
+        :return: True if the ability was used, and so the player's turn is over.
+        """
+        unavailable_reason = self.check_ability_unavailable(ability_index)
+        if unavailable_reason is not None:
+            self.emit('console_text', lines=unavailable_reason)
+            return False
+        if target is None:
+            return False
+        ability = self.player.active_abilities[ability_index]
+        targets = self.get_targets(ability, target)
+        if not targets:
+            return False
+        # Using abilities returns a dict containing all the of the outcomes of the ability, e.g. new console text,
+        # any movements of the player or target(s), etc.
+        ability_outcome = self.player.use_ability(ability, targets, rng=self.rng.combat)
+        if ability_outcome.get('console_text', None):
+            self.emit('console_text', lines=ability_outcome['console_text'])
+        # Check to see if target was moved by ability, adjust position in board accordingly.
+        # If no movements were found, loop over an empty list, i.e. do nothing
+        for movement in ability_outcome.get('movements', list()):
+            # Each movement entry in the ability_outcome dict will look like
+            #   { 'subject': The character object that's being moved
+            #     'new_position': (new_x, new_y) }
+            if movement['subject'].hp[0] == 0:  # Don't bother moving the character if they were killed
+                continue
+            new_x, new_y = movement['new_position']
+            # Target is only moved if the new space is open or a trap
+            if self.board.tile_is_open(new_x, new_y):
+                self.emit('console_text', lines=self.board.move_character(character=movement['subject'], new_x=new_x,
+                                                                          new_y=new_y))
+        for target in targets:
+            if target is not None and target.hp[0] == 0:
+                self.handle_enemy_death(target)
+        return True
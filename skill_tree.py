@@ -8,7 +8,8 @@ for allocating skill points, etc.
 """
 
 class SkillTreeController:
-    def __init__(self, skill_tree, profession, level, player_attributes, active_abilities, passive_abilities):
+    def __init__(self, skill_tree, profession, level, player_attributes, active_abilities, passive_abilities,
+                 skill_points, check_skill_unavailable):
         """
         Class that handles all things skill tree, from allocating new points to displaying mouse-over info. Is saved
         as an attribute to the PlayerPanel, so that the panel can act as an intermediary that reads any changes made
@@ -19,14 +20,18 @@ class SkillTreeController:
         :param level: The player's current level.
         :param active_abilities: List of the player's active abilities
         :param passive_abilities: List of the player's passive abilities
+        :param skill_points: The number of skill points the player has to spend. The player gains 1 point every
+                             level-up, and these points are spent to allocate new skills or skill levels in the tree.
+                             Kept up to date by the PlayerPanel as the player levels up and spends them.
+        :param check_skill_unavailable: A function which returns why a skill point can't be spent on the skill at a
+                                        given (tree_level, index), or None if it can, i.e. the simulation's
+                                        check_skill_unavailable() method.
 
         In addition to the above, the following attributes are set at initialization:
         :skill_rect_map: A dict containing key-value pairs of each ability and their respective rects as follows:
                             (tree_level, index_in_level): Rect(),
                          where tree_level is the level the ability appears in the skill tree, and index_in_level is
                          the array index of the ability in that tree level.
-        :skill_points: Initialized to 0, the player gains 1 point every level-up. These points are used to allocate new
-                       skills or skill levels in the tree.
         :tooltip_focus: Analogous to the same-named attribute in the player panel, this is initialized to None and is
                         re-assigned whenever an ability in the skill tree is moused over to the rect of that ability,
                         and set back to None when it is no longer being moused over.
@@ -36,7 +41,8 @@ class SkillTreeController:
         self.level = level
         self.player_attributes = player_attributes
         self.skill_rect_map = dict()
-        self.skill_points = 0
+        self.skill_points = skill_points
+        self.check_skill_unavailable = check_skill_unavailable
         self.tooltip_focus = None
         # self.initialize_skill_tree()
 
@@ -63,41 +69,15 @@ class SkillTreeController:
 
     def allocate_skill_points(self):
         """
-        Allocates skill points to the skill being moused over, if any, and only if the player has skill points to
-        spend and the skill is not already at max level.
+        Finds the skill being moused over, if any, to allocate a skill point to, but only if the simulation's
+        check_skill_unavailable() allows it. The point is spent and the skill leveled up by the simulation, since this
+        class has no writing access to the Player.
+        :return: The (tree_level, index) of the skill to allocate a point to, or None if no point can be allocated.
         """
-        if self.tooltip_focus is None or self.skill_points == 0:
-            return False
-        ability_entry = None; tree_level = ''; index = 0
+        if self.tooltip_focus is None:
+            return None
         for (tree_level, index), value in self.skill_rect_map.items():
-            if value == self.tooltip_focus:
-                ability_entry = self.skill_tree[tree_level][index]
-                break
-        if ability_entry['ability'].level < 3:
-            # Also check that player meets the level requirement and the ability hasn't been disabled
-            if self.level >= ability_entry['level_prereq'] and not ability_entry.get('disabled', False):
-                self.skill_points -= 1
-                self.level_up_skill(tree_level, index)
-                if ability_entry.get('disabled', None) is not None:
-                    # If the allocated ability is a non-starting active ability, we disable the other abilities in this
-                    # level, since the players only get to chose one ability per layer.
-                    for entry in self.skill_tree[tree_level]:
-                        if entry['ability'].name is not ability_entry['ability'].name:
-                            entry['disabled'] = True
+            if value == self.tooltip_focus and self.check_skill_unavailable(tree_level, index) is None:
                 self.tooltip_focus = None
-                self.render_skill_tree()
-                return True
-        return False
-
-    def level_up_skill(self, tree_level, index):
-        """
-        Increases the level of a skill and updates the ability accordingly. Active abilities have a level_up method
-        which will be called, whereas passive abilities just have their values incremented by the level-1 value.
-        """
-        ability = self.skill_tree[tree_level][index]['ability']
-        if not ability.active and ability.level > 0:
-            ability.value += int(ability.value / ability.level)
-        if ability.active and ability.level > 0:
-            ability.level_up()
-        ability.level += 1
-        return
+                return tree_level, index
+        return None
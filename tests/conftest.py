@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from input_log import ATTRIBUTES
+from utility_functions import find_path
+
+DIRECTIONS = {(0, -1): 'up', (0, 1): 'down', (-1, 0): 'left', (1, 0): 'right'}
+
+
+def random_action(rng, player):
+    """
+    Picks an action for the player at random, mostly moves so that the game gets somewhere. Abilities are left out,
+    since whether they can be used depends on what's in range.
+    """
+    roll = rng.random()
+    if roll < 0.05:
+        tree_level = rng.choice(list(player.skill_tree))
+        return 'skill', tree_level, rng.randrange(len(player.skill_tree[tree_level]))
+    if roll < 0.1:
+        return 'attribute', rng.choice(ATTRIBUTES)
+    if roll < 0.15 and player.inventory:
+        return 'item', rng.randrange(len(player.inventory))
+    if roll < 0.2:
+        return 'wait',
+    return 'move', rng.choice(list(DIRECTIONS.values()))
+
+
+def step_towards(simulation, goal):
+    """
+    Returns the move action of the first step from the player to goal, which attacks any enemy in the way, or None if
+    there's no way there.
+    """
+    player = simulation.player
+    path = find_path((player.x, player.y), goal, simulation.board.occupancy.passable)
+    if not path:
+        return None
+    return 'move', DIRECTIONS[(path[0][0] - player.x, path[0][1] - player.y)]
+
+
+@pytest.fixture
+def play():
+    """
+    Returns a function which plays a number of turns of a simulation, picked with a random.Random seeded with seed, and
+    returns the actions taken along with a summary of the events of each turn to compare games by. If explore is True,
+    the player mostly heads for a door picked at random on each board, so that the game moves through many boards, and
+    otherwise every action is picked at random.
+    """
+    def play_turns(simulation, seed, turns, explore=False):
+        rng = random.Random(seed)
+        actions, summaries = list(), list()
+        goal = None
+        for _ in range(turns):
+            action = None
+            if explore and rng.random() < 0.8:
+                if goal is None or goal[0] is not simulation.board:
+                    goal = simulation.board, rng.choice(sorted(simulation.board.doors))
+                action = step_towards(simulation, goal[1])
+            if action is None:
+                action = random_action(rng, simulation.player)
+            events = simulation.step(action)
+            actions.append(action)
+            summaries.append([(event['type'], event.get('lines'), event.get('position')) for event in events])
+        return actions, summaries
+    return play_turns
@@ -0,0 +1,59 @@
+import pytest
+
+import input_log
+from input_log import InputLog, state_digest
+from replay import replay_headless
+from simulation import Simulation
+
+ALL_ACTION_TYPES = [('move', 'up'), ('move', 'down'), ('move', 'left'), ('move', 'right'), ('wait',),
+                    ('ability', 0, (3, 12)), ('ability', 2, None), ('item', 7), ('attribute', 'wis'),
+                    ('skill', 'passive_2', 1)]
+
+
+def test_every_action_type_round_trips():
+    log = InputLog(1234, list(ALL_ACTION_TYPES))
+    decoded = input_log.decode(log.encode())
+    assert decoded.actions == ALL_ACTION_TYPES
+    assert decoded.seed == '1234'
+    assert decoded.final_turn is None and decoded.final_digest is None
+
+
+def test_final_state_round_trips():
+    log = InputLog('seed', [('wait',)])
+    log.final_turn, log.final_digest = 42, bytes(range(8))
+    decoded = input_log.decode(log.encode())
+    assert (decoded.final_turn, decoded.final_digest) == (42, bytes(range(8)))
+
+
+def test_moves_take_a_single_byte():
+    empty = len(InputLog(1).encode())
+    assert len(InputLog(1, [('move', 'left')] * 10).encode()) == empty + 10
+
+
+def test_other_data_is_rejected():
+    data = bytearray(InputLog(1, [('wait',)]).encode())
+    with pytest.raises(Exception, match='not an input log'):
+        input_log.decode(b'SAVE' + bytes(data[4:]))
+    data[4] = input_log.VERSION + 1
+    with pytest.raises(Exception, match='unsupported version'):
+        input_log.decode(bytes(data))
+
+
+def test_same_seed_and_actions_play_out_the_same(play):
+    simulation, again = Simulation(seed=3, pregenerate_boards=False), Simulation(seed=3, pregenerate_boards=False)
+    assert play(simulation, seed=3, turns=300) == play(again, seed=3, turns=300)
+    assert state_digest(simulation) == state_digest(again)
+
+
+@pytest.mark.parametrize('seed', [1, 2])
+def test_saved_log_replays_to_the_recorded_state(play, tmp_path, seed):
+    simulation = Simulation(seed=seed, pregenerate_boards=False)
+    actions, _ = play(simulation, seed=seed, turns=300)
+    path = tmp_path / 'game.replay'
+    InputLog(seed, actions).save(path, simulation)
+
+    log = input_log.load(path)
+    assert log.actions == actions
+    replayed, _ = replay_headless(log)
+    assert replayed.turn == log.final_turn == simulation.turn
+    assert state_digest(replayed) == log.final_digest
@@ -0,0 +1,133 @@
+from game_elements.board import Board
+from game_elements.element_config_values import BOARD_HEIGHT, BOARD_LENGTH
+from game_elements.occupancy import OccupancyIndex, ENEMY, OPEN, PLAYER, TRAP, TREASURE, WALL, CHEST_FLAG, \
+    ENEMY_FLAG, PLAYER_FLAG, TRAP_FLAG
+
+
+def make_template(objects):
+    """A board walled in all the way round, with each letter in objects (x, y): letter placed on the open floor."""
+    template = [['X' if x in (0, BOARD_LENGTH - 1) or y in (0, BOARD_HEIGHT - 1) else 'O'
+                 for x in range(BOARD_LENGTH)] for y in range(BOARD_HEIGHT)]
+    for (x, y), tile in objects.items():
+        template[y][x] = tile
+    return template
+
+
+def make_grid(objects):
+    return bytearray(''.join(''.join(row) for row in make_template(objects)), 'ascii')
+
+
+def index(x, y):
+    return y * BOARD_LENGTH + x
+
+
+def test_everything_but_walls_and_doors_is_open_terrain():
+    occupancy = OccupancyIndex(make_grid({(2, 2): 'P', (3, 3): 'E', (4, 4): 'T', (5, 5): 'R', (6, 0): 'D'}))
+    assert occupancy.terrain[index(0, 0)] == WALL
+    assert occupancy.terrain[index(6, 0)] == ord('D')
+    for tile in ((2, 2), (3, 3), (4, 4), (5, 5)):
+        assert occupancy.terrain[index(*tile)] == OPEN
+        assert occupancy.is_walkable(index(*tile))
+    assert not occupancy.is_walkable(index(0, 0))
+    assert not occupancy.is_walkable(index(6, 0))
+
+
+def test_characters_block_walking_but_not_passing():
+    occupancy = OccupancyIndex(make_grid({}))
+    enemy = object()
+    occupancy.add(index(3, 3), ENEMY_FLAG, enemy)
+    occupancy.add(index(4, 4), PLAYER_FLAG)
+    assert occupancy.occupant(index(3, 3)) is enemy
+    assert not occupancy.is_walkable(index(3, 3))
+    assert not occupancy.is_walkable(index(4, 4))
+    assert occupancy.passable[index(3, 3)] and occupancy.passable[index(4, 4)]
+    assert occupancy.terrain_version == 0
+
+    occupancy.remove(index(3, 3), ENEMY_FLAG)
+    assert occupancy.occupant(index(3, 3)) is None
+    assert occupancy.is_walkable(index(3, 3))
+
+
+def test_chests_change_the_terrain_version():
+    occupancy = OccupancyIndex(make_grid({}))
+    occupancy.add(index(3, 3), CHEST_FLAG, object())
+    assert not occupancy.passable[index(3, 3)]
+    assert occupancy.terrain_version == 1
+    occupancy.remove(index(3, 3), CHEST_FLAG)
+    assert occupancy.passable[index(3, 3)]
+    assert occupancy.terrain_version == 2
+
+
+def test_trap_stays_under_a_character_standing_on_it():
+    occupancy = OccupancyIndex(make_grid({}))
+    trap, enemy = object(), object()
+    occupancy.add(index(5, 5), TRAP_FLAG, trap)
+    assert occupancy.is_walkable(index(5, 5))
+    assert occupancy.top_tile(index(5, 5)) == TRAP
+
+    occupancy.add(index(4, 5), ENEMY_FLAG, enemy)
+    occupancy.move(index(4, 5), index(5, 5), ENEMY_FLAG)
+    assert occupancy.occupant(index(5, 5)) is enemy
+    assert occupancy.under(index(5, 5)) is trap
+    assert occupancy.top_tile(index(5, 5)) == ENEMY
+    assert occupancy.top_tile(index(4, 5)) == OPEN
+
+    occupancy.move(index(5, 5), index(6, 5), ENEMY_FLAG)
+    assert occupancy.top_tile(index(5, 5)) == TRAP
+    assert occupancy.occupant(index(6, 5)) is enemy
+
+
+def test_top_tile_order():
+    occupancy = OccupancyIndex(make_grid({}))
+    occupancy.add(index(2, 2), TRAP_FLAG, object())
+    occupancy.add(index(2, 2), ENEMY_FLAG, object())
+    occupancy.add(index(2, 2), PLAYER_FLAG)
+    assert occupancy.top_tile(index(2, 2)) == PLAYER
+    occupancy.remove(index(2, 2), PLAYER_FLAG)
+    assert occupancy.top_tile(index(2, 2)) == ENEMY
+    occupancy.remove(index(2, 2), ENEMY_FLAG)
+    assert occupancy.top_tile(index(2, 2)) == TRAP
+    occupancy.remove(index(2, 2), TRAP_FLAG)
+    assert occupancy.top_tile(index(2, 2)) == OPEN
+    occupancy.add(index(2, 2), CHEST_FLAG, object())
+    assert occupancy.top_tile(index(2, 2)) == TREASURE
+
+
+def test_enemy_move_only_touches_its_two_tiles():
+    board = Board(board_template=make_template({(2, 2): 'P', (5, 5): 'E'}), seed=1)
+    template = board.template
+    grid_before = bytearray(board.grid)
+    version_before = board.version
+    enemy = board.enemies[(5, 5)]
+
+    board.move_character(enemy, 6, 5)
+    changed = [i for i in range(len(board.grid)) if board.grid[i] != grid_before[i]]
+    assert changed == [index(5, 5), index(6, 5)]
+    assert board.tile_at(5, 5) == 'O' and board.tile_at(6, 5) == 'E'
+    assert board.version > version_before
+    # The template view is patched in place rather than rebuilt.
+    assert board.template is template
+    assert template[5][6] == 'E' and template[5][5] == 'O'
+    assert (enemy.x, enemy.y) == (6, 5)
+    assert board.occupant_at(6, 5) is enemy and board.occupant_at(5, 5) is None
+    board.rebuild_template()
+
+
+def test_player_uncovers_the_tile_they_leave():
+    board = Board(board_template=make_template({(2, 2): 'P', (3, 2): 'T'}), seed=1)
+    board.player_coordinates = (2, 3)
+    assert board.tile_at(2, 2) == 'O' and board.tile_at(2, 3) == 'P'
+    assert not board.tile_is_open(2, 3)
+    assert board.tile_is_open(2, 2)
+    assert not board.tile_is_open(3, 2)
+    board.rebuild_template()
+
+
+def test_enemy_death_and_triggered_trap_clear_their_tiles():
+    board = Board(board_template=make_template({(2, 2): 'P', (5, 5): 'E', (7, 7): 'R'}), seed=1)
+    board.handle_enemy_death((5, 5))
+    assert board.tile_at(5, 5) == 'O' and board.tile_is_open(5, 5)
+    assert (5, 5) not in board.enemies
+    board.handle_trap_triggered((7, 7))
+    assert board.tile_at(7, 7) == 'O' and board.object_under(7, 7) is None
+    board.rebuild_template()
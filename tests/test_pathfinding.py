@@ -0,0 +1,131 @@
+import random
+from collections import deque
+
+import pytest
+
+from game_elements.element_config_values import BOARD_HEIGHT, BOARD_LENGTH
+from utility_functions import UNREACHABLE, find_distances, find_path, manhattan_distance
+
+
+def make_walkable(walls=()):
+    walkable = bytearray([1]) * (BOARD_LENGTH * BOARD_HEIGHT)
+    for x, y in walls:
+        walkable[y * BOARD_LENGTH + x] = 0
+    return walkable
+
+
+def shortest_distance(start, goal, walkable):
+    """A plain breadth-first search to check find_path() against, with the goal treated as walkable."""
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) == goal:
+            return distances[goal]
+        for neighbour in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            neighbour_x, neighbour_y = neighbour
+            if not (0 <= neighbour_x < BOARD_LENGTH and 0 <= neighbour_y < BOARD_HEIGHT) or neighbour in distances:
+                continue
+            if neighbour == goal or walkable[neighbour_y * BOARD_LENGTH + neighbour_x]:
+                distances[neighbour] = distances[(x, y)] + 1
+                queue.append(neighbour)
+    return None
+
+
+def assert_valid_path(start, goal, path, walkable):
+    assert path[-1] == goal
+    previous = start
+    for x, y in path:
+        assert manhattan_distance(previous, (x, y)) == 1
+        assert 0 <= x < BOARD_LENGTH and 0 <= y < BOARD_HEIGHT
+        if (x, y) != goal:
+            assert walkable[y * BOARD_LENGTH + x]
+        previous = (x, y)
+
+
+def test_path_on_an_open_board_is_as_long_as_the_manhattan_distance():
+    walkable = make_walkable()
+    path = find_path((1, 2), (9, 7), walkable)
+    assert len(path) == manhattan_distance((1, 2), (9, 7))
+    assert_valid_path((1, 2), (9, 7), path, walkable)
+
+
+def test_path_goes_around_a_wall():
+    # A wall down column 5 with a single gap at the bottom of the board.
+    walkable = make_walkable((5, y) for y in range(BOARD_HEIGHT - 1))
+    path = find_path((2, 0), (8, 0), walkable)
+    assert len(path) == 6 + 2 * (BOARD_HEIGHT - 1)
+    assert (5, BOARD_HEIGHT - 1) in path
+    assert_valid_path((2, 0), (8, 0), path, walkable)
+
+
+def test_goal_does_not_need_to_be_walkable():
+    # The goal is usually a character's tile, which is never walkable.
+    walkable = make_walkable([(4, 4)])
+    path = find_path((0, 4), (4, 4), walkable)
+    assert path == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+
+def test_path_to_the_start_is_empty():
+    assert find_path((3, 3), (3, 3), make_walkable()) == []
+
+
+def test_unreachable_goal_gives_none():
+    walkable = make_walkable([(9, 10), (11, 10), (10, 9), (10, 11)])
+    assert find_path((0, 0), (10, 10), walkable) is None
+
+
+def test_search_gives_up_after_max_nodes():
+    walkable = make_walkable()
+    assert find_path((0, 0), (14, 14), walkable, max_nodes=5) is None
+    assert len(find_path((0, 0), (14, 14), walkable, max_nodes=None)) == 28
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_paths_are_shortest_on_random_boards(seed):
+    rng = random.Random(seed)
+    tiles = [(x, y) for y in range(BOARD_HEIGHT) for x in range(BOARD_LENGTH)]
+    walkable = make_walkable(tile for tile in tiles if rng.random() < 0.3)
+    start, goal = rng.sample(tiles, 2)
+    walkable[start[1] * BOARD_LENGTH + start[0]] = 1
+
+    path = find_path(start, goal, walkable)
+    expected = shortest_distance(start, goal, walkable)
+    if expected is None:
+        assert path is None
+    else:
+        assert len(path) == expected
+        assert_valid_path(start, goal, path, walkable)
+        assert find_path(start, goal, walkable) == path
+
+
+def test_distances_on_an_open_board_are_manhattan_distances():
+    distances = find_distances((7, 3), make_walkable())
+    for y in range(BOARD_HEIGHT):
+        for x in range(BOARD_LENGTH):
+            assert distances[y * BOARD_LENGTH + x] == manhattan_distance((x, y), (7, 3))
+
+
+def test_distances_do_not_pass_through_impassable_tiles():
+    walls = [(9, 10), (11, 10), (10, 9), (10, 11)]
+    distances = find_distances((0, 0), make_walkable(walls))
+    assert distances[10 * BOARD_LENGTH + 10] == UNREACHABLE
+    for x, y in walls:
+        assert distances[y * BOARD_LENGTH + x] == UNREACHABLE
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_distances_match_path_lengths_on_random_boards(seed):
+    rng = random.Random(seed)
+    tiles = [(x, y) for y in range(BOARD_HEIGHT) for x in range(BOARD_LENGTH)]
+    passable = make_walkable(tile for tile in tiles if rng.random() < 0.3)
+    origin = rng.choice(tiles)
+    passable[origin[1] * BOARD_LENGTH + origin[0]] = 1
+
+    distances = find_distances(origin, passable)
+    for tile in rng.sample(tiles, 30):
+        if not passable[tile[1] * BOARD_LENGTH + tile[0]]:
+            continue
+        path = find_path(tile, origin, passable)
+        distance = distances[tile[1] * BOARD_LENGTH + tile[0]]
+        assert distance == (UNREACHABLE if path is None else len(path))
@@ -0,0 +1,108 @@
+import itertools
+
+from game_elements.reservations import ReservationTable
+
+
+class Character:
+    def __init__(self, name, x, y):
+        self.name = name
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return self.name
+
+
+def resolve(proposals):
+    """Resolves the proposals on a new table, and returns the moves by name along with the table."""
+    table = ReservationTable()
+    moves = table.resolve_moves(proposals)
+    return [(character.name, target) for character, target in moves], table
+
+
+def apply_moves(characters, moves):
+    """Carries out the moves one at a time, checking that nobody moves onto a tile someone is still standing on."""
+    by_name = {character.name: character for character in characters}
+    occupied = {(character.x, character.y) for character in characters}
+    for name, target in moves:
+        character = by_name[name]
+        assert target not in occupied
+        occupied.remove((character.x, character.y))
+        occupied.add(target)
+        character.x, character.y = target
+    return {character.name: (character.x, character.y) for character in characters}
+
+
+def test_higher_priority_wins_a_contested_tile():
+    a, b = Character('a', 1, 1), Character('b', 3, 1)
+    moves, table = resolve([(a, [(2, 1)]), (b, [(2, 1)])])
+    assert moves == [('a', (2, 1))]
+    assert table.holder((2, 1)) is a
+    assert table.holder((3, 1)) is b
+    assert table.holder((1, 1)) is None
+
+
+def test_loser_falls_back_to_its_next_candidate():
+    a, b = Character('a', 1, 1), Character('b', 3, 1)
+    moves, _ = resolve([(a, [(2, 1)]), (b, [(2, 1), (3, 2)])])
+    assert sorted(moves) == [('a', (2, 1)), ('b', (3, 2))]
+
+
+def test_character_staying_put_keeps_its_tile():
+    # b can't go anywhere, so even though a has the higher priority it can't take b's tile.
+    a, b = Character('a', 1, 1), Character('b', 2, 1)
+    moves, table = resolve([(a, [(2, 1), (1, 2)]), (b, [])])
+    assert moves == [('a', (1, 2))]
+    assert table.holder((2, 1)) is b
+
+
+def test_characters_cannot_swap():
+    a, b = Character('a', 1, 1), Character('b', 2, 1)
+    moves, table = resolve([(a, [(2, 1)]), (b, [(1, 1)])])
+    assert moves == []
+    assert table.holder((1, 1)) is a and table.holder((2, 1)) is b
+
+
+def test_line_follows_its_leader_in_an_order_that_can_be_carried_out():
+    # The leader is given the lowest priority, so the moves have to be reordered to be carried out.
+    characters = [Character('c', 1, 1), Character('b', 2, 1), Character('a', 3, 1)]
+    c, b, a = characters
+    moves, _ = resolve([(c, [(2, 1)]), (b, [(3, 1)]), (a, [(4, 1)])])
+    assert moves == [('a', (4, 1)), ('b', (3, 1)), ('c', (2, 1))]
+    assert apply_moves(characters, moves) == {'a': (4, 1), 'b': (3, 1), 'c': (2, 1)}
+
+
+def test_closed_loop_stays_where_it_is():
+    characters = [Character('a', 1, 1), Character('b', 2, 1), Character('c', 2, 2), Character('d', 1, 2)]
+    a, b, c, d = characters
+    moves, table = resolve([(a, [(2, 1)]), (b, [(2, 2)]), (c, [(1, 2)]), (d, [(1, 1)])])
+    assert moves == []
+    for character in characters:
+        assert table.holder((character.x, character.y)) is character
+
+
+def test_resolution_does_not_depend_on_how_the_characters_are_stored():
+    """The same proposals always give the same moves, whichever objects the characters happen to be."""
+    layout = [('a', 1, 1, [(2, 1), (1, 2)]), ('b', 3, 1, [(2, 1), (3, 2)]), ('c', 2, 2, [(2, 1), (2, 3)]),
+              ('d', 2, 3, [(2, 2)]), ('e', 4, 4, [(3, 4)]), ('f', 3, 4, [(4, 4)])]
+    results = set()
+    for _ in range(5):
+        characters = [Character(name, x, y) for name, x, y, _ in layout]
+        proposals = [(character, candidates) for character, (_, _, _, candidates) in zip(characters, layout)]
+        moves, _ = resolve(proposals)
+        results.add(tuple(moves))
+        apply_moves(characters, moves)
+    assert len(results) == 1
+
+
+def test_no_two_characters_end_on_the_same_tile():
+    tiles = [(x, y) for x in range(1, 4) for y in range(1, 4)]
+    for start in itertools.combinations(tiles, 3):
+        characters = [Character(name, x, y) for name, (x, y) in zip('abc', start)]
+        proposals = [(character, [(character.x + 1, character.y), (character.x, character.y + 1)])
+                     for character in characters]
+        moves, table = resolve(proposals)
+        final = apply_moves(characters, moves)
+        assert len(set(final.values())) == len(characters)
+        for character in characters:
+            assert table.holder((character.x, character.y)) is character
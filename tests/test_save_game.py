@@ -0,0 +1,47 @@
+import pytest
+
+import save_game
+from game_elements.serialization import unpack
+from input_log import state_digest
+from simulation import Simulation
+
+
+def test_saved_game_reencodes_to_the_same_payload(play):
+    simulation = Simulation(seed=1, pregenerate_boards=False)
+    play(simulation, seed=1, turns=300, explore=True)
+    data = save_game.encode(simulation)
+    loaded = save_game.decode(data, pregenerate_boards=False)
+    assert unpack(save_game.encode(loaded)[save_game.HEADER.size:]) == unpack(data[save_game.HEADER.size:])
+    assert state_digest(loaded) == state_digest(simulation)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_loaded_game_plays_on_exactly_like_the_saved_one(play, tmp_path, seed):
+    simulation = Simulation(seed=seed, pregenerate_boards=False)
+    simulation.world.max_resident = 3
+    play(simulation, seed=seed, turns=300, explore=True)
+    path = tmp_path / 'game.save'
+    save_game.save(simulation, path)
+    loaded = save_game.load(path, pregenerate_boards=False)
+    loaded.world.max_resident = 3
+
+    assert loaded.turn == simulation.turn
+    assert play(loaded, seed=seed + 100, turns=300, explore=True) == \
+        play(simulation, seed=seed + 100, turns=300, explore=True)
+    assert state_digest(loaded) == state_digest(simulation)
+
+
+def test_unspent_points_are_kept():
+    simulation = Simulation(seed=2, pregenerate_boards=False)
+    simulation.player.attribute_points, simulation.player.skill_points = 4, 1
+    loaded = save_game.decode(save_game.encode(simulation), pregenerate_boards=False)
+    assert (loaded.player.attribute_points, loaded.player.skill_points) == (4, 1)
+
+
+def test_other_data_is_rejected():
+    data = bytearray(save_game.encode(Simulation(seed=2, pregenerate_boards=False)))
+    with pytest.raises(Exception, match='not a saved game'):
+        save_game.decode(b'RPLY' + bytes(data[4:]), pregenerate_boards=False)
+    data[4] = save_game.VERSION - 1
+    with pytest.raises(Exception, match='unsupported version'):
+        save_game.decode(bytes(data), pregenerate_boards=False)
@@ -0,0 +1,72 @@
+import copy
+
+import pytest
+
+from game_elements.serialization import ENEMIES, ITEMS, STATUSES, board_from_data, board_to_data, enemy_from_data, \
+    enemy_to_data, item_from_data, item_to_data, pack, player_from_data, player_to_data, status_from_data, \
+    status_to_data, unpack
+from game_elements.world_store import EvictedBoard
+from simulation import Simulation
+
+
+def test_pack_round_trips():
+    data = (1, -2.5, 'text', b'\x00\xff', None, True, ((1, 2), (3, 4)), {'a': (1,), 7: {'b': None}})
+    assert unpack(pack(data)) == data
+
+
+@pytest.mark.parametrize('name', sorted(STATUSES))
+def test_status_round_trips(name):
+    status = copy.copy(STATUSES[name])
+    status.turns_left = 1
+    data = status_to_data(status)
+    loaded = status_from_data(data)
+    assert status_to_data(loaded) == data
+    assert loaded.end_of_turn_effect is status.end_of_turn_effect
+
+
+@pytest.mark.parametrize('name', sorted(ITEMS))
+def test_item_round_trips(name):
+    assert item_to_data(item_from_data(name)) == name
+
+
+def test_no_item_round_trips():
+    assert item_from_data(item_to_data(None)) is None
+
+
+@pytest.mark.parametrize('name', sorted(ENEMIES))
+def test_enemy_round_trips(name):
+    enemy = copy.deepcopy(ENEMIES[name])
+    enemy.name = f'{name}_7-3-4'
+    enemy.x, enemy.y = 3, 4
+    enemy.hp[0] -= 1
+    data = enemy_to_data(enemy)
+    loaded = enemy_from_data(data)
+    assert enemy_to_data(loaded) == data
+    assert loaded.name == enemy.name and loaded.template_name == name
+
+
+def test_played_player_round_trips(play):
+    simulation = Simulation(seed=1, pregenerate_boards=False)
+    play(simulation, seed=1, turns=300)
+    player = simulation.player
+    player.attribute_points, player.skill_points = 3, 2
+    data = player_to_data(player)
+    assert player_to_data(player_from_data(data)) == data
+    assert unpack(pack(data)) == data
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_board_round_trips(seed):
+    simulation = Simulation(seed=seed, pregenerate_boards=False)
+    for _ in range(5):
+        simulation.step(('wait',))
+    board = simulation.board
+    data = board_to_data(board)
+    loaded = board_from_data(unpack(pack(data)), rng=simulation.rng, resolve=EvictedBoard)
+    assert board_to_data(loaded) == data
+    assert loaded.grid == board.grid
+    assert loaded.occupancy.walkable == board.occupancy.walkable
+    assert loaded.player_distances() == board.player_distances()
+    for position, enemy in board.enemies.items():
+        assert loaded.occupant_at(*position).name == enemy.name
+    loaded.rebuild_template()
@@ -0,0 +1,90 @@
+from time import perf_counter
+
+import pytest
+
+import timeline
+
+
+@pytest.fixture(autouse=True)
+def empty_timeline(monkeypatch):
+    monkeypatch.setattr(timeline, 'fast_mode', False)
+    monkeypatch.setattr(timeline, 'speed', 1)
+    monkeypatch.setattr(timeline, 'channels', dict())
+
+
+def test_steps_of_a_channel_run_in_order_once_due():
+    ran = list()
+    start = perf_counter()
+    timeline.schedule(lambda: ran.append(1), 1.0)
+    timeline.schedule(lambda: ran.append(2), 1.0)
+    timeline.schedule(lambda: ran.append(3))
+
+    timeline.update(start + 0.5)
+    assert ran == [1]
+    timeline.update(start + 1.5)
+    assert ran == [1, 2]
+    assert timeline.is_busy()
+    timeline.update(start + 2.5)
+    assert ran == [1, 2, 3]
+    assert not timeline.is_busy()
+
+
+def test_channels_run_alongside_each_other():
+    ran = list()
+    start = perf_counter()
+    timeline.wait(10.0, 'slow')
+    timeline.schedule(lambda: ran.append('slow'), channel='slow')
+    timeline.schedule(lambda: ran.append('fast'), channel='fast')
+
+    timeline.update(start + 1.0)
+    assert ran == ['fast']
+    timeline.update(start + 11.0)
+    assert ran == ['fast', 'slow']
+
+
+def test_speed_divides_durations():
+    ran = list()
+    timeline.speed = 4
+    start = perf_counter()
+    timeline.wait(2.0)
+    timeline.schedule(lambda: ran.append(1))
+    timeline.update(start + 0.4)
+    assert ran == []
+    timeline.update(start + 0.6)
+    assert ran == [1]
+
+
+def test_finish_all_runs_everything_including_steps_scheduled_by_steps():
+    ran = list()
+
+    def first():
+        ran.append('first')
+        timeline.schedule(lambda: ran.append('nested'), 5.0, 'other')
+
+    timeline.schedule(first, 5.0)
+    timeline.schedule(lambda: ran.append('second'), 5.0)
+    timeline.finish_all()
+    assert ran == ['first', 'second', 'nested']
+    assert not timeline.is_busy()
+
+
+def test_idle_channel_does_not_run_new_steps_early():
+    """A step scheduled after a channel has been idle still waits out the duration of the step before it."""
+    ran = list()
+    start = perf_counter()
+    timeline.schedule(lambda: ran.append(1), 5.0)
+    timeline.update(start + 0.1)
+    timeline.schedule(lambda: ran.append(2))
+    timeline.update(start + 1.0)
+    assert ran == [1]
+    timeline.update(start + 5.5)
+    assert ran == [1, 2]
+
+
+def test_fast_mode_runs_steps_as_they_are_scheduled():
+    ran = list()
+    timeline.fast_mode = True
+    timeline.schedule(lambda: ran.append(1), 5.0)
+    timeline.schedule(lambda: ran.append(2), 5.0)
+    assert ran == [1, 2]
+    assert not timeline.is_busy()
@@ -0,0 +1,67 @@
+import pytest
+
+from game_elements.board import Board
+from game_elements.serialization import board_to_data, pack, unpack
+from game_elements.world_store import EvictedBoard, WorldStore
+from input_log import state_digest
+from simulation import Simulation
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_evicting_boards_does_not_change_the_game(play, monkeypatch, seed):
+    unbounded = Simulation(seed=seed, pregenerate_boards=False)
+    unbounded.world.max_resident = 10 ** 6
+    bounded = Simulation(seed=seed, pregenerate_boards=False)
+    bounded.world.max_resident = 2
+    loads = list()
+    load = WorldStore.load
+    monkeypatch.setattr(WorldStore, 'load', lambda world, board_id: loads.append(board_id) or load(world, board_id))
+
+    played = play(unbounded, seed=seed, turns=600, explore=True)
+    assert not loads
+    assert play(bounded, seed=seed, turns=600, explore=True) == played
+    assert state_digest(unbounded) == state_digest(bounded)
+    assert len(bounded.world.boards) <= 2
+    assert bounded.world.evicted and loads
+    assert bounded.world.report()['evicted'] == len(bounded.world.evicted)
+
+
+def test_evicted_board_loads_back_as_it_was(play):
+    simulation = Simulation(seed=4, pregenerate_boards=False)
+    play(simulation, seed=4, turns=300, explore=True)
+    world, board = simulation.world, simulation.board
+    # Move on to one of the boards next to the player's, so that the player's board can be evicted.
+    door_coord = sorted(board.doors)[0]
+    neighbour = world.board_behind_door(board, door_coord)
+    world.visit(neighbour, simulation.turn + 1)
+    data = board_to_data(board)
+
+    world.evict(board.board_id)
+    assert board.board_id not in world.boards
+    assert unpack(world.evicted[board.board_id]) == data
+    back_door, = [coord for coord, door in neighbour.doors.items() if isinstance(door['board'], EvictedBoard)]
+    assert neighbour.doors[back_door]['board'].board_id == board.board_id
+
+    loaded = world.board_behind_door(neighbour, back_door)
+    assert board_to_data(loaded) == data
+    assert board.board_id not in world.evicted
+    assert neighbour.doors[back_door]['board'] is loaded
+    assert loaded.doors[door_coord]['board'] is neighbour
+
+
+def test_saved_store_restores_the_same_boards(play):
+    simulation = Simulation(seed=5, pregenerate_boards=False)
+    simulation.world.max_resident = 2
+    play(simulation, seed=5, turns=600, explore=True)
+    data = simulation.world.to_data()
+
+    restored = WorldStore(simulation.rng, max_resident=2)
+    restored.restore(unpack(pack(data)))
+    assert restored.to_data() == data
+    for board in restored.boards.values():
+        for door in board.doors.values():
+            target = door['board']
+            if isinstance(target, EvictedBoard):
+                assert target.board_id in restored.evicted
+            elif isinstance(target, Board):
+                assert restored.boards[target.board_id] is target
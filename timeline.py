@@ -0,0 +1,82 @@
+from collections import deque
+from time import perf_counter
+
+from config import FAST_ANIMATIONS
+
+"""
+Module holding the timeline that every timed effect in the game is scheduled on, e.g. console lines appearing one after
+another or an enemy fading out on death, instead of sleeping while the rest of the game waits. The main loop calls
+update() once per frame, which runs every step that is due, so the window keeps responding to input in the meantime.
+
+Steps are scheduled on named channels. The steps of each channel run one after another, in the order they were
+scheduled, while separate channels run alongside each other. Whenever the player gives a new input, finish_all() is
+called first so that everything from the last turn is completed instantly, and the game moves at the speed of the input.
+"""
+
+# If True, every step runs as soon as it's scheduled, i.e. all animations are skipped.
+fast_mode = FAST_ANIMATIONS
+# Every step's duration is divided by this, e.g. so that a replay can play out at several times the normal speed.
+speed = 1
+# Each channel is a dict holding a deque of (callback, duration) steps, and the time at which the next one is due.
+channels = dict()
+# Set while finish_all() is running, so that steps scheduled by the steps it runs are left for it to pick up.
+finishing = False
+
+
+def schedule(callback, duration=0, channel='default'):
+    """
+    Adds a step to the end of a channel.
+    :param callback: Function called with no arguments when the step is run. Can be None for a step that only waits.
+    :param duration: The number of seconds to wait after this step is run before the next step in the channel can run.
+    :param channel: String, the name of the channel.
+    """
+    if channel not in channels:
+        channels[channel] = {'steps': deque(), 'next_step_time': perf_counter()}
+    elif not channels[channel]['steps']:
+        # The channel has been idle, so the new step is due either now or once the last step's duration is up.
+        channels[channel]['next_step_time'] = max(channels[channel]['next_step_time'], perf_counter())
+    channels[channel]['steps'].append((callback, duration))
+    if fast_mode and not finishing:
+        finish_all()
+
+
+def wait(duration, channel='default'):
+    """Adds a pause to the end of a channel."""
+    schedule(None, duration, channel)
+
+
+def update(now=None):
+    """Runs every step which is due. Called once per frame by the main loop."""
+    now = now if now is not None else perf_counter()
+    for channel in list(channels.values()):
+        while channel['steps'] and channel['next_step_time'] <= now:
+            callback, duration = channel['steps'].popleft()
+            channel['next_step_time'] += duration / speed
+            if callback is not None:
+                callback()
+
+
+def finish_all():
+    """
+    Runs every remaining step straight away, ignoring their durations. Steps can schedule new steps while they run,
+    which are run as well.
+    """
+    global finishing
+    finishing = True
+    try:
+        while is_busy():
+            for channel in list(channels.values()):
+                while channel['steps']:
+                    callback, _ = channel['steps'].popleft()
+                    if callback is not None:
+                        callback()
+    finally:
+        finishing = False
+    now = perf_counter()
+    for channel in channels.values():
+        channel['next_step_time'] = now
+
+
+def is_busy():
+    """Returns True if there are any steps left to run."""
+    return any(channel['steps'] for channel in channels.values())
@@ -1,6 +1,8 @@
 import copy
-from heapq import heapify, heappush, heappop
+from collections import deque
+from heapq import heappush, heappop
 
+import profiler
 from config import TOP_LEFT_X, TOP_LEFT_Y, TILE_SIZE
 from game_elements.element_config_values import BOARD_HEIGHT, BOARD_LENGTH
 
@@ -8,6 +10,9 @@ from game_elements.element_config_values import BOARD_HEIGHT, BOARD_LENGTH
 Module for storing little functions that could be useful throughout the project.
 """
 
+# The distance given by find_distances() to tiles that can't reach the origin at all.
+UNREACHABLE = BOARD_LENGTH * BOARD_HEIGHT
+
 def manhattan_distance(point_a, point_b):
     return abs(point_a[0] - point_b[0]) + abs(point_a[1] - point_b[1])
 
@@ -66,76 +71,115 @@ def get_knockback(self_x, self_y, target, knockback=1):
 
 def reconstruct_path(came_from, current):
     """
-    Called by find_best_step() below when an optimal path has been found, to retrace the steps taken to get to that path
-    and return the first step along that path.
-    :param came_from: A dict that will be in the format
-                        {(x, y): coordinate immediately proceeding (x, y)}
-                      for each step which was explored throughout find_best_step()
-    :param current: The current step being looked at. Will be initialized the position of goal, and steps will be traced
-                    backwards along came_from.
-    :return: The second-last element of the 'path'. This list will hold every step going backwards from the goal, so
-             that path[0] is the goal and path[-1] is the start, hence we return path[-2] to be the next step.
+    Called by find_path() below when an optimal path has been found, to retrace the steps taken to get to that path.
+    :param came_from: A list with an entry for every tile, holding the grid index of the tile immediately proceeding
+                      that tile on the path, or -1 for tiles that weren't reached (and for the start).
+    :param current: The grid index of the goal, from which steps will be traced backwards along came_from.
+    :return: A list of the (x, y) coordinates of every step from the one after the start up to and including the goal.
     """
-    path = [current]
-    while current in set(came_from.keys()):
-        current_temp = came_from[current]
-        del came_from[current]
-        current = current_temp
-        path.append(current)
-
-    return path[-2]
+    path = []
+    while came_from[current] != -1:
+        path.append((current % BOARD_LENGTH, current // BOARD_LENGTH))
+        current = came_from[current]
+    path.reverse()
+    return path
 
 
-def find_best_step(start, goal, open_tiles):
+@profiler.timed('pathfinding')
+def find_path(start, goal, walkable, max_nodes=None):
     """
-    An implementation of the A* search algorithm to find the best next step for a character at start trying to get to
-    goal. Additional details will be provided in in-line comments.
+    An implementation of the A* search algorithm on the board grid, to find the shortest path for a character at start
+    trying to get to goal. Additional details will be provided in in-line comments.
     For more info check out https://en.wikipedia.org/wiki/A*_search_algorithm
     :param start: (x,y)-coordinates of the character's starting position
-    :param goal: (x,y)-coordinates of the goal position
-    :param open_tiles: A list of the coordinates of every open tile on the board
-    :return: (x,y) coordinates of the best next step, or None, None if no path was found.
-    """
-    # We add 'goal' to the list of open tiles because this algorithm will terminate when it steps to goal, so it needs
-    # to be available as an option.
-    open_tiles.append(goal)
-    # g_scores will be the manhattan_distance from the start to each tile. Initialize every value to 1000
-    g_scores = {tile: 1000 for tile in open_tiles}
-    g_scores[start] = 0
-    # f_scores will be, for each tile, the g_score of that tile + manhattan_distance(tile, goal), i.e. an estimate
-    # of the number of steps to reach the goal going through this tile.
-    f_scores = {tile: 1000 for tile in open_tiles}
-    f_scores[start] = manhattan_distance(start, goal)
-    # came_from will be a dict where each key is a tile and the value is the tile immediately proceeding it on our path
-    came_from = {}
-    # open_set will be a min-heap of each tile, sorted by their f_scores. Stored as a tuple of (f_score, (x, y))
-    open_set = []
-    heapify(open_set)
-    heappush(open_set, (f_scores[start], start))
+    :param goal: (x,y)-coordinates of the goal position. It doesn't have to be walkable itself, since it will usually
+                 be the tile another character is standing on.
+    :param walkable: A flat sequence with an entry for every tile of the board, indexed by y * BOARD_LENGTH + x, which
+                     is truthy for each tile a character can move onto, e.g. Board.occupancy.walkable.
+    :param max_nodes: The maximum number of tiles to expand before giving up, or None to search the whole board. Stops
+                      an unreachable goal from costing a full search of the board every time.
+    :return: A list of the (x,y) coordinates of every step along the path, ending with goal, or None if no path was
+             found.
+    """
+    size = BOARD_LENGTH * BOARD_HEIGHT
+    start_index = start[1] * BOARD_LENGTH + start[0]
+    goal_index = goal[1] * BOARD_LENGTH + goal[0]
+    goal_x, goal_y = goal
+    if start_index == goal_index:
+        return []
+    # g_scores will be the length of the shortest path found so far from the start to each tile.
+    g_scores = [size] * size
+    g_scores[start_index] = 0
+    # came_from will hold, for each tile, the tile immediately proceeding it on our path.
+    came_from = [-1] * size
+    # closed will mark each tile that has already been expanded, so that it is never expanded twice.
+    closed = bytearray(size)
+    # open_set will be a min-heap of tiles to expand, stored as tuples of (f_score, h_score, index). The f_score is the
+    # g_score + manhattan distance to the goal, i.e. an estimate of the number of steps to reach the goal going through
+    # this tile. Ties are broken in favour of the tile closest to the goal, and then by index so the result is always
+    # the same for the same board.
+    open_set = [(manhattan_distance(start, goal), manhattan_distance(start, goal), start_index)]
+    expanded = 0
     while open_set:
-        # current will always be set to the tile in open_set with the smallest f_score
-        current = open_set[0][1]
-        if current == goal:
-            # If we reach here, then we're done
-            return reconstruct_path(came_from, current)
-
-        heappop(open_set)
-        # Build a list of every neighbour of current
-        adjacent_tiles = ([(current[0] + i, current[1]) for i in [-1, 1]] + [(current[0], current[1] + i)
-                                                                             for i in [-1, 1]])
-        adj_open_tiles = [tile for tile in adjacent_tiles if tile in set(open_tiles)]
-        for neighbour in adj_open_tiles:
-            temp_g_score = g_scores[current] + manhattan_distance(current, neighbour)
+        current = heappop(open_set)[2]
+        if closed[current]:
+            # A stale entry for a tile which was pushed again after finding a shorter path to it.
+            continue
+        closed[current] = 1
+        expanded += 1
+        if max_nodes is not None and expanded > max_nodes:
+            return None
+        x, y = current % BOARD_LENGTH, current // BOARD_LENGTH
+        temp_g_score = g_scores[current] + 1
+        for neighbour_x, neighbour_y in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if not (0 <= neighbour_x < BOARD_LENGTH and 0 <= neighbour_y < BOARD_HEIGHT):
+                continue
+            neighbour = neighbour_y * BOARD_LENGTH + neighbour_x
+            if neighbour == goal_index:
+                # Since every step costs the same and manhattan distance never overestimates, the first time the goal
+                # is reached from an expanded tile is along a shortest path, so we're done.
+                came_from[neighbour] = current
+                return reconstruct_path(came_from, neighbour)
+            if closed[neighbour] or not walkable[neighbour]:
+                continue
             # If temp_g_score is lower than what we have stored, then we've found a shorter path through neighbour
             # than we had previously.
             if temp_g_score < g_scores[neighbour]:
                 came_from[neighbour] = current
                 g_scores[neighbour] = temp_g_score
-                f_scores[neighbour] = g_scores[neighbour] + manhattan_distance(neighbour, goal)
-                if (neighbour, f_scores[neighbour]) not in open_set:
-                    heappush(open_set, (f_scores[neighbour], neighbour))
+                h_score = abs(neighbour_x - goal_x) + abs(neighbour_y - goal_y)
+                heappush(open_set, (temp_g_score + h_score, h_score, neighbour))
 
-    return None, None
+    return None
+
+
+@profiler.timed('pathfinding')
+def find_distances(origin, passable):
+    """
+    A breadth-first search outwards from origin, to find the number of steps needed to reach origin from every tile on
+    the board. Since this covers every tile at once, any number of characters heading to the same place can share it.
+    :param origin: (x,y)-coordinates of the tile to measure distances to.
+    :param passable: A flat sequence with an entry for every tile of the board, indexed by y * BOARD_LENGTH + x, which
+                     is truthy for each tile that can be moved through, e.g. Board.occupancy.passable.
+    :return: A list with an entry for every tile of the board, indexed the same way, holding the number of steps from
+             that tile to origin, or UNREACHABLE if there is no way to get there.
+    """
+    distances = [UNREACHABLE] * (BOARD_LENGTH * BOARD_HEIGHT)
+    origin_index = origin[1] * BOARD_LENGTH + origin[0]
+    distances[origin_index] = 0
+    queue = deque([origin_index])
+    while queue:
+        current = queue.popleft()
+        x, y = current % BOARD_LENGTH, current // BOARD_LENGTH
+        distance = distances[current] + 1
+        for neighbour_x, neighbour_y in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if not (0 <= neighbour_x < BOARD_LENGTH and 0 <= neighbour_y < BOARD_HEIGHT):
+                continue
+            neighbour = neighbour_y * BOARD_LENGTH + neighbour_x
+            if distances[neighbour] == UNREACHABLE and passable[neighbour]:
+                distances[neighbour] = distance
+                queue.append(neighbour)
+    return distances
 
 
 def find_tiles_in_radius(center_x, center_y, radius, **kwargs):